@@ -0,0 +1,107 @@
+"""
+Memory benchmark for history export: streaming chunked writes versus collecting every page first.
+
+Serves synthetic trade-history pages from memory (no network) and exports them twice, each in a
+fresh interpreter so peak RSS is measured independently:
+
+- streaming: utils.history_export.export_history, which flushes columns every --chunk-rows rows.
+- in-memory: every page's items collected into one list, then converted and written in one go.
+
+Reports rows per second, size on disk and peak RSS above the interpreter's baseline.
+
+Usage (from the futures python client directory):
+    python benchmarks/history_export.py
+    python benchmarks/history_export.py --rows 5000000 --format parquet --compression zstd
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from utils.history_export import TRADE_COLUMNS, export_history, iter_history_pages  # noqa: E402
+
+START_MS = 1_700_000_000_000
+
+
+def make_fetch(rows: int) -> Any:
+    """
+    Return a get_trade_history stand-in serving `rows` trades, one per millisecond, newest first.
+    """
+    def fetch(page_size: Optional[int] = None, timestamp: Optional[int] = None) -> Dict[str, Any]:
+        newest = START_MS + rows if timestamp is None else timestamp
+        oldest = max(START_MS, newest - (page_size or 100))
+        items = [{
+            'id': f"T{t}", 'timestamp': t, 'datetime': '2023-11-14T22:13:20.000Z', 'symbol': 'BTCUSDT',
+            'order': f"O{t // 3}", 'type': 'limit', 'side': 'buy' if t % 2 else 'sell', 'takerOrMaker': 'taker',
+            'price': 60000.0 + t % 500, 'amount': 0.001 * (1 + t % 7), 'cost': 60.0, 'fee': {'cost': 0.03, 'currency': 'USDT'},
+            'info': {}
+        } for t in range(newest - 1, oldest - 1, -1)]
+        return {'statusDescription': 'Success', 'data': {'items': items, 'nextTimestamp': oldest}, 'statusCode': 200}
+    return fetch
+
+
+def export_in_memory(pages: Iterator[List[Dict[str, Any]]], path: str, compression: Optional[str]) -> int:
+    """
+    The collect-then-write approach the streaming exporter replaces (npz, one part).
+    """
+    items = [item for page in pages for item in page]
+    export_history(iter([items]), path, TRADE_COLUMNS, 'npz', compression, chunk_rows=max(1, len(items)))
+    return len(items)
+
+
+def run(mode: str, args: argparse.Namespace) -> Dict[str, Any]:
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    directory = tempfile.mkdtemp(prefix='zebpay-export-')
+    path = os.path.join(directory, 'trades.parquet' if args.format == 'parquet' else 'trades')
+    pages = iter_history_pages(make_fetch(args.rows), args.page_size)
+    try:
+        started = time.perf_counter()
+        if mode == 'streaming':
+            rows = export_history(pages, path, TRADE_COLUMNS, args.format, args.compression, args.chunk_rows)['rows']
+        else:
+            rows = export_in_memory(pages, path, args.compression)
+        elapsed = time.perf_counter() - started
+        size = sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(directory) for name in names)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {'rows': rows, 'seconds': elapsed, 'bytes': size, 'peakMiB': (peak - baseline) / 1024}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Compare streaming and in-memory history export.')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Trades in the synthetic history')
+    parser.add_argument('--page-size', type=int, default=1000, help='Trades per page')
+    parser.add_argument('--chunk-rows', type=int, default=50_000, help='Rows per chunk for the streaming export')
+    parser.add_argument('--format', choices=('npz', 'parquet'), default='npz', help='Streaming export format')
+    parser.add_argument('--compression', default='zstd', help="Codec, or 'none'")
+    parser.add_argument('--mode', choices=('streaming', 'in-memory'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.compression == 'none':
+        args.compression = None
+
+    if args.mode:
+        print(json.dumps(run(args.mode, args)))
+        return 0
+
+    print(f"{args.rows} trades in pages of {args.page_size}, {args.format}, compression {args.compression}")
+    for mode in ('streaming', 'in-memory'):
+        completed = subprocess.run([sys.executable, os.path.abspath(__file__), '--mode', mode, *(argv or sys.argv[1:])],
+                                   capture_output=True, text=True, check=True)
+        result = json.loads(completed.stdout)
+        print(f"  {mode:<10} {result['rows'] / result['seconds']:>10,.0f} rows/s  "
+              f"{result['bytes'] / 2 ** 20:>7.1f} MiB on disk  {result['peakMiB']:>8.1f} MiB peak RSS")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
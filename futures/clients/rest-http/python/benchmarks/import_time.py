@@ -0,0 +1,94 @@
+"""
+Startup benchmark for the futures client package.
+
+Runs `python -X importtime` in fresh interpreters and reports the median cost of a bare
+`import client` and of importing and constructing a FuturesApiClient. It also checks that the
+bare import stays lazy (no `requests`, no `utils.types`), and enforces a startup budget.
+
+Usage (from the futures python client directory):
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 20 --budget-ms 30 --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Modules a bare `import client` must not load; they are imported on first use instead.
+LAZY_MODULES = ('requests', 'utils.types', 'client.client')
+
+STATEMENTS = {
+    'import client': 'import client',
+    'construct client': "import client; client.FuturesApiClient(api_key='k', secret_key='s')",
+}
+
+
+def measure(statement: str) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Run `statement` in a fresh interpreter under -X importtime.
+
+    Returns:
+        Tuple of (cumulative microseconds per top-level import, modules loaded afterwards).
+    """
+    probe = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', probe],
+        cwd=PACKAGE_DIR, capture_output=True, text=True, check=True
+    )
+    cumulative: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        # Nested imports are indented past the single separator space; keep only the roots,
+        # whose cumulative times add up to the whole import.
+        if not name[1:].startswith(' '):
+            cumulative[name.strip()] = int(cumulative_us)
+    return cumulative, completed.stdout.split()
+
+
+def total_ms(cumulative: Dict[str, int], startup: Dict[str, int]) -> float:
+    """
+    Milliseconds spent importing modules that a bare interpreter (`startup`) does not.
+    """
+    return sum(us for name, us in cumulative.items() if name not in startup) / 1000
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure futures client import time.')
+    parser.add_argument('--runs', type=int, default=10, help='Fresh interpreters per statement')
+    parser.add_argument('--budget-ms', type=float, default=30.0, help='Maximum median time for a bare import')
+    parser.add_argument('--top', type=int, default=10, help='Slowest imports to list per statement')
+    args = parser.parse_args(argv)
+
+    startup, _ = measure('pass')
+    failed = False
+    for label, statement in STATEMENTS.items():
+        samples = [measure(statement) for _ in range(args.runs)]
+        totals = [total_ms(cumulative, startup) for cumulative, _ in samples]
+        print(f"\n{label}: median {statistics.median(totals):.1f} ms "
+              f"(min {min(totals):.1f}, max {max(totals):.1f}, {args.runs} runs)")
+        slowest = sorted(((name, us) for name, us in samples[-1][0].items() if name not in startup),
+                         key=lambda item: item[1], reverse=True)[:args.top]
+        for name, us in slowest:
+            print(f"  {us / 1000:>8.1f} ms  {name}")
+
+        if label == 'import client':
+            loaded = set(samples[-1][1])
+            eager = [module for module in LAZY_MODULES if module in loaded]
+            if eager:
+                print(f"FAIL: bare import loaded {', '.join(eager)}")
+                failed = True
+            if statistics.median(totals) > args.budget_ms:
+                print(f"FAIL: median {statistics.median(totals):.1f} ms is over the {args.budget_ms:.1f} ms budget")
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,293 @@
+"""
+Load-test benchmark for FuturesApiClient and SpotClient against the local stub server.
+
+Starts benchmarks/stub_server.py in a separate process, then drives each client through a
+scenario that touches every endpoint, at increasing concurrency. For each level it reports
+requests/sec, p50/p99 latency, client CPU time per request and peak memory.
+
+Usage (from the futures python client directory):
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --concurrency 1,8,32 --requests 5000 --latency-ms 1
+    python benchmarks/load_test.py --json results.json
+    python benchmarks/load_test.py --baseline results.json --tolerance 0.15   # exit 1 on regression
+    python benchmarks/load_test.py --clients futures --latency-ms 2 --stall-rate 0.02 --stall-ms 50 --hedge 95
+"""
+
+import argparse
+import itertools
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# client/ and utils/ are top-level packages of the futures python directory.
+sys.path[:0] = [
+    os.path.join(HERE, '..'),
+    os.path.join(HERE, '..', '..', '..', '..', '..', 'spot', 'clients', 'rest-http', 'python'),
+]
+from client import FuturesApiClient  # noqa: E402
+from utils.hedging import HedgingPolicy  # noqa: E402
+from zebpay_core.rate_limiter import RateLimiter  # noqa: E402
+from zebpay_spot_client import RateLimiter as SpotRateLimiter, SpotClient  # noqa: E402
+
+# Metrics compared against a baseline, and whether larger values are better.
+COMPARED_METRICS = {'requestsPerSecond': True, 'p50Ms': False, 'p99Ms': False, 'cpuUsPerRequest': False}
+
+
+def futures_scenario(client: FuturesApiClient) -> List[Tuple[str, Callable[[], Any]]]:
+    """
+    One call per futures endpoint and method.
+    """
+    order = {'symbol': 'BTCUSDT', 'amount': 0.01, 'side': 'BUY', 'type': 'LIMIT', 'marginAsset': 'USDT',
+             'price': 60000}
+    return [
+        ('fetch_markets', client.fetch_markets),
+        ('get_order_book', lambda: client.get_order_book('BTCUSDT')),
+        ('get_ticker_24hr', lambda: client.get_ticker_24hr('BTCUSDT')),
+        ('get_market_info', client.get_market_info),
+        ('get_agg_trade', lambda: client.get_agg_trade('BTCUSDT')),
+        ('get_klines', lambda: client.get_klines({'symbol': 'BTCUSDT', 'interval': '1m', 'limit': 500})),
+        ('get_system_time', client.get_system_time),
+        ('get_system_status', client.get_system_status),
+        ('get_trade_fee', lambda: client.get_trade_fee('BTCUSDT')),
+        ('get_trade_fees', client.get_trade_fees),
+        ('get_exchange_info', client.get_exchange_info),
+        ('get_pairs', client.get_pairs),
+        ('get_balance', client.get_balance),
+        ('create_order', lambda: client.create_order(dict(order))),
+        ('edit_order', lambda: client.edit_order({'clientOrderId': 'abc-370-zeb', 'price': 60010})),
+        ('cancel_order', lambda: client.cancel_order({'clientOrderId': 'abc-370-zeb', 'symbol': 'BTCUSDT'})),
+        ('cancel_all_orders', client.cancel_all_orders),
+        ('get_order', lambda: client.get_order('abc-370-zeb')),
+        ('add_tpsl_order', lambda: client.add_tpsl_order({'positionId': 'BTCUSDT-pos', 'amount': 0.01, 'side': 'SELL',
+                                                          'stopLossPrice': 59000})),
+        ('add_margin', lambda: client.add_margin({'positionId': 'BTCUSDT-pos', 'amount': 10})),
+        ('reduce_margin', lambda: client.reduce_margin({'positionId': 'BTCUSDT-pos', 'amount': 10})),
+        ('close_position', lambda: client.close_position({'positionId': 'BTCUSDT-pos', 'symbol': 'BTCUSDT'})),
+        ('get_open_orders', lambda: client.get_open_orders('BTCUSDT')),
+        ('get_positions', lambda: client.get_positions(status='OPEN')),
+        ('get_user_leverage', lambda: client.get_user_leverage('BTCUSDT')),
+        ('get_user_leverages', client.get_user_leverages),
+        ('update_leverage', lambda: client.update_leverage({'symbol': 'BTCUSDT', 'leverage': 20})),
+        ('get_order_history', lambda: client.get_order_history(page_size=50)),
+        ('get_trade_history', lambda: client.get_trade_history(page_size=50)),
+        ('get_transaction_history', lambda: client.get_transaction_history(page_size=50)),
+    ]
+
+
+def spot_scenario(client: SpotClient) -> List[Tuple[str, Callable[[], Any]]]:
+    """
+    One call per SpotClient endpoint and method.
+    """
+    return [
+        ('get_all_tickers', client.get_all_tickers),
+        ('get_kline', lambda: client.get_kline('BTC-INR', '1m', 1756166400, 1756252800)),
+        ('get_orderbook', lambda: client.get_orderbook('BTC-INR')),
+        ('get_orderbook_ticker', lambda: client.get_orderbook_ticker('BTC-INR')),
+        ('get_ticker', lambda: client.get_ticker('BTC-INR')),
+        ('get_recent_trades', lambda: client.get_recent_trades('BTC-INR')),
+        ('get_account_balance', client.get_account_balance),
+        ('get_coin_settings', client.get_coin_settings),
+        ('get_exchange_fee', lambda: client.get_exchange_fee('BTC-INR', 'BUY')),
+        ('get_orders', lambda: client.get_orders('BTC-INR')),
+        ('place_order', lambda: client.place_order('BTC-INR', 'BUY', 'LIMIT', price='5000000', quantity='0.001')),
+        ('cancel_order', lambda: client.cancel_order('1234567')),
+        ('cancel_all_orders', lambda: client.cancel_all_orders('BTC-INR')),
+        ('get_order_details', lambda: client.get_order_details('1234567')),
+        ('get_order_fills', lambda: client.get_order_fills('1234567')),
+        ('get_trading_pairs', client.get_trading_pairs),
+        ('get_service_status', client.get_service_status),
+        ('get_server_time', client.get_server_time),
+    ]
+
+
+def make_clients(base_url: str, pool_size: int, client_limits: bool = False,
+                 hedging: Optional[HedgingPolicy] = None) -> Dict[str, Tuple[Any, Any]]:
+    """
+    Build each client with a pool large enough that no connection is discarded at the highest
+    concurrency level, and an effectively unlimited rate limiter unless `client_limits` is set.
+    """
+    futures = FuturesApiClient(api_key='bench-key', secret_key='bench-secret', base_url=base_url,
+                               rate_limiter=None if client_limits else RateLimiter(max_requests=10 ** 9, period=1),
+                               hedging=hedging)
+    if hedging:
+        # A hedged request can hold two connections at once.
+        pool_size *= 2
+    spot = SpotClient('bench-key', 'bench-secret', base_url=base_url,
+                      rate_limiter=None if client_limits else SpotRateLimiter(max_requests=10 ** 9, period=1))
+    for session in (futures.http_session, spot.session):
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+    return {'futures': (futures, futures_scenario), 'spot': (spot, spot_scenario)}
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(len(sorted_values) * percent / 100.0)) - 1))
+    return sorted_values[index]
+
+
+def run_level(calls: List[Tuple[str, Callable[[], Any]]], concurrency: int, total: int,
+              trace_memory: bool) -> Dict[str, Any]:
+    """
+    Issue `total` calls from `concurrency` threads, cycling through the scenario.
+    """
+    counter = itertools.count()
+    lock = threading.Lock()
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+
+    def worker() -> None:
+        local: List[float] = []
+        while True:
+            n = next(counter)
+            if n >= total:
+                break
+            name, call = calls[n % len(calls)]
+            started = time.perf_counter()
+            try:
+                call()
+            except Exception as e:
+                with lock:
+                    key = f"{name}: {type(e).__name__}"
+                    errors[key] = errors.get(key, 0) + 1
+            local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+
+    if trace_memory:
+        tracemalloc.start()
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(concurrency):
+            executor.submit(worker)
+    wall = time.perf_counter() - wall_started
+    cpu = time.process_time() - cpu_started
+    peak_traced = None
+    if trace_memory:
+        peak_traced = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': errors,
+        'requestsPerSecond': len(latencies) / wall if wall else 0.0,
+        'p50Ms': _percentile(latencies, 50) * 1000,
+        'p99Ms': _percentile(latencies, 99) * 1000,
+        'cpuUsPerRequest': cpu / len(latencies) * 1_000_000 if latencies else 0.0,
+        # ru_maxrss is reported in kilobytes on Linux.
+        'peakRssMb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'peakTracedMb': peak_traced / (1024 * 1024) if peak_traced is not None else None,
+    }
+
+
+def start_server(script: str, *args: str) -> Tuple[subprocess.Popen, str]:
+    """
+    Run a benchmark server script in a subprocess and return it with its base URL.
+    """
+    process = subprocess.Popen([sys.executable, os.path.join(HERE, script), *args], stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline().strip()
+    if not line.startswith('listening on '):
+        process.kill()
+        raise RuntimeError(f"{script} failed to start: {line!r}")
+    return process, line[len('listening on '):]
+
+
+def compare(results: Dict[str, List[Dict[str, Any]]], baseline: Dict[str, List[Dict[str, Any]]],
+            tolerance: float) -> List[str]:
+    """
+    Return a description of every metric that regressed by more than `tolerance` (a fraction).
+    """
+    regressions = []
+    for client_name, levels in results.items():
+        previous = {level['concurrency']: level for level in baseline.get(client_name, [])}
+        for level in levels:
+            old = previous.get(level['concurrency'])
+            if not old:
+                continue
+            for metric, higher_is_better in COMPARED_METRICS.items():
+                before, after = old.get(metric), level[metric]
+                if not before:
+                    continue
+                change = (after - before) / before
+                if (-change if higher_is_better else change) > tolerance:
+                    regressions.append(
+                        f"{client_name} c={level['concurrency']} {metric}: {before:.2f} -> {after:.2f} ({change:+.1%})"
+                    )
+    return regressions
+
+
+def print_table(client_name: str, levels: List[Dict[str, Any]]) -> None:
+    print(f"\n{client_name}")
+    print(f"{'conc':>5} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'cpu us/req':>11} {'rss MB':>8} {'errors':>7}")
+    for level in levels:
+        print(f"{level['concurrency']:>5} {level['requestsPerSecond']:>9.0f} {level['p50Ms']:>8.2f} "
+              f"{level['p99Ms']:>8.2f} {level['cpuUsPerRequest']:>11.0f} {level['peakRssMb']:>8.1f} "
+              f"{sum(level['errors'].values()):>7}")
+        for error, count in level['errors'].items():
+            print(f"      {count} x {error}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Load-test the Zebpay clients against a local stub server.')
+    parser.add_argument('--concurrency', default='1,4,16,64', help='Comma-separated thread counts')
+    parser.add_argument('--requests', type=int, default=2000, help='Requests per client per concurrency level')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Simulated server time per request')
+    parser.add_argument('--stall-rate', type=float, default=0.0, help='Probability the stub stalls a response')
+    parser.add_argument('--stall-ms', type=float, default=50.0, help='Extra delay of a stalled response')
+    parser.add_argument('--hedge', type=float, metavar='PERCENTILE',
+                        help='Hedge futures market-data GETs at this latency percentile')
+    parser.add_argument('--clients', default='futures,spot', help='Comma-separated subset of futures,spot')
+    parser.add_argument('--warmup', type=int, default=200, help='Untimed requests per client before measuring')
+    parser.add_argument('--tracemalloc', action='store_true', help='Also report peak Python allocations (slower)')
+    parser.add_argument('--json', help='Write results to this file')
+    parser.add_argument('--baseline', help='Compare against results from a previous --json run')
+    parser.add_argument('--tolerance', type=float, default=0.15, help='Allowed regression vs baseline (fraction)')
+    args = parser.parse_args(argv)
+
+    levels = [int(level) for level in args.concurrency.split(',')]
+    process, base_url = start_server('stub_server.py', '--latency-ms', str(args.latency_ms),
+                                     '--stall-rate', str(args.stall_rate), '--stall-ms', str(args.stall_ms))
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    try:
+        hedging = HedgingPolicy(percentile=args.hedge) if args.hedge else None
+        clients = make_clients(base_url, max(levels), hedging=hedging)
+        for client_name in args.clients.split(','):
+            client, scenario = clients[client_name]
+            calls = scenario(client)
+            run_level(calls, 1, args.warmup, False)
+            results[client_name] = [run_level(calls, level, args.requests, args.tracemalloc) for level in levels]
+            print_table(f"{client_name} ({len(calls)} endpoints, {args.requests} requests per level)",
+                        results[client_name])
+    finally:
+        process.terminate()
+        process.wait()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,586 @@
+"""
+Local mock Zebpay exchange for order-path load testing.
+
+Implements the futures and spot order endpoints on top of an in-memory price-time-priority
+matching engine, so create/cancel/edit traffic gets realistic responses: resting orders,
+partial and full fills, positions and order history. A house market maker keeps a static
+ladder of liquidity around each symbol's mid price. Latency, random 429s and per-key rate
+limits can be injected. Every other path falls back to the stub server's canned responses.
+
+Usage:
+    python benchmarks/mock_exchange.py --port 8080 --latency-ms 2 --jitter-ms 1 \
+        --error-rate 0.01 --rate-limit 180/60
+"""
+
+import argparse
+import heapq
+import itertools
+import json
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import stub_server
+
+# Default mid prices (futures symbols in quote USDT, spot symbols in INR).
+DEFAULT_MIDS = {'BTCUSDT': 60000.0, 'ETHUSDT': 2500.0, 'BTC-INR': 5000000.0, 'ETH-INR': 250000.0}
+
+HOUSE = 'house'
+
+FUTURES_STATUS = {'OPEN': 'open', 'PARTIALLY_FILLED': 'open', 'FILLED': 'closed', 'CANCELED': 'canceled',
+                  'REJECTED': 'rejected'}
+SPOT_STATUS = {'OPEN': 'OPEN', 'PARTIALLY_FILLED': 'PARTIALLY_FILLED', 'FILLED': 'FILLED', 'CANCELED': 'CANCELLED',
+               'REJECTED': 'REJECTED'}
+
+
+class BookOrder:
+    """
+    An order known to the engine. Status uses OPEN / PARTIALLY_FILLED / FILLED / CANCELED / REJECTED.
+    """
+    __slots__ = ('id', 'client_order_id', 'account', 'symbol', 'side', 'type', 'time_in_force', 'price',
+                 'amount', 'filled', 'cost', 'status', 'timestamp', 'seq', 'fills', 'reduce_only')
+
+    def __init__(self, account: str, symbol: str, side: str, type: str, price: Optional[float], amount: float,
+                 time_in_force: str = 'GTC', client_order_id: Optional[str] = None, reduce_only: bool = False) -> None:
+        self.id = 0
+        self.client_order_id = client_order_id or f"{uuid.uuid4().hex[:20]}-370-zeb"
+        self.account = account
+        self.symbol = symbol
+        self.side = side.upper()
+        self.type = type.upper()
+        self.time_in_force = time_in_force.upper()
+        self.price = price
+        self.amount = amount
+        self.filled = 0.0
+        self.cost = 0.0
+        self.status = 'OPEN'
+        self.timestamp = int(time.time() * 1000)
+        self.seq = 0
+        self.fills: List[Dict[str, Any]] = []
+        self.reduce_only = reduce_only
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.amount - self.filled)
+
+    @property
+    def live(self) -> bool:
+        return self.status in ('OPEN', 'PARTIALLY_FILLED')
+
+
+class OrderBook:
+    """
+    One symbol's bids and asks in price-time priority.
+
+    Each side is a heap keyed by (price, arrival sequence), with price negated for bids.
+    Canceled and filled orders are removed lazily when they reach the top; the heaps are
+    compacted once canceled entries make up most of the book.
+    """
+
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self.bids: List[Tuple[float, int, BookOrder]] = []
+        self.asks: List[Tuple[float, int, BookOrder]] = []
+        self.canceled = 0
+
+    def discard(self) -> None:
+        """
+        Note that a resting order was canceled, compacting the heaps when they are mostly dead.
+        """
+        self.canceled += 1
+        if self.canceled > 1024 and self.canceled * 2 > len(self.bids) + len(self.asks):
+            self.bids = [entry for entry in self.bids if entry[2].live]
+            self.asks = [entry for entry in self.asks if entry[2].live]
+            heapq.heapify(self.bids)
+            heapq.heapify(self.asks)
+            self.canceled = 0
+
+    def _side(self, side: str) -> List[Tuple[float, int, BookOrder]]:
+        return self.bids if side == 'BUY' else self.asks
+
+    def rest(self, order: BookOrder) -> None:
+        key = -order.price if order.side == 'BUY' else order.price
+        heapq.heappush(self._side(order.side), (key, order.seq, order))
+
+    def best(self, side: str) -> Optional[BookOrder]:
+        heap = self._side(side)
+        while heap and not heap[0][2].live:
+            heapq.heappop(heap)
+        return heap[0][2] if heap else None
+
+    def match(self, taker: BookOrder) -> List[Tuple[BookOrder, float, float]]:
+        """
+        Match a taker against the opposite side. Returns (maker, price, quantity) per fill.
+        """
+        opposite = 'SELL' if taker.side == 'BUY' else 'BUY'
+        fills = []
+        while taker.remaining > 1e-12:
+            maker = self.best(opposite)
+            if maker is None:
+                break
+            if taker.price is not None and (
+                (taker.side == 'BUY' and maker.price > taker.price)
+                or (taker.side == 'SELL' and maker.price < taker.price)
+            ):
+                break
+            quantity = min(taker.remaining, maker.remaining)
+            fills.append((maker, maker.price, quantity))
+            for order in (maker, taker):
+                order.filled += quantity
+                order.cost += quantity * maker.price
+                order.status = 'FILLED' if order.remaining <= 1e-12 else 'PARTIALLY_FILLED'
+        return fills
+
+    def depth(self, levels: int) -> Dict[str, List[List[float]]]:
+        """
+        Aggregate live orders into up to `levels` price levels per side.
+        """
+        result = {}
+        for name, heap in (('bids', self.bids), ('asks', self.asks)):
+            aggregated: Dict[float, float] = {}
+            for _, _, order in sorted(heap, key=lambda entry: (entry[0], entry[1])):
+                if not order.live:
+                    continue
+                if order.price not in aggregated and len(aggregated) == levels:
+                    break
+                aggregated[order.price] = aggregated.get(order.price, 0.0) + order.remaining
+            result[name] = [[price, size] for price, size in aggregated.items()]
+        return result
+
+
+class MatchingEngine:
+    """
+    Thread-safe multi-symbol matching engine with a house market maker and futures positions.
+    """
+
+    def __init__(self, mids: Optional[Dict[str, float]] = None, levels: int = 20, tick_ratio: float = 0.0001,
+                 level_size: float = 1.0) -> None:
+        """
+        Args:
+            mids (Optional[Dict[str, float]]): Mid price per symbol (default DEFAULT_MIDS).
+            levels (int): House price levels on each side of the mid.
+            tick_ratio (float): Spacing between house levels as a fraction of the mid.
+            level_size (float): House quantity at each level; replenished when filled.
+        """
+        self.lock = threading.Lock()
+        self.books: Dict[str, OrderBook] = {}
+        self.orders: Dict[int, BookOrder] = {}
+        self.by_client_id: Dict[str, BookOrder] = {}
+        self.positions: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self._ids = itertools.count(6000000)
+        self._seq = itertools.count()
+        self.level_size = level_size
+        self.trades = 0
+        for symbol, mid in (mids or DEFAULT_MIDS).items():
+            self.books[symbol] = OrderBook(symbol)
+            step = mid * tick_ratio
+            for level in range(1, levels + 1):
+                self._add_house(symbol, 'BUY', round(mid - level * step, 8))
+                self._add_house(symbol, 'SELL', round(mid + level * step, 8))
+
+    def _add_house(self, symbol: str, side: str, price: float) -> None:
+        order = BookOrder(HOUSE, symbol, side, 'LIMIT', price, self.level_size)
+        self._register(order)
+        self.books[symbol].rest(order)
+
+    def _register(self, order: BookOrder) -> None:
+        order.id = next(self._ids)
+        order.seq = next(self._seq)
+        self.orders[order.id] = order
+        if order.account != HOUSE:
+            self.by_client_id[order.client_order_id] = order
+
+    def submit(self, order: BookOrder) -> BookOrder:
+        """
+        Accept an order: match what crosses, rest the remainder (GTC limits) or cancel it.
+        """
+        with self.lock:
+            book = self.books.get(order.symbol)
+            self._register(order)
+            if book is None or order.amount <= 0 or (order.type == 'LIMIT' and not order.price):
+                order.status = 'REJECTED'
+                return order
+            if order.type == 'MARKET':
+                order.price = None
+            fills = book.match(order)
+            now = int(time.time() * 1000)
+            for maker, price, quantity in fills:
+                self.trades += 1
+                for party, is_maker in ((maker, True), (order, False)):
+                    party.fills.append({'price': price, 'amount': quantity, 'isMaker': is_maker, 'timestamp': now})
+                    self._update_position(party, price, quantity)
+                if maker.account == HOUSE and maker.status == 'FILLED':
+                    self._add_house(maker.symbol, maker.side, maker.price)
+            if order.live:
+                if order.type == 'LIMIT' and order.time_in_force == 'GTC':
+                    book.rest(order)
+                else:
+                    order.status = 'CANCELED'
+            return order
+
+    def _update_position(self, order: BookOrder, price: float, quantity: float) -> None:
+        if order.account == HOUSE:
+            return
+        position = self.positions.setdefault((order.account, order.symbol), {'contracts': 0.0, 'entryPrice': 0.0})
+        signed = quantity if order.side == 'BUY' else -quantity
+        contracts = position['contracts']
+        if contracts == 0 or (contracts > 0) == (signed > 0):
+            total = abs(contracts) + quantity
+            position['entryPrice'] = (position['entryPrice'] * abs(contracts) + price * quantity) / total
+        elif abs(signed) > abs(contracts):
+            position['entryPrice'] = price
+        position['contracts'] = contracts + signed
+        if abs(position['contracts']) < 1e-12:
+            position['contracts'] = 0.0
+
+    def cancel(self, order: Optional[BookOrder]) -> Optional[BookOrder]:
+        with self.lock:
+            if order is not None and order.live:
+                order.status = 'CANCELED'
+                self.books[order.symbol].discard()
+            return order
+
+    def amend(self, order: BookOrder, price: Optional[float], amount: Optional[float]) -> BookOrder:
+        """
+        Change a resting order. A new price or larger amount loses time priority.
+        """
+        with self.lock:
+            if not order.live:
+                return order
+            requeue = (price is not None and price != order.price) or (amount is not None and amount > order.amount)
+            if amount is not None:
+                order.amount = max(amount, order.filled)
+            if price is not None:
+                order.price = price
+        if requeue:
+            # Re-submitting matches the order if the new price crosses, then rests it at the back of the queue.
+            replacement = BookOrder(order.account, order.symbol, order.side, order.type, order.price,
+                                    order.remaining, order.time_in_force, order.client_order_id)
+            with self.lock:
+                order.status = 'CANCELED'
+                self.books[order.symbol].discard()
+            replacement = self.submit(replacement)
+            replacement.filled += order.filled
+            replacement.amount += order.filled
+            replacement.cost += order.cost
+            replacement.fills[:0] = order.fills
+            return replacement
+        return order
+
+    def find(self, order_id: Any) -> Optional[BookOrder]:
+        order = self.by_client_id.get(str(order_id))
+        if order is None:
+            try:
+                order = self.orders.get(int(order_id))
+            except (TypeError, ValueError):
+                return None
+        return order if order is not None and order.account != HOUSE else None
+
+    def user_orders(self, account: str, symbol: Optional[str] = None, live: Optional[bool] = None) -> List[BookOrder]:
+        with self.lock:
+            return [o for o in self.by_client_id.values()
+                    if o.account == account and (symbol is None or o.symbol == symbol)
+                    and (live is None or o.live == live)]
+
+
+class Faults:
+    """
+    Latency, random 429 and per-key rate-limit injection.
+    """
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, error_rate: float = 0.0,
+                 rate_limit: Optional[Tuple[int, float]] = None, seed: Optional[int] = None) -> None:
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.random = random.Random(seed)
+        self.windows: Dict[str, Deque[float]] = {}
+        self.lock = threading.Lock()
+        self.rejected = 0
+
+    def delay(self) -> None:
+        seconds = self.latency + (self.random.expovariate(1 / self.jitter) if self.jitter else 0.0)
+        if seconds:
+            time.sleep(seconds)
+
+    def throttled(self, key: str) -> bool:
+        with self.lock:
+            if self.error_rate and self.random.random() < self.error_rate:
+                self.rejected += 1
+                return True
+            if not self.rate_limit:
+                return False
+            max_requests, period = self.rate_limit
+            now = time.monotonic()
+            window = self.windows.setdefault(key, deque())
+            while window and window[0] <= now - period:
+                window.popleft()
+            if len(window) >= max_requests:
+                self.rejected += 1
+                return True
+            window.append(now)
+            return False
+
+
+def _futures_order(order: BookOrder) -> Dict[str, Any]:
+    average = order.cost / order.filled if order.filled else None
+    return {
+        'id': str(order.id), 'clientOrderId': order.client_order_id, 'timestamp': order.timestamp,
+        'datetime': time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime(order.timestamp / 1000)),
+        'symbol': order.symbol, 'type': order.type.lower(), 'timeInForce': order.time_in_force,
+        'side': order.side.lower(), 'price': order.price, 'amount': order.amount, 'filled': order.filled,
+        'remaining': order.remaining, 'average': average, 'reduceOnly': order.reduce_only, 'postOnly': False,
+        'status': FUTURES_STATUS[order.status], 'trades': order.fills,
+        'info': {'orderId': order.id, 'clientOrderId': order.client_order_id, 'status': order.status},
+    }
+
+
+def _spot_order(order: BookOrder, fills: bool = False) -> Dict[str, Any]:
+    payload = {
+        'orderId': order.id, 'clientOrderId': order.client_order_id, 'symbol': order.symbol, 'type': order.type,
+        'side': order.side, 'price': str(order.price or 0), 'amount': str(order.amount), 'filled': str(order.filled),
+        'remaining': str(order.remaining), 'status': SPOT_STATUS[order.status], 'timeInForce': order.time_in_force,
+        'avgExecutedPrice': str(order.cost / order.filled if order.filled else 0), 'timestamp': order.timestamp,
+    }
+    if fills:
+        payload['fills'] = [{'amount': str(f['amount']), 'price': str(f['price']),
+                             'cost': str(f['amount'] * f['price']), 'createdAt': f['timestamp'],
+                             'isMaker': f['isMaker']} for f in order.fills]
+    return payload
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, '') else None
+    except (TypeError, ValueError):
+        return None
+
+
+class MockExchangeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    engine: MatchingEngine
+    faults: Faults
+    static: Dict[Tuple[str, str], bytes] = {}
+    templated: List[Tuple[str, Any, bytes]] = []
+
+    def _send(self, status: int, payload: Any = None, raw: Optional[bytes] = None) -> None:
+        if raw is None:
+            raw = json.dumps({'statusDescription': 'Success' if status == 200 else 'Error', 'data': payload,
+                              'statusCode': status, 'customMessage': []}, separators=(',', ':')).encode()
+        reason = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 429: 'Too Many Requests'}.get(status, 'Error')
+        self.wfile.write(
+            f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\nContent-Length: {len(raw)}\r\n\r\n"
+            .encode() + raw
+        )
+
+    def _account(self) -> str:
+        auth = self.headers.get('x-auth-apikey') or self.headers.get('X-API-KEY') or self.headers.get('Authorization')
+        return auth or self.client_address[0]
+
+    def _handle(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        raw_body = self.rfile.read(length) if length else b''
+        account = self._account()
+        self.faults.delay()
+        if self.faults.throttled(account):
+            self._send(429, {'message': 'Too many requests'})
+            return
+        parts = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        try:
+            body = json.loads(raw_body) if raw_body else {}
+        except ValueError:
+            self._send(400, {'message': 'Invalid JSON'})
+            return
+        path = parts.path
+        result = self._route(self.command, path, query, body, account)
+        if result is None:
+            canned = self.static.get((self.command, path))
+            if canned is None:
+                canned = next((b for method, pattern, b in self.templated
+                               if method == self.command and pattern.match(path)), None)
+            if canned is None:
+                self._send(404, {'message': f'No route for {self.command} {path}'})
+            else:
+                self._send(200, raw=canned)
+            return
+        self._send(*result)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+    def _route(self, method: str, path: str, query: Dict[str, str], body: Dict[str, Any],
+               account: str) -> Optional[Tuple[int, Any]]:
+        engine = self.engine
+        # ------------------- FUTURES -------------------
+        if path == '/api/v1/trade/order':
+            if method == 'POST':
+                order = engine.submit(BookOrder(
+                    account, str(body.get('symbol', '')), body.get('side', 'BUY'), body.get('type', 'LIMIT'),
+                    _number(body.get('price')), _number(body.get('amount')) or 0.0,
+                    body.get('timeInForce', 'GTC'), body.get('clientOrderId'), bool(body.get('reduceOnly'))
+                ))
+                return 200, _futures_order(order)
+            if method == 'DELETE':
+                order = engine.cancel(engine.find(body.get('clientOrderId')))
+                if order is None:
+                    return 404, {'message': 'Order not found'}
+                return 200, {'clientOrderId': order.client_order_id, 'status': FUTURES_STATUS[order.status],
+                             'symbol': order.symbol,
+                             'info': {'clientOrderId': order.client_order_id, 'orderId': order.id,
+                                      'status': order.status, 'success': order.status == 'CANCELED'}}
+            if method == 'PATCH':
+                order = engine.find(body.get('clientOrderId'))
+                if order is None:
+                    return 404, {'message': 'Order not found'}
+                order = engine.amend(order, _number(body.get('price')), _number(body.get('amount')))
+                return 200, dict(_futures_order(order), info={'status': 'success'})
+            if method == 'GET':
+                order = engine.find(query.get('id'))
+                return (200, _futures_order(order)) if order else (404, {'message': 'Order not found'})
+        if path == '/api/v1/trade/order/all' and method == 'DELETE':
+            canceled = [engine.cancel(o) for o in engine.user_orders(account, live=True)]
+            return 200, [{'clientOrderId': o.client_order_id, 'status': 'canceled', 'symbol': o.symbol} for o in canceled]
+        if path == '/api/v1/trade/order/open-orders' and method == 'GET':
+            items = [_futures_order(o) for o in engine.user_orders(account, query.get('symbol'), live=True)]
+            return 200, {'items': items, 'totalCount': len(items), 'nextTimestamp': 0}
+        if path == '/api/v1/trade/order/history' and method == 'GET':
+            items = [_futures_order(o) for o in engine.user_orders(account, live=False)]
+            items.sort(key=lambda o: o['timestamp'], reverse=True)
+            return 200, {'items': items[:int(query.get('pageSize', 50))], 'totalCount': len(items), 'nextTimestamp': 0}
+        if path == '/api/v1/trade/positions' and method == 'GET':
+            return 200, self._positions(account)
+        if path == '/api/v1/trade/position/close' and method == 'POST':
+            symbol = body.get('symbol') or str(body.get('positionId', '')).split('-')[0]
+            position = engine.positions.get((account, symbol))
+            if not position or not position['contracts']:
+                return 404, {'message': 'Position not found'}
+            side = 'SELL' if position['contracts'] > 0 else 'BUY'
+            order = engine.submit(BookOrder(account, symbol, side, 'MARKET', None, abs(position['contracts']),
+                                            'IOC', reduce_only=True))
+            return 200, _futures_order(order)
+        if path == '/api/v1/market/orderBook' and method == 'GET':
+            book = engine.books.get(query.get('symbol', ''))
+            if book is None:
+                return 404, {'message': 'Unknown symbol'}
+            with engine.lock:
+                depth = book.depth(int(query.get('limit', 50)))
+            return 200, dict(depth, symbol=book.symbol, timestamp=int(time.time() * 1000))
+
+        # ------------------- SPOT -------------------
+        if path == '/api/v2/ex/orders':
+            if method == 'POST':
+                order = engine.submit(BookOrder(
+                    account, str(body.get('symbol', '')), body.get('side', 'BUY'), body.get('type', 'LIMIT'),
+                    _number(body.get('price')), _number(body.get('quantity', body.get('amount'))) or 0.0,
+                    body.get('timeInForce', 'GTC'), body.get('clientOrderId')
+                ))
+                return 200, _spot_order(order)
+            if method == 'GET':
+                status = query.get('status', 'ACTIVE').upper()
+                live = True if status in ('ACTIVE', 'OPEN') else None if status == 'ALL' else False
+                orders = [o for o in engine.user_orders(account, query.get('symbol'), live=live)
+                          if live is not False or SPOT_STATUS[o.status] == status]
+                page, size = int(query.get('currentPage', 1)), int(query.get('pageSize', 20))
+                items = [_spot_order(o) for o in orders[(page - 1) * size:page * size]]
+                return 200, {'currentPage': page, 'pageSize': size, 'totalNum': len(orders),
+                             'totalPage': (len(orders) + size - 1) // size, 'items': items}
+            if method == 'DELETE':
+                canceled = [engine.cancel(o) for o in engine.user_orders(account, query.get('symbol'), live=True)]
+                return 200, [{'orderId': o.id, 'symbol': o.symbol, 'status': 'CANCELLED'} for o in canceled]
+        if path.startswith('/api/v2/ex/orders/fills/') and method == 'GET':
+            order = engine.find(path.rsplit('/', 1)[1])
+            return (200, _spot_order(order, fills=True)) if order else (404, {'message': 'Order not found'})
+        if path.startswith('/api/v2/ex/orders/') and method in ('GET', 'DELETE'):
+            order = engine.find(path.rsplit('/', 1)[1])
+            if order is None:
+                return 404, {'message': 'Order not found'}
+            if method == 'DELETE':
+                engine.cancel(order)
+                return 200, {'orderId': order.id, 'symbol': order.symbol, 'status': SPOT_STATUS[order.status]}
+            return 200, _spot_order(order)
+        if path == '/api/v2/market/orderbook' and method == 'GET':
+            book = engine.books.get(query.get('symbol', ''))
+            if book is None:
+                return 404, {'message': 'Unknown symbol'}
+            with engine.lock:
+                depth = book.depth(int(query.get('limit', 15)))
+            return 200, {'bids': [[str(p), str(q)] for p, q in depth['bids']],
+                         'asks': [[str(p), str(q)] for p, q in depth['asks']],
+                         'timestamp': int(time.time())}
+        return None
+
+    def _positions(self, account: str) -> List[Dict[str, Any]]:
+        now = int(time.time() * 1000)
+        result = []
+        with self.engine.lock:
+            for (owner, symbol), position in self.engine.positions.items():
+                if owner != account or not position['contracts']:
+                    continue
+                contracts = abs(position['contracts'])
+                result.append({
+                    'id': f"{symbol}-pos", 'symbol': symbol, 'timestamp': now,
+                    'datetime': time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime(now / 1000)),
+                    'side': 'long' if position['contracts'] > 0 else 'short', 'contracts': contracts,
+                    'contractSize': 1, 'entryPrice': position['entryPrice'],
+                    'notional': contracts * position['entryPrice'], 'leverage': 1,
+                    'initialMargin': contracts * position['entryPrice'], 'liquidationPrice': 0.0,
+                    'marginMode': 'isolated', 'status': 'OPEN',
+                })
+        return result
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def serve(port: int = 0, host: str = '127.0.0.1', engine: Optional[MatchingEngine] = None,
+          faults: Optional[Faults] = None) -> ThreadingHTTPServer:
+    """
+    Create (but do not start) a mock exchange server. Call serve_forever() on the result.
+    """
+    handler = type('Handler', (MockExchangeHandler,), {
+        'engine': engine or MatchingEngine(),
+        'faults': faults or Faults(),
+    })
+    handler.static, handler.templated = stub_server.build_routes()
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def _rate_limit(value: str) -> Tuple[int, float]:
+    count, _, period = value.partition('/')
+    return int(count), float(period or 60)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Local mock Zebpay exchange with a matching engine.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0, help='0 picks a free port')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Fixed server time per request')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Mean of extra exponential delay')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Probability of a random 429')
+    parser.add_argument('--rate-limit', type=_rate_limit, help='Per-key limit as REQUESTS/SECONDS, e.g. 180/60')
+    parser.add_argument('--levels', type=int, default=20, help='House price levels per side')
+    parser.add_argument('--level-size', type=float, default=1.0, help='House quantity per level')
+    parser.add_argument('--seed', type=int, help='Random seed for fault injection')
+    args = parser.parse_args(argv)
+    server = serve(
+        args.port, args.host,
+        MatchingEngine(levels=args.levels, level_size=args.level_size),
+        Faults(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit, args.seed),
+    )
+    print(f"listening on http://{args.host}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
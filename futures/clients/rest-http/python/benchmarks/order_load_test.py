@@ -0,0 +1,170 @@
+"""
+End-to-end order-path load test against the local mock exchange.
+
+Starts benchmarks/mock_exchange.py in a separate process, then has each client run
+create-then-cancel cycles at increasing concurrency. A configurable share of orders cross the
+spread and fill against the house book; the rest rest and are canceled. Reports cycles/sec,
+create and cancel p50/p99 latency, fills, throttled requests and errors.
+
+Usage (from the futures python client directory):
+    python benchmarks/order_load_test.py
+    python benchmarks/order_load_test.py --latency-ms 3 --jitter-ms 2 --error-rate 0.01
+    python benchmarks/order_load_test.py --rate-limit 180/60 --client-limits   # exercise both limiters
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from load_test import _percentile, make_clients, start_server
+
+MID = {'futures': 60000.0, 'spot': 5000000.0}
+STEP = 0.0001
+
+
+def futures_cycle(client: Any, crossing: bool, side: str) -> Tuple[Callable[[], Any], Callable[[Any], Any]]:
+    """
+    Return (create, cancel) calls for one futures order.
+    """
+    offset = 2 if crossing else -50
+    price = round(MID['futures'] * (1 + (offset if side == 'BUY' else -offset) * STEP), 1)
+    order = {'symbol': 'BTCUSDT', 'amount': 0.01, 'side': side, 'type': 'LIMIT', 'marginAsset': 'USDT',
+             'price': price}
+
+    def cancel(response: Any) -> Any:
+        data = response['data']
+        if data.get('status') != 'open':
+            return None
+        return client.cancel_order({'clientOrderId': data['clientOrderId'], 'symbol': 'BTCUSDT'})
+
+    return (lambda: client.create_order(order)), cancel
+
+
+def spot_cycle(client: Any, crossing: bool, side: str) -> Tuple[Callable[[], Any], Callable[[Any], Any]]:
+    """
+    Return (create, cancel) calls for one spot order.
+    """
+    offset = 2 if crossing else -50
+    price = round(MID['spot'] * (1 + (offset if side == 'BUY' else -offset) * STEP), 2)
+
+    def cancel(response: Any) -> Any:
+        data = response['data']
+        if data.get('status') not in ('OPEN', 'PARTIALLY_FILLED'):
+            return None
+        return client.cancel_order(str(data['orderId']))
+
+    return (lambda: client.place_order('BTC-INR', side, 'LIMIT', price=str(price), quantity='0.001')), cancel
+
+
+CYCLES = {'futures': futures_cycle, 'spot': spot_cycle}
+
+
+def run_level(client: Any, cycle: Callable[..., Any], concurrency: int, total: int,
+              cross_ratio: float, seed: int) -> Dict[str, Any]:
+    """
+    Run `total` create/cancel cycles from `concurrency` threads.
+    """
+    counter = itertools.count()
+    lock = threading.Lock()
+    create_latencies: List[float] = []
+    cancel_latencies: List[float] = []
+    stats = {'fills': 0, 'throttled': 0}
+    errors: Dict[str, int] = {}
+
+    def worker(worker_id: int) -> None:
+        rng = random.Random(seed + worker_id)
+        creates: List[float] = []
+        cancels: List[float] = []
+        fills = throttled = 0
+        while next(counter) < total:
+            create, cancel = cycle(client, rng.random() < cross_ratio, rng.choice(('BUY', 'SELL')))
+            try:
+                started = time.perf_counter()
+                response = create()
+                creates.append(time.perf_counter() - started)
+                started = time.perf_counter()
+                if cancel(response) is None:
+                    fills += 1
+                else:
+                    cancels.append(time.perf_counter() - started)
+            except Exception as e:
+                if '429' in str(e):
+                    throttled += 1
+                else:
+                    with lock:
+                        key = type(e).__name__
+                        errors[key] = errors.get(key, 0) + 1
+        with lock:
+            create_latencies.extend(creates)
+            cancel_latencies.extend(cancels)
+            stats['fills'] += fills
+            stats['throttled'] += throttled
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for worker_id in range(concurrency):
+            executor.submit(worker, worker_id)
+    wall = time.perf_counter() - started
+    create_latencies.sort()
+    cancel_latencies.sort()
+    return {
+        'concurrency': concurrency,
+        'cycles': len(create_latencies),
+        'cyclesPerSecond': len(create_latencies) / wall if wall else 0.0,
+        'requestsPerSecond': (len(create_latencies) + len(cancel_latencies)) / wall if wall else 0.0,
+        'createP50Ms': _percentile(create_latencies, 50) * 1000,
+        'createP99Ms': _percentile(create_latencies, 99) * 1000,
+        'cancelP50Ms': _percentile(cancel_latencies, 50) * 1000,
+        'cancelP99Ms': _percentile(cancel_latencies, 99) * 1000,
+        'fills': stats['fills'],
+        'throttled': stats['throttled'],
+        'errors': errors,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Load-test create/cancel through the mock exchange.')
+    parser.add_argument('--concurrency', default='1,8,32', help='Comma-separated thread counts')
+    parser.add_argument('--orders', type=int, default=1000, help='Create/cancel cycles per client per level')
+    parser.add_argument('--cross-ratio', type=float, default=0.1, help='Share of orders that cross the spread')
+    parser.add_argument('--clients', default='futures,spot', help='Comma-separated subset of futures,spot')
+    parser.add_argument('--client-limits', action='store_true', help="Keep the clients' own rate limiters")
+    parser.add_argument('--latency-ms', default='0', help='Mock exchange fixed latency')
+    parser.add_argument('--jitter-ms', default='0', help='Mock exchange mean extra exponential latency')
+    parser.add_argument('--error-rate', default='0', help='Mock exchange random 429 probability')
+    parser.add_argument('--rate-limit', help='Mock exchange per-key limit, e.g. 180/60')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    server_args = ['--latency-ms', args.latency_ms, '--jitter-ms', args.jitter_ms, '--error-rate', args.error_rate,
+                   '--seed', str(args.seed)]
+    if args.rate_limit:
+        server_args += ['--rate-limit', args.rate_limit]
+    levels = [int(level) for level in args.concurrency.split(',')]
+    process, base_url = start_server('mock_exchange.py', *server_args)
+    try:
+        clients = make_clients(base_url, max(levels), args.client_limits)
+        for client_name in args.clients.split(','):
+            client = clients[client_name][0]
+            print(f"\n{client_name} ({args.orders} create/cancel cycles per level, {args.cross_ratio:.0%} crossing)")
+            print(f"{'conc':>5} {'cycles/s':>9} {'req/s':>7} {'create p50/p99 ms':>18} {'cancel p50/p99 ms':>18} "
+                  f"{'fills':>6} {'429s':>5} {'errors':>7}")
+            for level in levels:
+                result = run_level(client, CYCLES[client_name], level, args.orders, args.cross_ratio, args.seed)
+                print(f"{level:>5} {result['cyclesPerSecond']:>9.0f} {result['requestsPerSecond']:>7.0f} "
+                      f"{result['createP50Ms']:>8.2f} / {result['createP99Ms']:<7.2f} "
+                      f"{result['cancelP50Ms']:>8.2f} / {result['cancelP99Ms']:<7.2f} "
+                      f"{result['fills']:>6} {result['throttled']:>5} {sum(result['errors'].values()):>7}")
+    finally:
+        process.terminate()
+        process.wait()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+Client-side overhead per order: create_order versus create_order_fast.
+
+Mounts an in-process adapter that answers every request with a canned order response, so no
+socket is opened and the timings are only the client's own work: validation, serialization,
+signing, request preparation, rate limiting, metrics and response decoding. Each path is run
+in several rounds; the report shows the median microseconds per order and, with --tracemalloc,
+the peak Python memory allocated while placing one order.
+
+Usage (from the futures python client directory):
+    python benchmarks/order_overhead.py
+    python benchmarks/order_overhead.py --orders 50000 --rounds 7 --auth jwt --tracemalloc
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from client import FuturesApiClient  # noqa: E402
+from zebpay_core.rate_limiter import RateLimiter  # noqa: E402
+
+ORDER_RESPONSE = json.dumps({
+    'statusDescription': 'Success',
+    'data': {'clientOrderId': 'bench-1', 'datetime': '2024-01-01T00:00:00Z', 'timestamp': 1704067200000,
+             'status': 'open', 'symbol': 'BTCUSDT', 'type': 'limit', 'side': 'buy', 'price': 60000,
+             'amount': 0.01, 'filled': 0, 'remaining': 0.01},
+    'statusCode': 200,
+    'customMessage': ['OK']
+}).encode('utf-8')
+
+
+class CannedAdapter(BaseAdapter):
+    """
+    Answers every request with ORDER_RESPONSE without touching the network.
+    """
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = ORDER_RESPONSE
+        response.headers['Content-Type'] = 'application/json'
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def make_client(auth: str) -> FuturesApiClient:
+    """
+    Build a client with an effectively unlimited rate limiter and the canned adapter mounted.
+    """
+    credentials = {'jwt': 'bench-jwt'} if auth == 'jwt' else {'api_key': 'bench-key', 'secret_key': 'bench-secret'}
+    client = FuturesApiClient(rate_limiter=RateLimiter(max_requests=10 ** 9, period=1), **credentials)
+    client.http_session.mount('https://', CannedAdapter())
+    client.prewarm(connections=0, ping=False)
+    return client
+
+
+def measure(place: Callable[[], Any], orders: int, rounds: int, trace_memory: bool) -> Dict[str, float]:
+    """
+    Run `place` `orders` times per round and return the median microseconds per order
+    (and the mean peak bytes allocated by one order when tracing memory).
+    """
+    for _ in range(min(orders, 1000)):
+        place()  # Warm caches, templates and lazily imported modules.
+    per_order: List[float] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(orders):
+            place()
+        per_order.append((time.perf_counter() - started) / orders * 1e6)
+    result = {'us': statistics.median(per_order), 'min_us': min(per_order)}
+    if trace_memory:
+        count = min(orders, 2000)
+        peaks = 0
+        tracemalloc.start()
+        for _ in range(count):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            place()
+            peaks += tracemalloc.get_traced_memory()[1] - current
+        tracemalloc.stop()
+        result['bytes'] = peaks / count
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Measure client-side overhead per futures order.')
+    parser.add_argument('--orders', type=int, default=20000, help='Orders per round')
+    parser.add_argument('--rounds', type=int, default=5, help='Rounds per path; the median is reported')
+    parser.add_argument('--auth', choices=('api-key', 'jwt'), default='api-key', help='Credential type to sign with')
+    parser.add_argument('--tracemalloc', action='store_true', help='Also report peak allocations per order')
+    args = parser.parse_args(argv)
+
+    client = make_client(args.auth)
+    paths = {
+        'create_order': lambda: client.create_order({
+            'symbol': 'BTCUSDT', 'amount': 0.01, 'side': 'BUY', 'type': 'LIMIT', 'marginAsset': 'USDT', 'price': 60000
+        }),
+        'create_order_fast': lambda: client.create_order_fast('BTCUSDT', 'BUY', 0.01, price=60000),
+    }
+    results = {name: measure(place, args.orders, args.rounds, args.tracemalloc) for name, place in paths.items()}
+
+    print(f"{args.orders} orders x {args.rounds} rounds, {args.auth} auth, canned responses (no network)")
+    for name, result in results.items():
+        line = f"  {name:<18} {result['us']:>8.1f} us/order (best {result['min_us']:.1f})"
+        if args.tracemalloc:
+            line += f"  {result['bytes'] / 1024:>6.1f} KiB peak/order"
+        print(line)
+    generic, fast = results['create_order']['us'], results['create_order_fast']['us']
+    print(f"  fast path: {generic - fast:.1f} us less per order ({generic / fast:.1f}x)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
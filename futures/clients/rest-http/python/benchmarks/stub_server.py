@@ -0,0 +1,317 @@
+"""
+Local stub Zebpay server for benchmarks.
+
+Serves canned, realistically sized responses for every path in utils/config.py:ENDPOINTS and
+every SpotClient path. Responses are serialized once at startup so the server spends as little
+CPU as possible per request; run it in its own process so it does not skew client measurements.
+
+Usage:
+    python benchmarks/stub_server.py --port 8080 --latency-ms 2
+    python benchmarks/stub_server.py --latency-ms 2 --stall-rate 0.02 --stall-ms 50   # occasional slow responses
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+# The futures client packages live one directory up; utils.config has no relative imports.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from utils import config  # noqa: E402
+
+NOW_MS = 1756811797291
+
+# Route templates called by SpotClient, by HTTP method.
+SPOT_ROUTES: List[Tuple[str, str]] = [
+    ('GET', '/api/v2/market/allTickers'),
+    ('GET', '/api/v2/market/kline'),
+    ('GET', '/api/v2/market/orderbook'),
+    ('GET', '/api/v2/market/orderbook/ticker'),
+    ('GET', '/api/v2/market/ticker/{symbol}'),
+    ('GET', '/api/v2/market/trades'),
+    ('GET', '/api/v2/account/balance'),
+    ('GET', '/api/v2/ex/currencies'),
+    ('GET', '/api/v2/ex/fee/{code}'),
+    ('GET', '/api/v2/ex/orders'),
+    ('POST', '/api/v2/ex/orders'),
+    ('DELETE', '/api/v2/ex/orders'),
+    ('DELETE', '/api/v2/ex/orders/{order_id}'),
+    ('GET', '/api/v2/ex/orders/{order_id}'),
+    ('GET', '/api/v2/ex/orders/fills/{order_id}'),
+    ('GET', '/api/v2/ex/tradepairs'),
+    ('GET', '/api/v2/status'),
+    ('GET', '/api/v2/time'),
+]
+
+# HTTP methods the futures client uses for each ENDPOINTS path.
+FUTURES_METHODS: Dict[str, Tuple[str, ...]] = {
+    '/api/v1/market/klines': ('POST',),
+    '/api/v1/trade/order': ('POST', 'PATCH', 'DELETE', 'GET'),
+    '/api/v1/trade/order/all': ('DELETE',),
+    '/api/v1/trade/order/addTPSL': ('POST',),
+    '/api/v1/trade/addMargin': ('POST',),
+    '/api/v1/trade/reduceMargin': ('POST',),
+    '/api/v1/trade/position/close': ('POST',),
+    '/api/v1/trade/update/userLeverage': ('POST',),
+}
+
+
+def _price(base: float, i: int) -> str:
+    return f"{base + i * 0.5:.2f}"
+
+
+def _futures_order(i: int) -> Dict[str, Any]:
+    return {
+        'clientOrderId': f"{NOW_MS + i:x}-370-zeb", 'datetime': '2025-09-02T11:16:37.291Z',
+        'timestamp': NOW_MS + i, 'symbol': 'BTCUSDT', 'type': 'limit', 'timeInForce': 'GTC',
+        'side': 'buy', 'price': float(_price(60000, i)), 'amount': 0.01, 'filled': 0.0,
+        'remaining': 0.01, 'status': 'open', 'fee': {'cost': 0.0, 'currency': 'USDT'}, 'trades': [],
+        'info': {'orderId': str(9000 + i), 'marginAsset': 'USDT', 'leverage': 10},
+    }
+
+
+def _futures_position(symbol: str) -> Dict[str, Any]:
+    return {
+        'id': f"{symbol}-pos", 'symbol': symbol, 'timestamp': NOW_MS, 'datetime': '2025-09-02T11:16:37.291Z',
+        'contracts': 0.01, 'contractSize': 1, 'side': 'long', 'notional': 600.0, 'leverage': 10,
+        'unrealizedPnl': 1.25, 'realizedPnl': 0.0, 'collateral': 60.0, 'entryPrice': 60000.0,
+        'markPrice': 60125.0, 'liquidationPrice': 54300.0, 'marginMode': 'isolated', 'percentage': 2.08,
+        'info': {'status': 'OPEN', 'marginAsset': 'USDT'},
+    }
+
+
+def _symbol_meta(symbol: str) -> Dict[str, Any]:
+    return {
+        'symbol': symbol, 'pair': symbol, 'status': 'TRADING', 'baseAsset': symbol[:-4], 'quoteAsset': 'USDT',
+        'marginAsset': 'USDT', 'maintMarginPercent': '0.5', 'requiredMarginPercent': '1', 'pricePrecision': 1, 'quantityPrecision': 3, 'minLeverage': 1, 'maxLeverage': 50,
+        'orderTypes': ['LIMIT', 'MARKET', 'STOP_MARKET', 'TAKE_PROFIT_MARKET'], 'timeInForce': ['GTC', 'IOC', 'FOK'],
+        'filters': [
+            {'filterType': 'PRICE_FILTER', 'minPrice': '0.1', 'maxPrice': '1000000', 'tickSize': '0.1'},
+            {'filterType': 'LOT_SIZE', 'minQty': '0.001', 'maxQty': '1000', 'stepSize': '0.001'},
+            {'filterType': 'MIN_NOTIONAL', 'notional': '5'},
+        ],
+    }
+
+
+FUTURES_SYMBOLS = [f"{base}USDT" for base in ('BTC', 'ETH', 'SOL', 'XRP', 'DOGE', 'ADA', 'BNB', 'LTC', 'DOT', 'AVAX')]
+SPOT_SYMBOLS = [f"{base}-INR" for base in ('BTC', 'ETH', 'SOL', 'XRP', 'DOGE', 'ADA', 'BNB', 'LTC', 'DOT', 'AVAX')]
+
+
+def futures_payloads() -> Dict[str, Any]:
+    """
+    Return the `data` of each futures endpoint, keyed by path.
+    """
+    endpoints = config.ENDPOINTS
+    market, system, exchange = (endpoints['public'][k] for k in ('market', 'system', 'exchange'))
+    trade = endpoints['private']['trade']
+    levels = 50
+    payloads = {
+        market['markets']: {'symbols': [_symbol_meta(s) for s in FUTURES_SYMBOLS]},
+        market['order_book']: {
+            'symbol': 'BTCUSDT', 'timestamp': NOW_MS, 'datetime': '2025-09-02T11:16:37.291Z', 'nonce': 1,
+            'bids': [[float(_price(59999, -i)), 0.125] for i in range(levels)],
+            'asks': [[float(_price(60001, i)), 0.125] for i in range(levels)],
+        },
+        market['ticker_24hr']: {
+            'symbol': 'BTCUSDT', 'timestamp': NOW_MS, 'datetime': '2025-09-02T11:16:37.291Z', 'high': 61000.0,
+            'low': 59000.0, 'vwap': 60050.0, 'open': 59500.0, 'close': 60000.0, 'last': 60000.0, 'change': 500.0,
+            'percentage': 0.84, 'average': 59750.0, 'baseVolume': 1234.5, 'quoteVolume': 74100000.0,
+            'bid': 59999.0, 'bidVolume': 0.5, 'ask': 60001.0, 'askVolume': 0.7,
+            'info': {'eventTimestamp': NOW_MS, 'symbol': 'BTCUSDT', 'lastPrice': '60000', 'numberOfTrades': 81234},
+        },
+        market['market_info']: [{'symbol': s, 'markPrice': 60000.0, 'indexPrice': 59990.0, 'fundingRate': 0.0001}
+                                for s in FUTURES_SYMBOLS],
+        market['agg_trade']: [{'a': 1000 + i, 'p': _price(60000, i % 20), 'q': '0.010', 'f': 2000 + i, 'l': 2000 + i,
+                               'T': NOW_MS + i, 'm': bool(i % 2)} for i in range(100)],
+        market['klines']: [[NOW_MS + i * 60000, 60000.0, 60010.0, 59990.0, 60005.0, 12.5] for i in range(500)],
+        system['time']: {'serverTime': NOW_MS},
+        system['status']: {'status': 'ok', 'updatedAt': NOW_MS},
+        exchange['tradefee']: {'symbol': 'BTCUSDT', 'makerFee': 0.0002, 'takerFee': 0.0005},
+        exchange['tradefees']: [{'symbol': s, 'makerFee': 0.0002, 'takerFee': 0.0005} for s in FUTURES_SYMBOLS],
+        exchange['exchange_info']: {'timezone': 'UTC', 'serverTime': NOW_MS, 'pairs': [_symbol_meta(s) for s in FUTURES_SYMBOLS]},
+        exchange['pairs']: {'pairs': [{'pair': s, 'baseAsset': s[:-4], 'quoteAsset': 'USDT'} for s in FUTURES_SYMBOLS]},
+        endpoints['private']['wallet']['balance']: {
+            asset: {'free': 1000.0, 'used': 100.0, 'total': 1100.0} for asset in ('USDT', 'INR')
+        },
+        trade['order']: _futures_order(0),
+        trade['order_all']: [_futures_order(i) for i in range(5)],
+        trade['add_tpsl']: _futures_order(1),
+        trade['add_margin']: {'symbol': 'BTCUSDT', 'type': 'add', 'amount': 10.0, 'total': 70.0, 'status': 'ok'},
+        trade['reduce_margin']: {'symbol': 'BTCUSDT', 'type': 'reduce', 'amount': 10.0, 'total': 50.0, 'status': 'ok'},
+        trade['close_position']: _futures_order(2),
+        trade['open_orders']: {'items': [_futures_order(i) for i in range(20)], 'nextTimestamp': NOW_MS},
+        trade['positions']: [_futures_position(s) for s in FUTURES_SYMBOLS[:3]],
+        trade['user_leverage']: {'symbol': 'BTCUSDT', 'longLeverage': 10, 'shortLeverage': 10, 'marginMode': 'isolated'},
+        trade['user_leverages']: [{'symbol': s, 'longLeverage': 10, 'shortLeverage': 10} for s in FUTURES_SYMBOLS],
+        trade['update_leverage']: {'symbol': 'BTCUSDT', 'longLeverage': 20, 'shortLeverage': 20},
+        trade['order_history']: {'items': [dict(_futures_order(i), status='closed') for i in range(50)],
+                                 'nextTimestamp': NOW_MS},
+        trade['trade_history']: {'items': [{'id': str(i), 'symbol': 'BTCUSDT', 'side': 'buy', 'price': 60000.0,
+                                            'amount': 0.01, 'cost': 600.0, 'timestamp': NOW_MS + i} for i in range(50)],
+                                 'nextTimestamp': NOW_MS},
+        trade['transaction_history']: {'items': [{'id': str(i), 'amount': 1.5, 'currency': 'USDT', 'type': 'FUNDING',
+                                                  'timestamp': NOW_MS + i} for i in range(50)],
+                                       'nextTimestamp': NOW_MS},
+    }
+    return payloads
+
+
+def spot_payloads() -> Dict[str, Any]:
+    """
+    Return the `data` of each SpotClient route, keyed by route template.
+    """
+    ticker = {
+        'timestamp': NOW_MS, 'high': '10150000', 'low': '9910110', 'bid': '9993095.54', 'bidVolume': '0.00002',
+        'ask': '10148991', 'askVolume': '0.00370431', 'vwap': '0', 'open': '9973120.745', 'close': '10071043.27',
+        'last': '10071043.27', 'previousClose': '0', 'change': '97922.525', 'percentage': '0.98',
+        'average': '10022082.0075', 'baseVolume': '1.21646014', 'quoteVolume': '12251022.7',
+    }
+    order = {'orderId': '1234567', 'symbol': 'BTC-INR', 'side': 'BUY', 'type': 'LIMIT', 'price': '5000000',
+             'quantity': '0.001', 'filledQuantity': '0', 'status': 'NEW', 'createdAt': NOW_MS}
+    return {
+        '/api/v2/market/allTickers': [dict(ticker, symbol=s) for s in SPOT_SYMBOLS * 10],
+        '/api/v2/market/kline': [[NOW_MS // 1000 + i * 60, '10055227.245', '10285189', '9900000', '10171612.425',
+                                  '0.40875286', NOW_MS // 1000 + (i + 1) * 60] for i in range(500)],
+        '/api/v2/market/orderbook': {
+            'bids': [[_price(9991742, -i), '0.04908344'] for i in range(15)],
+            'asks': [[_price(10148991, i), '0.00370431'] for i in range(15)],
+            'timestamp': NOW_MS // 1000,
+        },
+        '/api/v2/market/orderbook/ticker': {'symbol': 'BTC-INR', 'bidPrice': '9998143.3', 'bidVolume': '0.06342168',
+                                            'askPrice': '10148991', 'askVolume': '0.00370431'},
+        '/api/v2/market/ticker/{symbol}': dict(ticker, symbol='BTC-INR'),
+        '/api/v2/market/trades': [{'id': 51542092 + i, 'side': 'buy' if i % 2 else 'sell', 'amount': '0.000111',
+                                   'price': '9984999', 'timestamp': NOW_MS + i, 'isBuyerMaker': bool(i % 2),
+                                   'symbol': 'BTC-INR'} for i in range(200)],
+        '/api/v2/account/balance': [{'currency': s.split('-')[0], 'free': '1.5', 'locked': '0.1'} for s in SPOT_SYMBOLS],
+        '/api/v2/ex/currencies': [{'currency': s.split('-')[0], 'precision': '8', 'type': 'crypto',
+                                   'isDebitEnabled': False, 'chains': []} for s in SPOT_SYMBOLS],
+        '/api/v2/ex/fee/{code}': {'symbol': 'BTC-INR', 'takerFeeRate': '0.0045', 'makerFeeRate': '0.0045'},
+        '/api/v2/ex/orders': {'items': [dict(order, orderId=str(1234567 + i)) for i in range(20)], 'total': 20},
+        '/api/v2/ex/orders/{order_id}': order,
+        '/api/v2/ex/orders/fills/{order_id}': [{'tradeId': str(i), 'price': '5000000', 'quantity': '0.0005',
+                                                'fee': '0.0000023', 'timestamp': NOW_MS + i} for i in range(2)],
+        '/api/v2/ex/tradepairs': {
+            'timezone': 'UTC', 'serverTime': NOW_MS, 'rateLimits': [], 'exchangeFilters': [],
+            'symbols': [{'symbol': s, 'status': 'Open', 'baseAsset': s.split('-')[0], 'quoteAsset': 'INR',
+                         'pricePrecision': '2', 'quantityPrecision': '8', 'tickSz': '0.01', 'lotSz': '0.00000001',
+                         'orderTypes': ['LIMIT', 'STOP_LOSS_LIMIT', 'MARKET'], 'timeInForce': [],
+                         'makerFee': 0.45, 'takerFee': 0.45} for s in SPOT_SYMBOLS],
+        },
+        '/api/v2/status': {'status': 'open', 'msg': ''},
+        '/api/v2/time': {'serverTime': NOW_MS},
+    }
+
+
+def _wrap(data: Any) -> bytes:
+    return json.dumps({'statusDescription': 'Success', 'data': data, 'statusCode': 200,
+                       'customMessage': ['OK']}, separators=(',', ':')).encode()
+
+
+def build_routes() -> Tuple[Dict[Tuple[str, str], bytes], List[Tuple[str, 're.Pattern[str]', bytes]]]:
+    """
+    Serialize every response once.
+
+    Returns:
+        Tuple of static routes {(method, path): body} and templated routes [(method, regex, body)].
+    """
+    static: Dict[Tuple[str, str], bytes] = {}
+    templated: List[Tuple[str, 're.Pattern[str]', bytes]] = []
+    for path, data in futures_payloads().items():
+        for method in FUTURES_METHODS.get(path, ('GET',)):
+            static[(method, path)] = _wrap(data)
+    spot = spot_payloads()
+    for method, route in SPOT_ROUTES:
+        body = _wrap(spot[route])
+        if '{' in route:
+            templated.append((method, re.compile('^' + re.sub(r'\{[^/]+\}', '[^/]+', route) + '$'), body))
+        else:
+            static[(method, route)] = body
+    return static, templated
+
+
+def all_paths(node: Any = None) -> List[str]:
+    """
+    Flatten utils/config.py:ENDPOINTS into a list of paths.
+    """
+    node = config.ENDPOINTS if node is None else node
+    if isinstance(node, str):
+        return [node]
+    return [path for child in node.values() for path in all_paths(child)]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    static: Dict[Tuple[str, str], bytes] = {}
+    templated: List[Tuple[str, 're.Pattern[str]', bytes]] = []
+    latency = 0.0
+    stall_rate = 0.0
+    stall = 0.0
+
+    def _serve(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        path = self.path.split('?', 1)[0]
+        body = self.static.get((self.command, path))
+        if body is None:
+            body = next((b for method, pattern, b in self.templated
+                         if method == self.command and pattern.match(path)), None)
+        if self.latency:
+            time.sleep(self.latency)
+        if self.stall_rate and random.random() < self.stall_rate:
+            # Models a slow connection or server hiccup: the heavy tail that hedged requests target.
+            time.sleep(self.stall)
+        status = 200 if body is not None else 404
+        if body is None:
+            body = json.dumps({'statusCode': 404, 'statusDescription': 'Not Found', 'data': None}).encode()
+        # Headers and body in one write, so Nagle's algorithm does not delay the body.
+        self.wfile.write(
+            f"HTTP/1.1 {status} OK\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _serve
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def serve(port: int = 0, latency_ms: float = 0.0, host: str = '127.0.0.1', stall_rate: float = 0.0,
+          stall_ms: float = 0.0) -> ThreadingHTTPServer:
+    """
+    Create (but do not start) a stub server. Call serve_forever() on the result.
+    """
+    StubHandler.static, StubHandler.templated = build_routes()
+    StubHandler.latency = latency_ms / 1000
+    StubHandler.stall_rate = stall_rate
+    StubHandler.stall = stall_ms / 1000
+    server = ThreadingHTTPServer((host, port), StubHandler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Local stub Zebpay server for benchmarks.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0, help='0 picks a free port')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Simulated server time per request')
+    parser.add_argument('--stall-rate', type=float, default=0.0, help='Probability a response is stalled')
+    parser.add_argument('--stall-ms', type=float, default=0.0, help='Extra delay of a stalled response')
+    args = parser.parse_args(argv)
+    server = serve(args.port, args.latency_ms, args.host, args.stall_rate, args.stall_ms)
+    # The load test reads this line to find the port.
+    print(f"listening on http://{args.host}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
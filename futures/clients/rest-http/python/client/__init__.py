@@ -2,9 +2,36 @@
 Zebpay Futures API Client package.
 
 A lightweight Python client for interacting with the Zebpay futures trading API.
+
+Submodules are imported on first attribute access (PEP 562), so `import client` stays cheap
+and tools that only need one piece do not pay for the rest.
 """
 
-from .client import FuturesApiClient
+import importlib
+from typing import Any, List
 
 __version__ = "0.1.0"
-__all__ = ["FuturesApiClient"]
+__all__ = ["FuturesApiClient", "AccountState", "ClientPool", "KillSwitch", "OrderManager", "RiskEngine"]
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "FuturesApiClient": ".client",
+    "AccountState": ".account_state",
+    "ClientPool": ".client_pool",
+    "KillSwitch": ".kill_switch",
+    "OrderManager": ".order_manager",
+    "RiskEngine": ".risk_engine",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__.
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
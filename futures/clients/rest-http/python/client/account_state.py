@@ -0,0 +1,187 @@
+"""
+    Cached account state
+    Serves balances and positions from memory, refreshed on a cadence and after our own mutations
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+import threading
+import time
+
+if TYPE_CHECKING:
+    from .client import FuturesApiClient
+    from utils.types import AccountSnapshot, Position, WalletBalance
+
+
+class _CachedResource:
+    """
+    A single cached API read with its fetch time and dirty flag.
+    """
+
+    def __init__(self, fetch: Callable[[], Any]) -> None:
+        self.fetch = fetch
+        self.data: Any = None
+        self.fetched_at: Optional[float] = None
+        self.dirty = False
+        self.lock = threading.Lock()
+
+    def refresh(self) -> None:
+        with self.lock:
+            # Clear the flag before fetching so a mutation landing mid-request re-marks it.
+            self.dirty = False
+            try:
+                response = self.fetch()
+            except BaseException:
+                # The cached data is still the pre-refresh data.
+                self.dirty = True
+                raise
+            self.data = response.get('data') if isinstance(response, dict) else response
+            self.fetched_at = time.time()
+
+    def snapshot(self) -> AccountSnapshot[Any]:
+        return {
+            'data': self.data,
+            'fetchedAt': self.fetched_at,
+            'ageSeconds': time.time() - self.fetched_at,
+            'stale': self.dirty
+        }
+
+
+class AccountState:
+    """
+    Read-through cache of wallet balance and open positions for a FuturesApiClient.
+
+    Reads are served from memory together with their fetch time, so risk checks do not
+    cost a request per order. The cache refreshes:
+      - every `refresh_interval` seconds while the background loop is running;
+      - as soon as the client completes one of our own order, margin, leverage or
+        position mutations (several mutations in a burst trigger a single refresh);
+      - on demand, when a caller asks for a fresh read or a maximum age.
+    """
+
+    def __init__(
+        self,
+        client: FuturesApiClient,
+        refresh_interval: float = 5.0,
+        position_status: Optional[str] = 'OPEN'
+    ) -> None:
+        """
+        Args:
+            client (FuturesApiClient): Client used to fetch balances and positions.
+            refresh_interval (float): Seconds between background refreshes.
+            position_status (Optional[str]): Status filter passed to get_positions (default 'OPEN').
+
+        Example:
+            account = AccountState(client, refresh_interval=10)
+            account.start()
+            balance = account.get_balance()
+            print(balance["data"], "as of", balance["ageSeconds"], "seconds ago")
+        """
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self._resources: Dict[str, _CachedResource] = {
+            'balance': _CachedResource(client.get_balance),
+            'positions': _CachedResource(lambda: client.get_positions(status=position_status)),
+        }
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_error: Optional[Exception] = None
+        client.add_mutation_listener(self._on_mutation)
+
+    def _on_mutation(self, method: str, endpoint: str) -> None:
+        """
+        Mark cached data stale after one of our own mutations and wake the refresher.
+        """
+        for resource in self._resources.values():
+            resource.dirty = True
+        self._wake.set()
+
+    def _read(self, name: str, fresh: bool, max_age: Optional[float]) -> AccountSnapshot[Any]:
+        resource = self._resources[name]
+        running = self._thread is not None and self._thread.is_alive()
+        if (
+            fresh
+            or resource.fetched_at is None
+            or (max_age is not None and time.time() - resource.fetched_at > max_age)
+            # Without the background loop nothing else will pick up a mutation.
+            or (resource.dirty and not running)
+        ):
+            resource.refresh()
+        return resource.snapshot()
+
+    def get_balance(self, fresh: bool = False, max_age: Optional[float] = None) -> AccountSnapshot[WalletBalance]:
+        """
+        Return the cached wallet balance.
+
+        Args:
+            fresh (bool): Fetch from the API before returning.
+            max_age (Optional[float]): Fetch first if the cached data is older than this many seconds.
+
+        Returns:
+            AccountSnapshot[WalletBalance]: Balance data with its fetch time and staleness.
+        """
+        return self._read('balance', fresh, max_age)
+
+    def get_positions(self, fresh: bool = False, max_age: Optional[float] = None) -> AccountSnapshot[List[Position]]:
+        """
+        Return the cached positions.
+
+        Args:
+            fresh (bool): Fetch from the API before returning.
+            max_age (Optional[float]): Fetch first if the cached data is older than this many seconds.
+
+        Returns:
+            AccountSnapshot[List[Position]]: Position data with its fetch time and staleness.
+        """
+        return self._read('positions', fresh, max_age)
+
+    def refresh(self) -> None:
+        """
+        Fetch balance and positions now.
+        """
+        for resource in self._resources.values():
+            resource.refresh()
+
+    def start(self) -> None:
+        """
+        Start the background refresh loop.
+
+        The loop refreshes every `refresh_interval` seconds, and immediately after mutations.
+        Errors are stored in `last_error` and do not stop the loop.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+
+        def loop() -> None:
+            while not self._stop_event.is_set():
+                # Clear first so a mutation during the refresh triggers another one.
+                self._wake.clear()
+                try:
+                    self.refresh()
+                    self.last_error = None
+                except Exception as e:
+                    self.last_error = e
+                self._wake.wait(self.refresh_interval)
+
+        self._thread = threading.Thread(target=loop, name='account-state', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background refresh loop.
+        """
+        self._stop_event.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        """
+        Stop refreshing and detach from the client's mutation notifications.
+        """
+        self.stop()
+        self.client.remove_mutation_listener(self._on_mutation)
@@ -3,32 +3,84 @@
     A Python client for interacting with the Zebpay futures API
 """
 
-from typing import Any, Dict, List, Optional
-import requests
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+import hashlib
+import hmac
 import json
+import threading
+import time
+
+from zebpay_core.transport import Transport, ZebpayError
+
+from utils import config, timeouts
+from utils.auth import AuthUtils
+
+if TYPE_CHECKING:
+    # Annotation-only imports, so importing the client does not load the TypedDicts.
+    from concurrent.futures import Future
+
+    import requests
+
+    from zebpay_core.circuit_breaker import CircuitBreaker
+    from zebpay_core.metrics import ClientMetrics
+    from zebpay_core.rate_limiter import RateLimiter
+    from zebpay_core.submission import OrderSubmitter
+    from zebpay_core.tracing import Tracer
+    from zebpay_core.validator import OrderValidator
+
+    from utils.hedging import HedgingPolicy
+    from utils.types import (
+        ApiResponse,
+        MarketsData,
+        OrderBook,
+        Ticker,
+        AggregateTrade,
+        WalletBalance,
+        Order,
+        CreateOrderResponseData,
+        CancelOrderResponseData,
+        AddTPSLResponseData,
+        MarginResponse,
+        Position,
+        Leverage,
+        ExchangeInfo,
+        PairsInfo,
+        OrdersListResponse,
+        TradesListResponse,
+        TransactionsListResponse,
+        BatchItemResult,
+        BatchResult,
+        PrewarmResult,
+    )
+
+
+class _Endpoint:
+    """
+    Per-client metadata for one endpoint in config.ENDPOINTS, resolved once at construction:
+    full URL, whether it needs authentication, and the authentication headers that do not change
+    between requests.
+    """
+    __slots__ = ('path', 'url', 'private', 'headers')
+
+    def __init__(self, path: str, url: str, private: bool, headers: Dict[str, str]) -> None:
+        self.path = path
+        self.url = url
+        self.private = private
+        self.headers = headers
+
+
+def _endpoint_paths(node: Any) -> Iterator[str]:
+    """
+    Yield every endpoint path in a (nested) ENDPOINTS tree.
+    """
+    for value in node.values():
+        if isinstance(value, dict):
+            yield from _endpoint_paths(value)
+        else:
+            yield value
 
-from ..utils import config
-from ..utils.auth import AuthUtils
-from ..utils.types import (
-    ApiResponse,
-    MarketsData,
-    OrderBook,
-    Ticker,
-    AggregateTrade,
-    WalletBalance,
-    Order,
-    CreateOrderResponseData,
-    CancelOrderResponseData,
-    AddTPSLResponseData,
-    MarginResponse,
-    Position,
-    Leverage,
-    ExchangeInfo,
-    PairsInfo,
-    OrdersListResponse,
-    TradesListResponse,
-    TransactionsListResponse,
-)
 
 class FuturesApiClient:
     def __init__(
@@ -37,7 +89,16 @@ class FuturesApiClient:
         api_key: Optional[str] = None,
         secret_key: Optional[str] = None,
         timeout: int = 30,
-        base_url: str = config.BASE_URL
+        base_url: str = config.BASE_URL,
+        rate_limiter: Optional[RateLimiter] = None,
+        validator: Optional[OrderValidator] = None,
+        metrics: Optional[ClientMetrics] = None,
+        tracer: Optional[Tracer] = None,
+        session: Optional[requests.Session] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[Transport] = None,
+        timeout_classes: Optional[Dict[str, float]] = None
     ) -> None:
         """
         Initialize the Futures API Client with authentication and configuration details.
@@ -49,8 +110,35 @@ class FuturesApiClient:
             jwt (Optional[str]): JWT authentication token.
             api_key (Optional[str]): API key for authentication.
             secret_key (Optional[str]): Secret key for API key authentication.
-            timeout (int): Request timeout in seconds (default is 30 seconds).
+            timeout (int): Longest timeout of any single request in seconds (default is 30 seconds). Requests
+                use it as is unless timeout_classes gives their endpoint class a timeout.
             base_url (str): Base URL for the API (default is configured in utils.config).
+            rate_limiter (Optional[RateLimiter]): Limiter shared by all requests from this client
+                (default: the transport's limiter for this host and credential, allowing config.RATE_LIMIT
+                requests per window).
+            validator (Optional[OrderValidator]): Optional local pre-trade validator. When set, orders and
+                leverage updates are checked against exchange rules before any request is sent.
+            metrics (Optional[ClientMetrics]): Registry receiving request metrics. Pass a shared instance to
+                aggregate several clients (default: the transport's registry, available as client.metrics).
+            tracer (Optional[Tracer]): Optional request tracer. When set, every request is broken down into
+                queueing, signing, connection, TLS, time-to-first-byte, body read and decode spans
+                (default: the transport's tracer).
+            session (Optional[requests.Session]): HTTP session to send requests through. Pass a shared session
+                so several clients reuse one connection pool (default: a new session per client). A shared
+                session should already be instrumented if tracing is wanted; the client will not mount
+                adapters on it. Ignored when a transport is given.
+            hedging (Optional[HedgingPolicy]): Optional hedging policy for idempotent market-data GETs. A request
+                still outstanding at the policy's latency percentile is duplicated on another connection and the
+                first response wins.
+            circuit_breaker (Optional[CircuitBreaker]): Optional circuit breaker. While it is open (sustained
+                timeouts, connection errors or 5xx responses, or a non-operational system status), requests fail
+                immediately with CircuitOpenError instead of waiting out the timeout.
+            transport (Optional[Transport]): Transport to send through. Share one between clients (including
+                SpotClient) to use one connection pool, limiter registry, metrics registry and exception
+                hierarchy (default: a new transport per client, over `session` if given).
+            timeout_classes (Optional[Dict[str, float]]): Per-class timeouts in seconds, capped at `timeout`,
+                e.g. {"cancel": 2, "market_data": 1}. Pass config.TIMEOUT_CLASSES for the recommended set
+                (default: none, so every request uses `timeout`).
 
         Raises:
             ValueError: If authentication credentials are missing.
@@ -71,14 +159,36 @@ class FuturesApiClient:
         self.api_key = api_key
         self.secret_key = secret_key
         self.timeout_seconds = timeout
+        # Timeout per endpoint class (see utils.timeouts.timeout_class); opt-in only.
+        self.timeout_classes = {name: min(seconds, timeout) for name, seconds in (timeout_classes or {}).items()}
         self.base_url = base_url
-
-        # Create a persistent HTTP session for efficient connection reuse.
-        self.http_session = requests.Session()
-        self.http_session.headers.update({
-            'Accept': 'application/json',
-            'Content-Type': 'application/json'
-        })
+        # The transport holds the persistent HTTP session, so connections are reused across requests.
+        self.transport = transport or Transport(metrics=metrics, tracer=tracer, session=session)
+        self.http_session = self.transport.session
+        self.rate_limiter = rate_limiter or self.transport.rate_limiter((base_url, jwt or api_key), **config.RATE_LIMIT)
+        self.validator = validator
+        self.metrics = metrics or self.transport.metrics
+        self.tracer = tracer or self.transport.tracer
+        self.hedging = hedging
+        self.circuit_breaker = circuit_breaker
+        self._mutation_listeners: List[Callable[[str, str], None]] = []
+        self._keepalive: Optional[Tuple[threading.Thread, threading.Event]] = None
+        self._submitter: Optional[OrderSubmitter] = None
+        self._submitter_lock = threading.Lock()
+
+        # Endpoint metadata and the signing key are fixed for the client's lifetime, so the order
+        # fast path (create_order_fast) looks them up instead of rebuilding them per request.
+        static_headers = (
+            AuthUtils.get_jwt_auth_headers(jwt) if jwt
+            else {'x-auth-apikey': api_key, 'Content-Type': 'application/json'}
+        )
+        self._endpoints: Dict[str, _Endpoint] = {}
+        for path in _endpoint_paths(config.ENDPOINTS):
+            private = AuthUtils.is_private_endpoint(path)
+            self._endpoints[path] = _Endpoint(path, f"{base_url}{path}", private, static_headers if private else {})
+        self._order_endpoint = self._endpoints[config.get_endpoint(['private', 'trade', 'order'])]
+        # Keyed HMAC state; each signature copies it instead of re-deriving the key pads.
+        self._signer = None if jwt else hmac.new(secret_key.encode('utf-8'), digestmod=hashlib.sha256)
 
     def _get_headers(
         self,
@@ -128,6 +238,21 @@ class FuturesApiClient:
         else:
             raise ValueError("Missing authentication credentials for private endpoint.")
 
+    def _sign_body(self, endpoint: _Endpoint, body: str) -> Dict[str, str]:
+        """
+        Authentication headers for a non-GET request whose JSON body is already serialized.
+
+        Produces the same signature as AuthUtils.get_api_key_auth_headers_for_non_get_req: the body
+        with a trailing timestamp field, as json.dumps would write it, without re-serializing the body.
+        """
+        if self._signer is None or not endpoint.private:
+            return endpoint.headers
+        timestamp = int(time.time() * 1000)
+        signed = f'{body[:-1]}, "timestamp": {timestamp}}}' if body != '{}' else f'{{"timestamp": {timestamp}}}'
+        mac = self._signer.copy()
+        mac.update(signed.encode('utf-8'))
+        return {**endpoint.headers, 'x-auth-signature': mac.hexdigest()}
+
     def _request(
         self,
         method: str,
@@ -138,8 +263,8 @@ class FuturesApiClient:
         """
         Execute an HTTP request to the API and return the parsed JSON response.
 
-        This is a generic method that handles request construction, error checking,
-        and JSON response parsing for all API endpoints.
+        This is a generic method that handles request construction and authentication for all
+        API endpoints; the transport sends it and checks and parses the response.
 
         Args:
             method (str): HTTP method ('GET', 'POST', 'DELETE', etc.).
@@ -151,8 +276,9 @@ class FuturesApiClient:
             Any: Parsed JSON response from the API.
 
         Raises:
-            TimeoutError: If the request exceeds the specified timeout duration.
-            ConnectionError: For network or HTTP errors with additional error context.
+            RequestTimeout: If the request exceeds the specified timeout duration (a TimeoutError).
+            HTTPStatusError: For HTTP error statuses (ClientError, RateLimitedError or ServerError).
+            TransportError: For network errors. Both are ConnectionErrors with additional error context.
 
         Example:
             response = client._request("GET", "/public/system/time")
@@ -161,33 +287,145 @@ class FuturesApiClient:
         cleaned_params = {k: v for k, v in params.items() if v is not None} if params else None
         cleaned_data = {k: v for k, v in data.items() if v is not None} if data else None
 
-        # Retrieve necessary headers for the request.
-        headers = self._get_headers(method, endpoint, cleaned_params, cleaned_data)
-        url = f"{self.base_url}{endpoint}"  # Build the complete URL.
-
-        try:
-            # Send the HTTP request using the session.
-            response = self.http_session.request(
-                method=method,
-                url=url,
-                params=cleaned_params,
-                json=cleaned_data,
-                headers=headers,
-                timeout=self.timeout_seconds
-            )
-            # Raise an exception for HTTP error statuses.
-            response.raise_for_status()
-            return response.json()  # Return the parsed JSON response.
-        except requests.exceptions.Timeout as e:
-            raise TimeoutError(f"Request timed out after {self.timeout_seconds} seconds: {url}") from e
-        except requests.exceptions.RequestException as e:
-            error_detail = ""
-            if e.response is not None:
+        result = self.transport.request(
+            method,
+            f"{self.base_url}{endpoint}",  # Build the complete URL.
+            endpoint,
+            params=cleaned_params,
+            json_body=cleaned_data,
+            # Called by the transport just before sending, after the rate-limiter wait, so the timestamp is fresh.
+            sign=lambda: self._get_headers(method, endpoint, cleaned_params, cleaned_data),
+            timeout=self.timeout_for(method, endpoint),
+            rate_limiter=self.rate_limiter,
+            metrics=self.metrics,
+            tracer=self.tracer,
+            circuit_breaker=self.circuit_breaker,
+            hedging=self.hedging
+        )
+
+        # Let listeners know our account state changed (orders, margin, leverage, positions).
+        if self._mutation_listeners and method.upper() != 'GET' and AuthUtils.is_private_endpoint(endpoint):
+            for listener in list(self._mutation_listeners):
+                listener(method, endpoint)
+        return result
+
+    def timeout_for(self, method: str, endpoint: str) -> float:
+        """
+        Timeout in seconds used for a request: its endpoint class's entry in timeout_classes,
+        or the client's timeout for endpoints without a class.
+        """
+        return self.timeout_classes.get(timeouts.timeout_class(method.upper(), endpoint), self.timeout_seconds)
+
+    @staticmethod
+    def deadline(seconds: float) -> ContextManager[Optional[float]]:
+        """
+        Bound every request made by the current thread inside the block to finish within `seconds`.
+
+        Rate-limit queueing and the network call share the remaining time, and a request that
+        cannot finish in time raises DeadlineExceeded (a RequestTimeout) instead of being sent late.
+        Batch calls started inside the block carry the deadline into their worker threads. This is
+        utils.timeouts.deadline: it applies to every client on the thread, not just this one.
+
+        Args:
+            seconds (float): Time budget for the block.
+
+        Example:
+            with client.deadline(2.0):
+                client.cancel_order({"clientOrderId": "order123"})
+        """
+        return timeouts.deadline(seconds)
+
+    def add_mutation_listener(self, callback: Callable[[str, str], None]) -> None:
+        """
+        Register a callback invoked after every successful private non-GET request.
+
+        Such requests (orders, margin, leverage, position closes) change account state,
+        so caches of balances or positions can use this to refresh.
+
+        Args:
+            callback (Callable[[str, str], None]): Called with the HTTP method and endpoint path.
+        """
+        self._mutation_listeners.append(callback)
+
+    def remove_mutation_listener(self, callback: Callable[[str, str], None]) -> None:
+        """
+        Unregister a callback added with add_mutation_listener.
+        """
+        self._mutation_listeners.remove(callback)
+
+    def prewarm(self, connections: int = 4, ping: bool = True) -> PrewarmResult:
+        """
+        Open pooled connections to the API host ahead of time, so the first order does not pay for
+        DNS, TCP and TLS setup.
+
+        Connections are opened in parallel without sending requests; pooled connections the server
+        has closed are detected and reopened. The count is capped at the transport's pool size
+        (10 unless the Transport was built with a larger pool_maxsize).
+
+        Args:
+            connections (int): Connections to have open, e.g. the number of orders sent at once.
+            ping (bool): Also call get_system_time to check the API answers end to end. This spends
+                one rate-limit slot.
+
+        Returns:
+            PrewarmResult: Connections opened, reused and failed, and the ping round trip.
+
+        Example:
+            client = FuturesApiClient(api_key="your_api_key", secret_key="your_secret_key")
+            client.prewarm(connections=4)
+            client.start_keepalive(interval=30)
+        """
+        result = self.transport.prewarm(self.base_url, connections, timeout=self.timeout_seconds)
+        # Prepare the order request template now rather than on the first create_order_fast().
+        self.transport.template('POST', self._order_endpoint.url)
+        if ping:
+            started = time.perf_counter()
+            try:
+                self.get_system_time()
+                result['pingMs'] = (time.perf_counter() - started) * 1000
+            except ZebpayError as e:
+                result['errors'].append(f"{type(e).__name__}: {e}")
+            result['latencyMs'] += (time.perf_counter() - started) * 1000
+        return result
+
+    def start_keepalive(self, interval: float = 30.0, connections: int = 4) -> None:
+        """
+        Keep pooled connections warm from a background thread until stop_keepalive() is called.
+
+        Every `interval` seconds the thread reopens pooled connections the server has dropped and,
+        if no request went through the transport during the interval, pings get_system_time so the
+        connection the next request takes was just used. Choose an interval below the server's idle
+        connection timeout. Errors are ignored; pings appear in client.metrics like other requests.
+
+        Args:
+            interval (float): Seconds between checks.
+            connections (int): Connections to keep open (see prewarm()).
+        """
+        self.stop_keepalive()
+        stop = threading.Event()
+
+        def run() -> None:
+            while not stop.wait(interval):
+                idle = time.monotonic() - self.transport.last_request >= interval
                 try:
-                    error_detail = e.response.json()
-                except json.JSONDecodeError:
-                    error_detail = e.response.text
-            raise ConnectionError(f"API Request Error: {e}. URL: {url}. Detail: {error_detail}") from e
+                    self.prewarm(connections, ping=idle)
+                except Exception:
+                    pass  # Closed transport or similar; try again next interval.
+
+        thread = threading.Thread(target=run, name='zebpay-keepalive', daemon=True)
+        self._keepalive = (thread, stop)
+        thread.start()
+
+    def stop_keepalive(self) -> None:
+        """
+        Stop the background keep-alive started by start_keepalive(), if any.
+        """
+        keepalive, self._keepalive = self._keepalive, None
+        if keepalive is not None:
+            thread, stop = keepalive
+            stop.set()
+            if thread is not threading.current_thread():
+                thread.join()
 
     @staticmethod
     def _normalize_string(value: Optional[str]) -> Optional[str]:
@@ -205,6 +443,61 @@ class FuturesApiClient:
         """
         return value.upper() if isinstance(value, str) else value
 
+    @staticmethod
+    def _run_batch(
+        operation: Callable[[Dict[str, Any]], Any],
+        items: List[Dict[str, Any]],
+        max_workers: int
+    ) -> BatchResult:
+        """
+        Run an operation over a list of request parameters concurrently.
+
+        Requests are dispatched on a thread pool and still pass through the client's
+        rate limiter. Errors are captured per item instead of aborting the batch. The caller's
+        deadline applies to every item; items not yet sent when it passes fail with DeadlineExceeded.
+
+        Args:
+            operation (Callable[[Dict[str, Any]], Any]): Client method to invoke for each item.
+            items (List[Dict[str, Any]]): Request parameters, one dictionary per call.
+            max_workers (int): Maximum number of requests in flight at once.
+
+        Returns:
+            BatchResult: Per-item results in input order and end-to-end batch latency.
+        """
+        expires = timeouts.current_deadline()
+
+        def run_one(index: int, item: Dict[str, Any]) -> BatchItemResult:
+            started = time.perf_counter()
+            response, error = None, None
+            try:
+                with timeouts.deadline_at(expires):
+                    response = operation(item)
+            except Exception as e:
+                error = e
+            return {
+                'index': index,
+                'request': item,
+                'response': response,
+                'error': error,
+                'latencyMs': (time.perf_counter() - started) * 1000
+            }
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        batch_started = time.perf_counter()
+        results: List[BatchItemResult] = []
+        if items:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+                # map() yields results in submission order regardless of completion order.
+                results = list(executor.map(run_one, range(len(items)), items))
+        failed = sum(1 for result in results if result['error'] is not None)
+        return {
+            'results': results,
+            'succeeded': len(results) - failed,
+            'failed': failed,
+            'latencyMs': (time.perf_counter() - batch_started) * 1000
+        }
+
     # ------------------- MARKET DATA ENDPOINTS (PUBLIC) -------------------
     def fetch_markets(self) -> ApiResponse[MarketsData]:
         """
@@ -384,7 +677,7 @@ class FuturesApiClient:
         if not symbol:
             raise ValueError('Symbol is required')
         symbol = self._normalize_string(symbol)
-        endpoint = config.get_endpoint(['public', 'exchange', 'trade_fee'])
+        endpoint = config.get_endpoint(['public', 'exchange', 'tradefee'])
         return self._request('GET', endpoint, params={'symbol': symbol})
 
     def get_trade_fees(self) -> ApiResponse[List[Dict[str, Any]]]:
@@ -397,7 +690,7 @@ class FuturesApiClient:
         Example:
             fees = client.get_trade_fees()
         """
-        endpoint = config.get_endpoint(['public', 'exchange', 'trade_fees'])
+        endpoint = config.get_endpoint(['public', 'exchange', 'tradefees'])
         return self._request('GET', endpoint)
 
     def get_exchange_info(self) -> ApiResponse[ExchangeInfo]:
@@ -462,6 +755,7 @@ class FuturesApiClient:
 
         Raises:
             ValueError: If required parameters are missing or invalid.
+            OrderValidationError: If a validator is configured and the order breaks the symbol's rules.
 
         Example:
             order_details = client.create_order({
@@ -485,9 +779,91 @@ class FuturesApiClient:
             raise ValueError('Price is required for LIMIT orders')
         if order_params.get('price') is not None and order_params['price'] <= 0:
             raise ValueError('Price must be positive for LIMIT orders')
+        if self.validator:
+            self.validator.validate_order(order_params)
         endpoint = config.get_endpoint(['private', 'trade', 'order'])
         return self._request('POST', endpoint, data=order_params)
 
+    def create_order_fast(
+        self,
+        symbol: str,
+        side: str,
+        amount: float,
+        price: Optional[float] = None,
+        order_type: str = 'LIMIT',
+        margin_asset: str = 'USDT',
+        **extra: Any
+    ) -> ApiResponse[CreateOrderResponseData]:
+        """
+        Create an order with the least client-side work per request.
+
+        Sends the same request as create_order, with the same checks, validator, circuit breaker,
+        rate limiter, metrics and mutation listeners, but skips the generic request path: the URL,
+        private flag and static headers come from the table built at construction, the body is
+        serialized once and reused for the signature, the HMAC key state is precomputed, and the
+        request is copied from a prepared template instead of being rebuilt by requests (see
+        Transport.template). Run benchmarks/order_overhead.py to compare both paths.
+
+        Args:
+            symbol (str): Trading symbol (e.g., 'BTCUSDT'); normalized to uppercase.
+            side (str): 'BUY' or 'SELL'; normalized to uppercase.
+            amount (float): Quantity to trade.
+            price (Optional[float]): Limit price; required for LIMIT orders and must be positive.
+            order_type (str): Order type ('MARKET' or 'LIMIT'); normalized to uppercase.
+            margin_asset (str): Asset for margin; normalized to uppercase.
+            **extra (Any): Further order fields, e.g. stopLossPrice or takeProfitPrice. None values are dropped.
+
+        Returns:
+            ApiResponse[CreateOrderResponseData]: Details of the created order.
+
+        Raises:
+            ValueError: If the price is missing or invalid, or a value cannot be sent as JSON (e.g. NaN).
+            OrderValidationError: If a validator is configured and the order breaks the symbol's rules.
+
+        Example:
+            client.prewarm()  # Also prepares the order request template.
+            order_details = client.create_order_fast("BTCUSDT", "BUY", 0.5, price=30000)
+        """
+        order_type = order_type.upper()
+        if order_type == 'LIMIT' and price is None:
+            raise ValueError('Price is required for LIMIT orders')
+        if price is not None and price <= 0:
+            raise ValueError('Price must be positive for LIMIT orders')
+        order = {
+            'symbol': symbol.upper(),
+            'amount': amount,
+            'side': side.upper(),
+            'type': order_type,
+            'marginAsset': margin_asset.upper()
+        }
+        if price is not None:
+            order['price'] = price
+        for key, value in extra.items():
+            if value is not None:
+                order[key] = value
+        if self.validator:
+            self.validator.validate_order(order)
+
+        endpoint = self._order_endpoint
+        # Serialized as requests would (json=...), so the bytes on the wire match create_order.
+        body = json.dumps(order, allow_nan=False)
+        result = self.transport.request(
+            'POST',
+            endpoint.url,
+            endpoint.path,
+            sign=lambda: self._sign_body(endpoint, body),
+            timeout=self.timeout_for('POST', endpoint.path),
+            rate_limiter=self.rate_limiter,
+            metrics=self.metrics,
+            tracer=self.tracer,
+            circuit_breaker=self.circuit_breaker,
+            template=self.transport.template('POST', endpoint.url),
+            body=body.encode('utf-8')
+        )
+        for listener in list(self._mutation_listeners):
+            listener('POST', endpoint.path)
+        return result
+
     def cancel_order(self, cancel_params: Dict[str, Any]) -> ApiResponse[CancelOrderResponseData]:
         """
         Cancel an existing order based on the provided parameters.
@@ -517,6 +893,152 @@ class FuturesApiClient:
         endpoint = config.get_endpoint(['private', 'trade', 'order'])
         return self._request('DELETE', endpoint, data=cancel_params)
 
+    def create_orders(
+        self,
+        orders: List[Dict[str, Any]],
+        max_workers: int = config.BATCH_MAX_WORKERS
+    ) -> BatchResult:
+        """
+        Create several orders concurrently.
+
+        Each order is submitted through create_order, so the same validation and
+        normalization apply. A failing order does not stop the rest of the batch.
+
+        Args:
+            orders (List[Dict[str, Any]]): Order parameter dictionaries, as accepted by create_order.
+            max_workers (int): Maximum number of orders in flight at once.
+
+        Returns:
+            BatchResult: Per-order responses and errors in input order, plus batch latency.
+
+        Example:
+            batch = client.create_orders([
+                {"symbol": "BTCUSDT", "amount": 0.001, "side": "BUY", "type": "LIMIT", "marginAsset": "USDT", "price": 29000},
+                {"symbol": "BTCUSDT", "amount": 0.001, "side": "BUY", "type": "LIMIT", "marginAsset": "USDT", "price": 28900}
+            ])
+            print(batch["succeeded"], batch["failed"], batch["latencyMs"])
+        """
+        return self._run_batch(self.create_order, orders, max_workers)
+
+    def cancel_orders(
+        self,
+        cancels: List[Dict[str, Any]],
+        max_workers: int = config.BATCH_MAX_WORKERS
+    ) -> BatchResult:
+        """
+        Cancel several orders concurrently.
+
+        Args:
+            cancels (List[Dict[str, Any]]): Cancellation parameter dictionaries, as accepted by cancel_order.
+            max_workers (int): Maximum number of cancellations in flight at once.
+
+        Returns:
+            BatchResult: Per-order responses and errors in input order, plus batch latency.
+
+        Example:
+            batch = client.cancel_orders([
+                {"clientOrderId": "order123"},
+                {"clientOrderId": "order124"}
+            ])
+        """
+        return self._run_batch(self.cancel_order, cancels, max_workers)
+
+    @property
+    def submitter(self) -> OrderSubmitter:
+        """
+        The worker pool behind submit(), submit_order() and submit_cancel(), started on first use
+        with config.BATCH_MAX_WORKERS workers. Use it to cancel queued calls or to close the pool:
+
+            client.submitter.cancel_pending("BTCUSDT")
+            client.submitter.close()
+        """
+        if self._submitter is None:
+            with self._submitter_lock:
+                if self._submitter is None:
+                    from zebpay_core.submission import OrderSubmitter
+                    self._submitter = OrderSubmitter()
+        return self._submitter
+
+    def submit(
+        self,
+        operation: Callable[..., Any],
+        *args: Any,
+        key: Optional[str] = None,
+        callback: Optional[Callable[[Future], Any]] = None,
+        **kwargs: Any
+    ) -> Future:
+        """
+        Run a client call on the submission pool and return its handle without waiting.
+
+        Args:
+            operation (Callable[..., Any]): Bound client method, e.g. client.edit_order.
+            key (Optional[str]): Ordering key; calls with the same key complete in submission order.
+            callback (Optional[Callable[[Future], Any]]): Called with the handle once the call is done.
+
+        Returns:
+            Future: Resolves to the call's response or raises its exception. cancel() succeeds
+            (returns True) while the request is still queued and has not been sent.
+
+        Example:
+            handle = client.submit(client.edit_order, {"clientOrderId": "order123", "price": 29100}, key="BTCUSDT")
+        """
+        return self.submitter.submit(operation, *args, key=key, callback=callback, **kwargs)
+
+    def submit_order(
+        self,
+        order_params: Dict[str, Any],
+        callback: Optional[Callable[[Future], Any]] = None
+    ) -> Future:
+        """
+        Place an order through create_order without waiting for the response.
+
+        Orders and cancels for the same symbol are sent one at a time in submission order, so
+        their handles complete in that order; other symbols are sent in parallel. Validation
+        errors are reported through the handle like API errors.
+
+        Args:
+            order_params (Dict[str, Any]): Order parameters, as accepted by create_order. Copied, so
+                the caller may reuse the dictionary.
+            callback (Optional[Callable[[Future], Any]]): Called with the handle once the order is done.
+
+        Returns:
+            Future: Resolves to the create_order response.
+
+        Example:
+            handle = client.submit_order(
+                {"symbol": "BTCUSDT", "amount": 0.001, "side": "BUY", "type": "LIMIT", "marginAsset": "USDT", "price": 29000},
+                callback=lambda h: print(h.exception() or h.result()["data"]["clientOrderId"])
+            )
+            ...
+            if handle.cancel():
+                print("never sent")
+        """
+        order_params = dict(order_params)
+        key = self._normalize_string(order_params['symbol']) if order_params.get('symbol') else None
+        return self.submitter.submit(self.create_order, order_params, key=key, callback=callback)
+
+    def submit_cancel(
+        self,
+        cancel_params: Dict[str, Any],
+        callback: Optional[Callable[[Future], Any]] = None
+    ) -> Future:
+        """
+        Cancel an order through cancel_order without waiting for the response.
+
+        Give the symbol so the cancel is ordered after orders submitted for it with submit_order;
+        without one it is sent independently.
+
+        Args:
+            cancel_params (Dict[str, Any]): Cancellation parameters, as accepted by cancel_order.
+            callback (Optional[Callable[[Future], Any]]): Called with the handle once the cancel is done.
+
+        Returns:
+            Future: Resolves to the cancel_order response.
+        """
+        cancel_params = dict(cancel_params)
+        key = self._normalize_string(cancel_params['symbol']) if cancel_params.get('symbol') else None
+        return self.submitter.submit(self.cancel_order, cancel_params, key=key, callback=callback)
+
     def edit_order(self, order_params: Dict[str, Any]) -> ApiResponse[Any]:
         """
         Edit an existing open order.
@@ -529,6 +1051,7 @@ class FuturesApiClient:
                   - price: The new price for the order.
                   - amount: The new quantity for the order.
                   - triggerPrice: The new trigger price for stop or take-profit orders.
+                  - symbol: Trading symbol; lets a configured validator check the new price and amount.
 
         Returns:
             ApiResponse[Any]: Confirmation of the edit request.
@@ -545,6 +1068,12 @@ class FuturesApiClient:
         """
         if 'clientOrderId' not in order_params:
             raise ValueError('Client order ID (clientOrderId) is required')
+        # The new price and amount can only be checked when the symbol is supplied.
+        if self.validator and order_params.get('symbol'):
+            order_params['symbol'] = self._normalize_string(order_params['symbol'])
+            self.validator.validate(
+                order_params['symbol'], price=order_params.get('price'), amount=order_params.get('amount')
+            )
         endpoint = config.get_endpoint(['private', 'trade', 'order'])
         return self._request('PATCH', endpoint, data=order_params)
 
@@ -839,6 +1368,8 @@ class FuturesApiClient:
         if 'symbol' not in leverage_params or 'leverage' not in leverage_params:
             raise ValueError('Symbol and leverage are required')
         leverage_params['symbol'] = self._normalize_string(leverage_params['symbol'])
+        if self.validator:
+            self.validator.validate_leverage(leverage_params['symbol'], leverage_params['leverage'])
         endpoint = config.get_endpoint(['private', 'trade', 'update_leverage'])
         return self._request('POST', endpoint, data=leverage_params)
 
@@ -0,0 +1,268 @@
+"""
+    Multi-account client pool
+    Many API keys over one shared connection pool, with an independent rate budget per key
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional
+import threading
+import time
+
+from zebpay_core.deadlines import current_deadline, deadline_at
+from zebpay_core.metrics import ClientMetrics
+from zebpay_core.transport import Transport
+
+from utils import config
+from .client import FuturesApiClient
+
+if TYPE_CHECKING:
+    from zebpay_core.rate_limiter import RateLimiter
+    from zebpay_core.tracing import Tracer
+    from zebpay_core.validator import OrderValidator
+
+    from utils.types import AccountResult, ScatterResult
+
+
+class ClientPool:
+    """
+    Holds one FuturesApiClient per account and runs calls across accounts concurrently.
+
+    All clients send through a single Transport, so requests for different accounts reuse
+    the same keep-alive connections to the exchange instead of opening a pool each.
+    Every account keeps its own RateLimiter: a burst on one key never spends another key's
+    budget, and a throttled key only delays its own requests. Request metrics from all
+    accounts are aggregated in one ClientMetrics registry (pool.metrics).
+    """
+
+    def __init__(
+        self,
+        accounts: Optional[Dict[str, Dict[str, str]]] = None,
+        timeout: int = 30,
+        base_url: str = config.BASE_URL,
+        rate_limit: Optional[Dict[str, Any]] = None,
+        max_workers: int = 32,
+        validator: Optional[OrderValidator] = None,
+        metrics: Optional[ClientMetrics] = None,
+        tracer: Optional[Tracer] = None,
+        transport: Optional[Transport] = None,
+        timeout_classes: Optional[Dict[str, float]] = None
+    ) -> None:
+        """
+        Args:
+            accounts (Optional[Dict[str, Dict[str, str]]]): Initial credentials keyed by account id. Each value
+                holds either 'jwt' or 'api_key' and 'secret_key'.
+            timeout (int): Longest request timeout in seconds for every client (see FuturesApiClient).
+            base_url (str): Base URL for the API (default is configured in utils.config).
+            rate_limit (Optional[Dict[str, Any]]): Per-key budget as RateLimiter arguments
+                (default: config.RATE_LIMIT).
+            max_workers (int): Maximum requests in flight for scatter-gather calls. Also sizes the shared
+                connection pool, so concurrent calls never discard connections.
+            validator (Optional[OrderValidator]): Pre-trade validator shared by every client.
+            metrics (Optional[ClientMetrics]): Registry for all accounts' requests (default: a new one).
+            tracer (Optional[Tracer]): Request tracer shared by every client.
+            transport (Optional[Transport]): Existing transport to send through, e.g. one also used by a
+                SpotClient (default: a new one sized for max_workers, closed by close()).
+            timeout_classes (Optional[Dict[str, float]]): Per-class timeouts for every client, e.g.
+                config.TIMEOUT_CLASSES (default: none, every request uses the client timeout).
+
+        Example:
+            pool = ClientPool({
+                "desk-1": {"api_key": "k1", "secret_key": "s1"},
+                "desk-2": {"api_key": "k2", "secret_key": "s2"},
+            })
+            balances = pool.get_balance_all()
+        """
+        self.timeout = timeout
+        self.timeout_classes = timeout_classes
+        self.base_url = base_url
+        self.rate_limit = dict(rate_limit or config.RATE_LIMIT)
+        self.max_workers = max_workers
+        self.validator = validator
+        self.metrics = metrics or (transport.metrics if transport else ClientMetrics())
+        self.tracer = tracer or (transport.tracer if transport else None)
+        # The pool size matches max_workers, so concurrent calls never discard connections.
+        self._owns_transport = transport is None
+        self.transport = transport or Transport(pool_maxsize=max_workers, metrics=self.metrics, tracer=tracer)
+        self.session = self.transport.session
+
+        self._clients: Dict[str, FuturesApiClient] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        for account_id, credentials in (accounts or {}).items():
+            self.add_account(account_id, **credentials)
+
+    def add_account(
+        self,
+        account_id: str,
+        jwt: Optional[str] = None,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ) -> FuturesApiClient:
+        """
+        Add (or replace) an account.
+
+        Args:
+            account_id (str): Name used to address the account in results.
+            jwt (Optional[str]): JWT authentication token.
+            api_key (Optional[str]): API key for authentication.
+            secret_key (Optional[str]): Secret key for API key authentication.
+            rate_limiter (Optional[RateLimiter]): Budget for this key (default: the transport's limiter for this
+                key, created from rate_limit).
+
+        Returns:
+            FuturesApiClient: The account's client, sharing the pool's transport.
+
+        Raises:
+            ValueError: If authentication credentials are missing.
+        """
+        if rate_limiter is None:
+            rate_limiter = self.transport.rate_limiter((self.base_url, jwt or api_key), **self.rate_limit)
+        client = FuturesApiClient(
+            jwt=jwt,
+            api_key=api_key,
+            secret_key=secret_key,
+            timeout=self.timeout,
+            base_url=self.base_url,
+            rate_limiter=rate_limiter,
+            validator=self.validator,
+            metrics=self.metrics,
+            tracer=self.tracer,
+            transport=self.transport,
+            timeout_classes=self.timeout_classes
+        )
+        with self._lock:
+            self._clients[account_id] = client
+        return client
+
+    def remove_account(self, account_id: str) -> None:
+        """
+        Remove an account. Raises KeyError if it is not in the pool.
+        """
+        with self._lock:
+            del self._clients[account_id]
+
+    def __getitem__(self, account_id: str) -> FuturesApiClient:
+        return self._clients[account_id]
+
+    def __contains__(self, account_id: object) -> bool:
+        return account_id in self._clients
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._clients))
+
+    @property
+    def account_ids(self) -> List[str]:
+        return list(self._clients)
+
+    def scatter(
+        self,
+        operation: Callable[[FuturesApiClient], Any],
+        account_ids: Optional[Iterable[str]] = None
+    ) -> ScatterResult:
+        """
+        Run an operation once per account concurrently and gather the results.
+
+        Each call passes through its own account's rate limiter. Errors are captured per account
+        instead of aborting the call.
+
+        Args:
+            operation (Callable[[FuturesApiClient], Any]): Called with each account's client.
+            account_ids (Optional[Iterable[str]]): Accounts to include (default: all).
+
+        Returns:
+            ScatterResult: Per-account results keyed by account id, and end-to-end latency.
+
+        Raises:
+            KeyError: If an account id is not in the pool.
+
+        Example:
+            result = pool.scatter(lambda client: client.get_open_orders("BTCUSDT"))
+            for account_id, outcome in result["results"].items():
+                ...
+        """
+        with self._lock:
+            ids = list(self._clients) if account_ids is None else list(account_ids)
+            targets = [(account_id, self._clients[account_id]) for account_id in ids]
+
+        # Workers run the calls under the caller's deadline, if any.
+        expires = current_deadline()
+
+        def run_one(client: FuturesApiClient) -> AccountResult:
+            started = time.perf_counter()
+            response, error = None, None
+            try:
+                with deadline_at(expires):
+                    response = operation(client)
+            except Exception as e:
+                error = e
+            return {'response': response, 'error': error, 'latencyMs': (time.perf_counter() - started) * 1000}
+
+        started = time.perf_counter()
+        executor = self._get_executor()
+        futures = [(account_id, executor.submit(run_one, client)) for account_id, client in targets]
+        results: Dict[str, AccountResult] = {account_id: future.result() for account_id, future in futures}
+        failed = sum(1 for result in results.values() if result['error'] is not None)
+        return {
+            'results': results,
+            'succeeded': len(results) - failed,
+            'failed': failed,
+            'latencyMs': (time.perf_counter() - started) * 1000
+        }
+
+    def call_all(self, method: str, *args: Any, account_ids: Optional[Iterable[str]] = None,
+                 **kwargs: Any) -> ScatterResult:
+        """
+        Call a FuturesApiClient method by name for every account.
+
+        Example:
+            pool.call_all("get_positions", symbols=["BTCUSDT"], status="OPEN")
+        """
+        return self.scatter(lambda client: getattr(client, method)(*args, **kwargs), account_ids)
+
+    def get_balance_all(self, account_ids: Optional[Iterable[str]] = None) -> ScatterResult:
+        """
+        Fetch the wallet balance of every account.
+        """
+        return self.scatter(lambda client: client.get_balance(), account_ids)
+
+    def get_positions_all(self, account_ids: Optional[Iterable[str]] = None, **filters: Any) -> ScatterResult:
+        """
+        Fetch positions of every account; keyword filters are passed to get_positions().
+        """
+        return self.scatter(lambda client: client.get_positions(**filters), account_ids)
+
+    def get_open_orders_all(self, symbol: str, account_ids: Optional[Iterable[str]] = None) -> ScatterResult:
+        """
+        Fetch open orders for a symbol in every account.
+        """
+        return self.scatter(lambda client: client.get_open_orders(symbol), account_ids)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='zebpay-pool')
+            return self._executor
+
+    def close(self) -> None:
+        """
+        Stop the worker threads and close the shared connections, unless the transport was passed in.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self) -> 'ClientPool':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,270 @@
+"""
+    Emergency kill switch
+    Cancels every open order and closes every open position across futures and spot
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+import time
+
+from zebpay_core.rate_limiter import PRIORITY_CRITICAL
+
+if TYPE_CHECKING:
+    from .client import FuturesApiClient
+    from utils.types import KillSwitchAction, KillSwitchReport, Position
+
+
+class KillSwitch:
+    """
+    Flattens all exposure as fast as the rate limit allows.
+
+    A run issues, concurrently and at critical rate-limiter priority:
+      1. Futures cancel_all_orders, the open-positions lookup and a spot cancel_all_orders
+         per spot symbol (or, without configured symbols, the spot trading-pairs lookup).
+      2. A close_position for every open position as soon as the lookup returns, and an
+         ACTIVE-orders lookup per spot pair as soon as the pairs arrive.
+      3. A spot cancel_all_orders for each pair found with active orders.
+    An optional verification pass then re-reads positions and every page of each cancelled
+    pair's active spot orders. Everything, verification included, runs within the trigger's
+    deadline. A failed request, or a position that cannot be closed, is reported as a failed
+    action and does not stop the rest of the run.
+    """
+    # Spot orders read per page during verification.
+    spot_page_size = 100
+
+    def __init__(
+        self,
+        futures_client: FuturesApiClient,
+        spot_client: Optional[Any] = None,
+        spot_symbols: Optional[List[str]] = None,
+        max_workers: int = 16
+    ) -> None:
+        """
+        Args:
+            futures_client (FuturesApiClient): Client used for futures orders and positions.
+            spot_client (Optional[Any]): Optional SpotClient whose orders should also be cancelled.
+            spot_symbols (Optional[List[str]]): Spot symbols to cancel. When omitted and a spot client
+                is given, each run lists the trading pairs and cancels the ones with at least one
+                ACTIVE order. cancel_all_orders clears a whole pair, so one order is enough to find it.
+            max_workers (int): Maximum number of requests in flight at once.
+
+        Example:
+            kill_switch = KillSwitch(futures_client, spot_client, spot_symbols=["BTC-INR", "ETH-INR"])
+            report = kill_switch.trigger(deadline=5.0)
+            print("Flat:", report["flat"])
+        """
+        self.futures_client = futures_client
+        self.spot_client = spot_client
+        self.spot_symbols = spot_symbols
+        self.max_workers = max_workers
+
+    @staticmethod
+    def _critical(client: Any, operation: Callable[..., Any], *args: Any, expires: Optional[float] = None) -> Any:
+        """
+        Invoke a client method with critical priority on that client's rate limiter, and with the
+        run's deadline (a time.monotonic() value) when the client supports deadlines.
+        """
+        scope = nullcontext()
+        if expires is not None and hasattr(client, 'deadline'):
+            # Requests still queued at the deadline are dropped instead of being sent late.
+            scope = client.deadline(expires - time.monotonic())
+        limiter = getattr(client, 'rate_limiter', None)
+        with scope:
+            if limiter is None or not hasattr(limiter, 'priority'):
+                return operation(*args)
+            with limiter.priority(PRIORITY_CRITICAL):
+                return operation(*args)
+
+    @staticmethod
+    def _extract_list(response: Any, key: str) -> List[Any]:
+        """
+        Pull a list out of an API response whose data is either a list or a dict holding `key`.
+        """
+        data = response.get('data') if isinstance(response, dict) else response
+        if isinstance(data, dict):
+            data = data.get(key)
+        return data if isinstance(data, list) else []
+
+    @staticmethod
+    def _position_id(position: Dict[str, Any]) -> Optional[str]:
+        """
+        The position's ID from `id`, `positionId` or the raw `info` payload, or None if it has none.
+        """
+        info = position.get('info') if isinstance(position.get('info'), dict) else {}
+        for source in (position, info):
+            for key in ('id', 'positionId'):
+                if source.get(key):
+                    return str(source[key])
+        return None
+
+    def _spot_open_orders(self, symbol: str) -> List[Dict[str, Any]]:
+        """
+        Every ACTIVE spot order of `symbol`, read page by page until a short page (or one with
+        nothing new, should the server ignore currentPage).
+        """
+        orders: Dict[str, Dict[str, Any]] = {}
+        page = 1
+        while True:
+            items = self._extract_list(
+                self.spot_client.get_orders(symbol, 'ACTIVE', page, self.spot_page_size), 'items'
+            )
+            added = 0
+            for order in items:
+                key = str(order.get('orderId'))
+                if key not in orders:
+                    orders[key] = order
+                    added += 1
+            if not added or len(items) < self.spot_page_size:
+                return list(orders.values())
+            page += 1
+
+    def trigger(self, deadline: float = 5.0, verify: bool = True) -> KillSwitchReport:
+        """
+        Cancel all orders and close all positions, then optionally verify the account is flat.
+
+        Args:
+            deadline (float): Seconds allowed for the whole run: spot order discovery, cancels and
+                closes, and verification. Requests still outstanding at the deadline are abandoned
+                and reported with a TimeoutError; clients that support deadlines also stop them from
+                being sent late. If verification cannot finish in time, `flat` is None.
+            verify (bool): Whether to re-read positions and spot orders afterwards.
+
+        Returns:
+            KillSwitchReport: Every action taken, and what (if anything) is still open.
+
+        Example:
+            report = KillSwitch(client).trigger(deadline=3.0)
+            for action in report["actions"]:
+                if action["error"]:
+                    print("Failed:", action["action"], action["target"], action["error"])
+        """
+        started = time.monotonic()
+        deadline_at = started + deadline
+        actions: List[KillSwitchAction] = []
+        pending: Dict[Future, Tuple[str, Optional[str]]] = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        def submit(action: str, target: Optional[str], client: Any, operation: Callable[..., Any], *args: Any) -> Future:
+            future = executor.submit(self._critical, client, operation, *args, expires=deadline_at)
+            pending[future] = (action, target)
+            return future
+
+        def record(action: str, target: Optional[str], response: Any, error: Optional[Exception]) -> None:
+            actions.append({
+                'action': action,
+                'target': target,
+                'response': response,
+                'error': error,
+                'latencyMs': (time.monotonic() - started) * 1000
+            })
+
+        try:
+            # Round one: everything that does not depend on another response.
+            submit('cancel_futures_orders', None, self.futures_client, self.futures_client.cancel_all_orders)
+            positions_lookup = submit('get_positions', None, self.futures_client, self.futures_client.get_positions,
+                                      None, 'OPEN')
+            pairs_lookup = None
+            if self.spot_client is not None:
+                if self.spot_symbols is not None:
+                    for symbol in self.spot_symbols:
+                        submit('cancel_spot_orders', symbol, self.spot_client, self.spot_client.cancel_all_orders, symbol)
+                else:
+                    pairs_lookup = submit('get_trading_pairs', None, self.spot_client, self.spot_client.get_trading_pairs)
+
+            # Drain completions until the deadline; each follow-up is issued the moment its lookup returns.
+            while pending:
+                remaining = deadline_at - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, _ = wait(list(pending), timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    action, target = pending.pop(future)
+                    error = future.exception()
+                    response = None if error else future.result()
+                    if error or action not in ('get_positions', 'get_trading_pairs', 'get_spot_orders'):
+                        # Cancels and closes are always reported; lookups only when they fail.
+                        record(action, target, response, error)
+                    elif future is positions_lookup:
+                        for position in self._extract_list(response, 'items'):
+                            if not isinstance(position, dict):
+                                record('close_position', None, None, ValueError(f"Malformed position: {position!r}"))
+                                continue
+                            position_id = self._position_id(position)
+                            if position_id is None:
+                                # close_position needs the ID, and an opposite market order could open a new
+                                # position if this one is already gone, so report it for manual handling.
+                                target = ' '.join(str(position[key]) for key in ('symbol', 'side') if position.get(key))
+                                record('close_position', target or None, None,
+                                       ValueError(f"Position has no ID to close: {position!r}"))
+                                continue
+                            close_params = {'positionId': position_id}
+                            if position.get('symbol'):
+                                close_params['symbol'] = position['symbol']
+                            submit('close_position', position_id, self.futures_client,
+                                   self.futures_client.close_position, close_params)
+                    elif future is pairs_lookup:
+                        for pair in self._extract_list(response, 'symbols'):
+                            if isinstance(pair, dict) and pair.get('symbol'):
+                                # One ACTIVE order is enough to know the pair needs a cancel.
+                                submit('get_spot_orders', pair['symbol'], self.spot_client, self.spot_client.get_orders,
+                                       pair['symbol'], 'ACTIVE', 1, 1)
+                    elif self._extract_list(response, 'items'):
+                        submit('cancel_spot_orders', target, self.spot_client, self.spot_client.cancel_all_orders, target)
+
+            for action, target in pending.values():
+                record(action, target, None, TimeoutError(f"Kill switch deadline of {deadline}s exceeded"))
+        finally:
+            # Abandon anything still queued; in-flight requests finish in the background.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        report: KillSwitchReport = {
+            'actions': actions,
+            'flat': None,
+            'openPositions': [],
+            'openSpotOrders': {},
+            'latencyMs': 0.0
+        }
+        if verify:
+            self._verify(report, deadline_at)
+        report['latencyMs'] = (time.monotonic() - started) * 1000
+        return report
+
+    def _verify(self, report: KillSwitchReport, expires: float) -> None:
+        """
+        Re-read positions and every page of the cancelled pairs' ACTIVE spot orders concurrently,
+        before `expires` (a time.monotonic() value), and record what is still open.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            positions_lookup = executor.submit(
+                self._critical, self.futures_client, self.futures_client.get_positions, None, 'OPEN', expires=expires
+            )
+            spot_lookups: Dict[str, Future] = {}
+            if self.spot_client is not None:
+                symbols = {action['target'] for action in report['actions'] if action['action'] == 'cancel_spot_orders'}
+                for symbol in symbols:
+                    spot_lookups[symbol] = executor.submit(
+                        self._critical, self.spot_client, self._spot_open_orders, symbol, expires=expires
+                    )
+            _, not_done = wait([positions_lookup, *spot_lookups.values()], timeout=max(0.0, expires - time.monotonic()))
+            if not_done:
+                # Out of time; flat stays None.
+                return
+            try:
+                positions: List[Position] = self._extract_list(positions_lookup.result(), 'items')
+                open_spot_orders = {}
+                for symbol, lookup in spot_lookups.items():
+                    orders = lookup.result()
+                    if orders:
+                        open_spot_orders[symbol] = orders
+            except Exception:
+                # Verification is best effort; leave flat as None when it cannot be established.
+                return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        report['openPositions'] = positions
+        report['openSpotOrders'] = open_spot_orders
+        report['flat'] = not positions and not open_spot_orders
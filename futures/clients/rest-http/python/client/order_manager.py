@@ -0,0 +1,410 @@
+"""
+    Local order-state manager
+    Tracks orders from our own requests and reconciles them with one open-orders listing per symbol
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
+import threading
+import time
+
+from zebpay_core.transport import ClientError
+
+if TYPE_CHECKING:
+    from utils.types import OrderEvent, TrackedOrder
+
+# Statuses after which an order can no longer change.
+TERMINAL_STATUSES = frozenset({'FILLED', 'CANCELED', 'REJECTED', 'CLOSED'})
+
+# Exchange status strings (futures uses ccxt-style lowercase, spot uses uppercase) mapped to ours.
+_STATUS_MAP = {
+    'open': 'OPEN',
+    'new': 'OPEN',
+    'active': 'OPEN',
+    'partially_filled': 'PARTIALLY_FILLED',
+    'closed': 'FILLED',
+    'filled': 'FILLED',
+    'completed': 'FILLED',
+    'canceled': 'CANCELED',
+    'cancelled': 'CANCELED',
+    'expired': 'CANCELED',
+    'rejected': 'REJECTED',
+}
+
+
+class _FuturesOrderSource:
+    """
+    Reads order state from a FuturesApiClient.
+    """
+    id_field = 'clientOrderId'
+    # Bound on open-order pages read per symbol.
+    max_pages = 50
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    def fetch_open(self, symbol: str) -> List[Dict[str, Any]]:
+        # Open orders are paginated: each page's nextTimestamp is the `since` of the next one.
+        orders: Dict[str, Dict[str, Any]] = {}
+        since = None
+        for _ in range(self.max_pages):
+            response = self.client.get_open_orders(symbol, since=since)
+            added = _collect(orders, _items(response), self.id_field)
+            data = response.get('data') if isinstance(response, dict) else None
+            cursor = data.get('nextTimestamp') if isinstance(data, dict) else None
+            # Stop on the last page, or when the cursor or the page brings nothing new.
+            if not added or not cursor or cursor == since:
+                break
+            since = cursor
+        return list(orders.values())
+
+    def fetch_closed(self, missing: Dict[str, str]) -> List[Dict[str, Any]]:
+        # The history is paginated by time and an order can be arbitrarily old, so look each one up.
+        orders: List[Dict[str, Any]] = []
+        for order_id in missing:
+            try:
+                order = self.client.get_order(order_id).get('data')
+            except ClientError:
+                continue  # Unknown to the exchange; the caller marks it CLOSED.
+            if isinstance(order, dict):
+                orders.append(order)
+        return orders
+
+
+class _SpotOrderSource:
+    """
+    Reads order state from a SpotClient.
+    """
+    id_field = 'orderId'
+    closed_statuses = ('FILLED', 'CANCELLED')
+    page_size = 100
+    # Bound on history pages read per symbol and status while looking for missing orders.
+    max_pages = 20
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    def fetch_open(self, symbol: str) -> List[Dict[str, Any]]:
+        orders: Dict[str, Dict[str, Any]] = {}
+        page = 1
+        while True:
+            items = _items(self.client.get_orders(symbol, status='ACTIVE', current_page=page,
+                                                  page_size=self.page_size))
+            # A short page is the last; a page with nothing new means the server ignored currentPage.
+            if not _collect(orders, items, self.id_field) or len(items) < self.page_size:
+                break
+            page += 1
+        return list(orders.values())
+
+    def fetch_closed(self, missing: Dict[str, str]) -> List[Dict[str, Any]]:
+        orders: List[Dict[str, Any]] = []
+        for symbol in set(missing.values()):
+            wanted = {order_id for order_id, sym in missing.items() if sym == symbol}
+            for status in self.closed_statuses:
+                page = 1
+                while wanted:
+                    items = _items(self.client.get_orders(symbol, status=status, current_page=page,
+                                                          page_size=self.page_size))
+                    for order in items:
+                        order_id = str(order.get(self.id_field))
+                        if order_id in wanted:
+                            wanted.discard(order_id)
+                            orders.append(order)
+                    if len(items) < self.page_size or page >= self.max_pages:
+                        break
+                    page += 1
+        return orders
+
+
+def _items(response: Any) -> List[Dict[str, Any]]:
+    """
+    Extract the order list from a response whose data is a list or a paginated {items: [...]} object.
+    """
+    data = response.get('data') if isinstance(response, dict) else response
+    if isinstance(data, dict):
+        data = data.get('items')
+    return data if isinstance(data, list) else []
+
+
+def _collect(orders: Dict[str, Dict[str, Any]], items: List[Dict[str, Any]], id_field: str) -> int:
+    """
+    Add `items` to `orders` by id, skipping ids already present. Returns the number added.
+    """
+    added = 0
+    for order in items:
+        order_id = str(order.get(id_field))
+        if order_id not in orders:
+            orders[order_id] = order
+            added += 1
+    return added
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class OrderManager:
+    """
+    In-memory order state machine fed by our own responses and periodic reconciliation.
+
+    Instead of polling every live order, call reconcile() (or start() a background loop):
+    it reads the open orders of each symbol with live orders (one request per page), and makes
+    history lookups only when tracked orders have disappeared and their final state is unknown.
+    Changes are delivered to listeners as OrderEvent dictionaries.
+
+    Works with both FuturesApiClient and SpotClient.
+    """
+
+    def __init__(self, client: Any) -> None:
+        """
+        Args:
+            client (Any): A FuturesApiClient or SpotClient.
+
+        Example:
+            manager = OrderManager(client)
+            manager.add_listener(lambda event: print(event["type"], event["order"]["id"]))
+            manager.create_order({...})
+            manager.start(interval=1.0)
+        """
+        self.client = client
+        self._source = _SpotOrderSource(client) if hasattr(client, 'place_order') else _FuturesOrderSource(client)
+        self._orders: Dict[str, TrackedOrder] = {}
+        self._live_by_symbol: Dict[str, Set[str]] = {}
+        self._listeners: List[Callable[[OrderEvent], None]] = []
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_error: Optional[Exception] = None
+
+    # ------------------- LISTENERS -------------------
+    def add_listener(self, callback: Callable[[OrderEvent], None]) -> None:
+        """
+        Register a callback invoked with every OrderEvent.
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[OrderEvent], None]) -> None:
+        """
+        Unregister a previously added callback.
+        """
+        self._listeners.remove(callback)
+
+    def _emit(self, events: List[OrderEvent]) -> None:
+        for event in events:
+            for callback in list(self._listeners):
+                callback(event)
+
+    # ------------------- ORDER REQUESTS -------------------
+    def create_order(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Submit an order through the client and start tracking it.
+
+        Accepts the same arguments as FuturesApiClient.create_order or SpotClient.place_order.
+        """
+        operation = self.client.place_order if hasattr(self.client, 'place_order') else self.client.create_order
+        response = operation(*args, **kwargs)
+        self.record(response, default_status='OPEN')
+        return response
+
+    def edit_order(self, order_params: Dict[str, Any]) -> Any:
+        """
+        Edit a futures order through the client and update its tracked price and amount.
+        """
+        response = self.client.edit_order(order_params)
+        self.record(response)
+        return response
+
+    def cancel_order(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Cancel an order through the client and record the resulting status.
+
+        Accepts the same arguments as the client's cancel_order.
+        """
+        response = self.client.cancel_order(*args, **kwargs)
+        self.record(response, default_status='PENDING_CANCEL')
+        return response
+
+    # ------------------- STATE -------------------
+    def record(self, response: Any, default_status: Optional[str] = None) -> None:
+        """
+        Apply an order payload (or an API response wrapping one) to the tracked state.
+
+        Args:
+            response (Any): Order dictionary, or an API response whose data is one.
+            default_status (Optional[str]): Status to assume when the payload carries none.
+        """
+        order = response.get('data', response) if isinstance(response, dict) else None
+        if not isinstance(order, dict):
+            return
+        with self._lock:
+            events = self._apply(order, default_status)
+        self._emit(events)
+
+    def get(self, order_id: str) -> Optional[TrackedOrder]:
+        """
+        Return the tracked state of an order, or None if it is unknown.
+        """
+        with self._lock:
+            order = self._orders.get(str(order_id))
+            return dict(order) if order else None
+
+    def live_orders(self, symbol: Optional[str] = None) -> List[TrackedOrder]:
+        """
+        Return tracked orders that are not yet in a terminal state, optionally for one symbol.
+        """
+        with self._lock:
+            symbols = [symbol] if symbol else list(self._live_by_symbol)
+            return [dict(self._orders[order_id])
+                    for sym in symbols for order_id in self._live_by_symbol.get(sym, ())]
+
+    def _apply(self, payload: Dict[str, Any], default_status: Optional[str]) -> List[OrderEvent]:
+        """
+        Merge a payload into the state machine and return the resulting events. Caller holds the lock.
+        """
+        raw_id = payload.get(self._source.id_field)
+        if raw_id is None and isinstance(payload.get('info'), dict):
+            raw_id = payload['info'].get(self._source.id_field)
+        if raw_id is None:
+            return []
+        order_id = str(raw_id)
+        raw_status = payload.get('status')
+        status = _STATUS_MAP.get(str(raw_status).lower(), default_status) if raw_status else default_status
+        filled = _to_float(payload.get('filled'))
+
+        current = self._orders.get(order_id)
+        events: List[OrderEvent] = []
+        if current is None:
+            current = {
+                'id': order_id,
+                'symbol': payload.get('symbol') or '',
+                'side': payload.get('side'),
+                'status': status or 'OPEN',
+                'price': _to_float(payload.get('price')),
+                'amount': _to_float(payload.get('amount')),
+                'filled': filled or 0.0,
+                'updatedAt': time.time(),
+                'raw': payload
+            }
+            self._orders[order_id] = current
+            events.append({'type': 'NEW', 'order': dict(current), 'previousStatus': None, 'filledDelta': 0.0})
+        else:
+            if current['status'] in TERMINAL_STATUSES:
+                return []
+            current['raw'] = payload
+            for field in ('price', 'amount'):
+                value = _to_float(payload.get(field))
+                if value is not None:
+                    current[field] = value
+            previous = current['status']
+            delta = 0.0
+            if filled is not None and filled > current['filled']:
+                delta = filled - current['filled']
+                current['filled'] = filled
+                if status in (None, 'OPEN') and (current['amount'] is None or filled < current['amount']):
+                    status = 'PARTIALLY_FILLED'
+            # A pending cancel only leaves that state for a terminal one.
+            if previous == 'PENDING_CANCEL' and status in ('OPEN', 'PARTIALLY_FILLED'):
+                status = None
+            if status:
+                current['status'] = status
+            if delta or current['status'] != previous:
+                current['updatedAt'] = time.time()
+            if delta:
+                events.append({'type': 'FILL', 'order': dict(current), 'previousStatus': previous,
+                               'filledDelta': delta})
+            if current['status'] != previous:
+                events.append({'type': 'STATUS', 'order': dict(current), 'previousStatus': previous,
+                               'filledDelta': 0.0})
+
+        live = self._live_by_symbol.setdefault(current['symbol'], set())
+        if current['status'] in TERMINAL_STATUSES:
+            live.discard(order_id)
+        else:
+            live.add(order_id)
+        return events
+
+    # ------------------- RECONCILIATION -------------------
+    def reconcile(self, symbols: Optional[List[str]] = None) -> List[OrderEvent]:
+        """
+        Synchronize tracked orders with the exchange.
+
+        Reads every page of each symbol's open orders. Tracked orders that were live before the
+        first page was requested and are missing from all pages are looked up in the order history (futures: one
+        get_order per order; spot: the FILLED and CANCELLED lists of their symbols); any still
+        unresolved are marked CLOSED. Orders created while the open list was being fetched are
+        left for the next reconcile.
+
+        Args:
+            symbols (Optional[List[str]]): Symbols to reconcile (default: all symbols with live orders).
+
+        Returns:
+            List[OrderEvent]: Events produced by this reconciliation, in order.
+        """
+        with self._lock:
+            targets = symbols or [sym for sym, ids in self._live_by_symbol.items() if ids]
+        events: List[OrderEvent] = []
+        missing: Dict[str, str] = {}
+        for symbol in targets:
+            # Only orders live before the open list was requested can be judged missing from it;
+            # one created while the request is in flight may not be listed yet.
+            with self._lock:
+                expected = set(self._live_by_symbol.get(symbol, ()))
+            open_orders = self._source.fetch_open(symbol)
+            with self._lock:
+                seen = set()
+                for payload in open_orders:
+                    payload.setdefault('symbol', symbol)
+                    events.extend(self._apply(payload, 'OPEN'))
+                    seen.add(str(payload.get(self._source.id_field)))
+                for order_id in (expected - seen) & self._live_by_symbol.get(symbol, set()):
+                    missing[order_id] = symbol
+
+        if missing:
+            history = self._source.fetch_closed(missing)
+            with self._lock:
+                for payload in history:
+                    order_id = str(payload.get(self._source.id_field))
+                    if order_id in missing:
+                        events.extend(self._apply(payload, 'CLOSED'))
+                        missing.pop(order_id)
+                for order_id in missing:
+                    order = self._orders[order_id]
+                    # Our own pending cancel disappearing means it went through.
+                    final = 'CANCELED' if order['status'] == 'PENDING_CANCEL' else 'CLOSED'
+                    events.extend(self._apply({self._source.id_field: order_id}, final))
+        self._emit(events)
+        return events
+
+    def start(self, interval: float = 1.0) -> None:
+        """
+        Reconcile in a background thread every `interval` seconds until stop() is called.
+
+        Errors are stored in `last_error` and do not stop the loop.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+
+        def loop() -> None:
+            while not self._stop_event.wait(interval):
+                try:
+                    self.reconcile()
+                    self.last_error = None
+                except Exception as e:
+                    self.last_error = e
+
+        self._thread = threading.Thread(target=loop, name='order-manager', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background reconciliation loop.
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,424 @@
+"""
+    Local margin and liquidation risk engine
+    Recomputes margin ratios and liquidation prices from mark prices, reconciling positions periodically
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+import threading
+import time
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .account_state import AccountState
+    from .client import FuturesApiClient
+    from utils.types import MarketsData, Position, PositionRisk, RiskSummary
+
+
+def _number(value: Any, default: float = 0.0) -> float:
+    if value is None or value == '':
+        return default
+    return float(value)
+
+
+def _percent(value: Any) -> float:
+    """
+    A margin percentage from market metadata ("0.5" means 0.5%) as a fraction.
+    """
+    return _number(value) / 100
+
+
+def _key(position: Mapping[str, Any]) -> Tuple[str, ...]:
+    """
+    Identity of a position across reconciles: its id, or its symbol, side and margin mode.
+    """
+    if position.get('id'):
+        return (str(position['id']),)
+    return (position['symbol'], str(position.get('side', '')).lower(), str(position.get('marginMode', '')).lower())
+
+
+def _side(position: Mapping[str, Any]) -> int:
+    side = str(position.get('side', '')).lower()
+    if side in ('long', 'buy'):
+        return 1
+    if side in ('short', 'sell'):
+        return -1
+    contracts = _number(position.get('contracts'))
+    return -1 if contracts < 0 else 1
+
+
+class RiskEngine:
+    """
+    Local margin model for the open positions of a FuturesApiClient.
+
+    Positions and their margin come from the server on reconcile(); between reconciles, mark
+    prices pushed with update_price() / update_prices() (from a stream, or from one public
+    get_market_info() call via poll_marks()) recompute every position's unrealized PnL, margin
+    ratio, liquidation price and distance to liquidation in a handful of numpy operations, so
+    watching margin does not cost a private get_positions() call per tick.
+
+    The model, for linear contracts with size q = contracts * contractSize, entry price E,
+    side s (+1 long, -1 short), maintenance rate m (maintMarginPercent) and mark P:
+
+      - isolated positions: margin balance = collateral + s*q*(P - E); maintenance margin = m*q*P;
+        margin ratio = maintenance / balance (liquidation at 1);
+        liquidation price = (s*q*E - collateral) / (q*(s - m)).
+      - cross positions share the cross wallet balance W: the margin ratio is account-wide,
+        (sum of maintenance) / (W + sum of unrealized PnL), and each position's liquidation price
+        assumes the other cross positions' marks stay where they are.
+
+    Collateral is the position's `collateral` or `initialMargin`, falling back to notional / leverage
+    and then to requiredMarginPercent of the entry notional. Exchange-side details the model does not
+    know (fees on close, tiered maintenance rates, insurance fund rules) make server liquidation
+    prices differ slightly; each reconcile records the largest relative difference in `liquidation_drift`.
+
+    Reconciliation runs every `reconcile_interval` seconds once start() is called, and immediately
+    after the client completes one of our own mutations (orders, margin, leverage, closes).
+    """
+
+    def __init__(
+        self,
+        client: FuturesApiClient,
+        markets: Optional[MarketsData] = None,
+        reconcile_interval: float = 30.0,
+        account_state: Optional[AccountState] = None,
+        alert_ratio: Optional[float] = None,
+        on_alert: Optional[Callable[[PositionRisk], None]] = None
+    ) -> None:
+        """
+        Args:
+            client (FuturesApiClient): Client used to fetch positions, balances and market metadata.
+            markets (Optional[MarketsData]): `data` of fetch_markets(); fetched on the first reconcile if omitted.
+            reconcile_interval (float): Seconds between background reconciles.
+            account_state (Optional[AccountState]): Read positions and balances through this cache instead
+                of fetching them directly.
+            alert_ratio (Optional[float]): Margin ratio (e.g. 0.8) at which on_alert fires.
+            on_alert (Optional[Callable[[PositionRisk], None]]): Called with a position's risk when its
+                margin ratio rises to alert_ratio or above; again only after it has dropped back below.
+
+        Example:
+            engine = RiskEngine(client, alert_ratio=0.8, on_alert=lambda risk: print("margin call", risk))
+            engine.start()                                   # reconcile now and every 30 seconds
+            engine.update_price("BTCUSDT", 58250.0)          # from your price feed
+            print(engine.risk("BTCUSDT")[0]["liquidationDistance"])
+        """
+        self.client = client
+        self.reconcile_interval = reconcile_interval
+        self.account_state = account_state
+        self.alert_ratio = alert_ratio
+        self.on_alert = on_alert
+        self._rates: Dict[str, Tuple[float, float]] = {}
+        self._quote_assets: Dict[str, str] = {}
+        if markets is not None:
+            self.load_markets(markets)
+
+        self._lock = threading.RLock()
+        self._positions: List[Dict[str, Any]] = []
+        self._keys: List[Tuple[str, ...]] = []
+        self._rows: Dict[str, np.ndarray] = {}
+        empty = np.zeros(0)
+        self._side = empty
+        self._size = empty
+        self._entry = empty
+        self._collateral = empty
+        self._maint = empty
+        self._cross = np.zeros(0, dtype=bool)
+        self._mark = empty
+        # Last pushed mark per symbol, with the monotonic time it arrived.
+        self._marks: Dict[str, Tuple[float, float]] = {}
+        self._alerted = np.zeros(0, dtype=bool)
+        self.cross_balance = 0.0
+        self._results: Dict[str, np.ndarray] = {}
+        self.reconciled_at: Optional[float] = None
+        self.liquidation_drift: Optional[float] = None
+        self.last_error: Optional[Exception] = None
+
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        client.add_mutation_listener(self._on_mutation)
+
+    # ------------------- METADATA AND RECONCILIATION -------------------
+    def load_markets(self, markets: MarketsData) -> None:
+        """
+        Take maintenance and initial margin rates from the `data` of fetch_markets().
+        """
+        for meta in markets.get('symbols', []):
+            symbol = meta['symbol']
+            self._rates[symbol] = (_percent(meta.get('maintMarginPercent')), _percent(meta.get('requiredMarginPercent')))
+            self._quote_assets[symbol] = meta.get('marginAsset') or meta.get('quoteAsset') or ''
+
+    def _on_mutation(self, method: str, endpoint: str) -> None:
+        """
+        Our own orders and margin changes alter positions; reconcile as soon as possible.
+        """
+        self._wake.set()
+
+    def reconcile(self, positions: Optional[Iterable[Position]] = None, cross_balance: Optional[float] = None) -> None:
+        """
+        Replace the local positions with the server's and recompute.
+
+        Marks pushed while the positions were being fetched are kept; otherwise each position starts
+        from the server's `markPrice`, or the last pushed mark, or its entry price.
+
+        Args:
+            positions (Optional[Iterable[Position]]): Positions to use instead of fetching open positions.
+            cross_balance (Optional[float]): Cross wallet balance; fetched from the balance of the cross
+                positions' margin asset when omitted and there are cross positions.
+        """
+        if not self._rates:
+            self.load_markets(self.client.fetch_markets()['data'])
+        started = time.monotonic()
+        if positions is None:
+            if self.account_state is not None:
+                positions = self.account_state.get_positions(fresh=True)['data']
+            else:
+                positions = self.client.get_positions(status='OPEN')['data']
+        positions = [p for p in positions or [] if _number(p.get('contracts')) != 0]
+        cross = np.array([str(p.get('marginMode', '')).lower() == 'cross' for p in positions], dtype=bool)
+        if cross_balance is None and cross.any():
+            cross_balance = self._fetch_cross_balance(positions[int(np.argmax(cross))]['symbol'])
+
+        side = np.array([_side(p) for p in positions], dtype=np.float64)
+        size = np.array([abs(_number(p.get('contracts'))) * _number(p.get('contractSize'), 1.0) for p in positions])
+        entry = np.array([_number(p.get('entryPrice')) for p in positions])
+        leverage = np.array([_number(p.get('leverage')) for p in positions])
+        rates = np.array([self._rates.get(p['symbol'], (0.0, 0.0)) for p in positions]).reshape(-1, 2)
+        collateral = np.array([_number(p.get('collateral', p.get('initialMargin')), np.nan) for p in positions])
+        # Without a reported collateral: entry notional over leverage, else the initial margin rate.
+        implied = np.where(leverage > 0, size * entry / np.where(leverage > 0, leverage, 1), rates[:, 1] * size * entry)
+        collateral = np.where(np.isnan(collateral), implied, collateral)
+
+        with self._lock:
+            marks: Dict[str, float] = {}
+            for p in positions:
+                pushed = self._marks.get(p['symbol'])
+                if pushed is not None and (pushed[1] >= started or p.get('markPrice') is None):
+                    marks[p['symbol']] = pushed[0]
+                else:
+                    marks.setdefault(p['symbol'], _number(p.get('markPrice'), _number(p.get('entryPrice'))))
+            self._positions = [dict(p) for p in positions]
+            rows: Dict[str, List[int]] = {}
+            for index, p in enumerate(positions):
+                rows.setdefault(p['symbol'], []).append(index)
+            self._rows = {symbol: np.array(indices) for symbol, indices in rows.items()}
+            self._side, self._size, self._entry, self._collateral = side, size, entry, collateral
+            self._maint = rates[:, 0]
+            self._cross = cross
+            self._mark = np.array([marks[p['symbol']] for p in positions])
+            # Positions already alerted on stay alerted until their ratio drops back below alert_ratio.
+            alerted = {key for key, flag in zip(self._keys, self._alerted.tolist()) if flag}
+            self._keys = [_key(p) for p in positions]
+            self._alerted = np.array([key in alerted for key in self._keys], dtype=bool)
+            if cross_balance is not None:
+                self.cross_balance = float(cross_balance)
+            alerts = self._recompute()
+            self.reconciled_at = time.time()
+            # How far the model is from the server, where the server reports liquidation prices.
+            server = np.array([_number(p.get('liquidationPrice'), np.nan) for p in positions])
+            local = self._results['liquidationPrice']
+            known = ~np.isnan(server) & ~np.isnan(local) & (server > 0)
+            self.liquidation_drift = float(np.max(np.abs(local[known] - server[known]) / server[known])) if known.any() else None
+        self._notify(alerts)
+
+    def _fetch_cross_balance(self, symbol: str) -> float:
+        if self.account_state is not None:
+            balances = self.account_state.get_balance(fresh=True)['data']
+        else:
+            balances = self.client.get_balance()['data']
+        entry = (balances or {}).get(self._quote_assets.get(symbol) or 'USDT') or {}
+        return _number(entry.get('total'))
+
+    # ------------------- PRICE UPDATES -------------------
+    def update_price(self, symbol: str, price: float) -> None:
+        """
+        Apply a new mark price for a symbol and recompute every position.
+        """
+        self.update_prices({symbol: price})
+
+    def update_prices(self, prices: Mapping[str, float]) -> None:
+        """
+        Apply new mark prices for several symbols and recompute once.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for symbol, price in prices.items():
+                self._marks[symbol] = (float(price), now)
+                rows = self._rows.get(symbol)
+                if rows is not None:
+                    self._mark[rows] = float(price)
+            alerts = self._recompute()
+        self._notify(alerts)
+
+    def poll_marks(self) -> None:
+        """
+        Update every mark price from one public get_market_info() call.
+        """
+        data = self.client.get_market_info()['data'] or []
+        self.update_prices({
+            entry['symbol']: _number(entry.get('markPrice'))
+            for entry in data if isinstance(entry, dict) and entry.get('markPrice') is not None
+        })
+
+    def _recompute(self) -> List[PositionRisk]:
+        """
+        Vectorized margin model over all positions (lock held). Returns the positions to alert on.
+        """
+        s, q, e, m, mark, cross = self._side, self._size, self._entry, self._maint, self._mark, self._cross
+        pnl = s * q * (mark - e)
+        maintenance = m * q * mark
+        # Margin backing each position besides its own PnL and maintenance: the isolated collateral, or
+        # the cross wallet plus the other cross positions' PnL less their maintenance.
+        cross_pnl = float(pnl[cross].sum())
+        cross_maintenance = float(maintenance[cross].sum())
+        backing = np.where(
+            cross,
+            self.cross_balance + (cross_pnl - pnl) - (cross_maintenance - maintenance),
+            self._collateral
+        )
+        balance = np.where(cross, self.cross_balance + cross_pnl, self._collateral + pnl)
+        required = np.where(cross, cross_maintenance, maintenance)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(balance > 0, required / balance, np.inf)
+            liquidation = (s * q * e - backing) / (q * (s - m))
+            # A long backed beyond its entry value, or a degenerate size, has no liquidation price.
+            liquidation = np.where(np.isfinite(liquidation) & (liquidation > 0), liquidation, np.nan)
+            distance = s * (mark - liquidation) / mark
+        self._results = {
+            'notional': q * mark,
+            'unrealizedPnl': pnl,
+            'marginBalance': balance,
+            'maintenanceMargin': maintenance,
+            'marginRatio': ratio,
+            'liquidationPrice': liquidation,
+            'liquidationDistance': distance
+        }
+        if self.alert_ratio is None or self.on_alert is None or not len(ratio):
+            return []
+        breached = ratio >= self.alert_ratio
+        fresh = np.flatnonzero(breached & ~self._alerted)
+        self._alerted = breached
+        return [self._row(index) for index in fresh.tolist()]
+
+    def _notify(self, alerts: List[PositionRisk]) -> None:
+        """
+        Deliver alerts outside the lock, so callbacks can read the engine or act on the client.
+        """
+        for risk in alerts:
+            self.on_alert(risk)
+
+    # ------------------- READS -------------------
+    def _row(self, index: int) -> PositionRisk:
+        r = self._results
+        position = self._positions[index]
+        liquidation = float(r['liquidationPrice'][index])
+        return {
+            'id': position.get('id', ''),
+            'symbol': position['symbol'],
+            'side': 'long' if self._side[index] > 0 else 'short',
+            'marginMode': 'cross' if self._cross[index] else 'isolated',
+            'size': float(self._size[index]),
+            'entryPrice': float(self._entry[index]),
+            'markPrice': float(self._mark[index]),
+            'notional': float(r['notional'][index]),
+            'unrealizedPnl': float(r['unrealizedPnl'][index]),
+            'marginBalance': float(r['marginBalance'][index]),
+            'maintenanceMargin': float(r['maintenanceMargin'][index]),
+            'marginRatio': float(r['marginRatio'][index]),
+            'liquidationPrice': None if np.isnan(liquidation) else liquidation,
+            'liquidationDistance': None if np.isnan(liquidation) else float(r['liquidationDistance'][index])
+        }
+
+    def risk(self, symbol: Optional[str] = None) -> List[PositionRisk]:
+        """
+        Current risk of every position, or of one symbol's positions.
+
+        Returns:
+            List[PositionRisk]: Per-position margin ratio, liquidation price and distance, PnL and margin.
+        """
+        with self._lock:
+            if symbol is None:
+                indices = range(len(self._positions))
+            else:
+                indices = self._rows.get(symbol, np.zeros(0, dtype=int)).tolist()
+            return [self._row(index) for index in indices]
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Copies of the computed columns (notional, unrealizedPnl, marginBalance, maintenanceMargin,
+        marginRatio, liquidationPrice, liquidationDistance), aligned with symbols().
+        """
+        with self._lock:
+            return {name: values.copy() for name, values in self._results.items()}
+
+    def symbols(self) -> List[str]:
+        """
+        Symbol of each position, in the order of arrays().
+        """
+        with self._lock:
+            return [position['symbol'] for position in self._positions]
+
+    def summary(self) -> RiskSummary:
+        """
+        Account-wide totals and the riskiest position's figures.
+        """
+        with self._lock:
+            r = self._results
+            ratio = r.get('marginRatio', np.zeros(0))
+            distance = r.get('liquidationDistance', np.zeros(0))
+            known = distance[~np.isnan(distance)] if len(distance) else distance
+            return {
+                'positions': len(self._positions),
+                'notional': float(r['notional'].sum()) if r else 0.0,
+                'unrealizedPnl': float(r['unrealizedPnl'].sum()) if r else 0.0,
+                'maintenanceMargin': float(r['maintenanceMargin'].sum()) if r else 0.0,
+                'maxMarginRatio': float(ratio.max()) if len(ratio) else None,
+                'minLiquidationDistance': float(known.min()) if len(known) else None,
+                'crossBalance': self.cross_balance,
+                'reconciledAt': self.reconciled_at,
+                'ageSeconds': time.time() - self.reconciled_at if self.reconciled_at is not None else None,
+                'liquidationDrift': self.liquidation_drift
+            }
+
+    # ------------------- BACKGROUND RECONCILE -------------------
+    def start(self) -> None:
+        """
+        Reconcile now, then every `reconcile_interval` seconds and after our own mutations.
+        Errors are stored in `last_error` and do not stop the loop.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+
+        def loop() -> None:
+            while not self._stop_event.is_set():
+                # Clear first so a mutation during the reconcile triggers another one.
+                self._wake.clear()
+                try:
+                    self.reconcile()
+                    self.last_error = None
+                except Exception as e:
+                    self.last_error = e
+                self._wake.wait(self.reconcile_interval)
+
+        self._thread = threading.Thread(target=loop, name='risk-engine', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the background reconcile loop.
+        """
+        self._stop_event.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        """
+        Stop reconciling and detach from the client's mutation notifications.
+        """
+        self.stop()
+        self.client.remove_mutation_listener(self._on_mutation)
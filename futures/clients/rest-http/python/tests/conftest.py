@@ -0,0 +1,13 @@
+"""
+Test setup: client/ and utils/ are top-level packages of the futures python directory, and
+zebpay_core comes from shared/clients/rest-http/python when it is not installed.
+"""
+
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [
+    os.path.join(HERE, '..'),
+    os.path.join(HERE, '..', '..', '..', '..', '..', 'shared', 'clients', 'rest-http', 'python'),
+]
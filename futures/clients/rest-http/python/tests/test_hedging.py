@@ -0,0 +1,107 @@
+"""
+HedgingPolicy races against a fake send: deadline-bounded worker waits and error responses losing.
+"""
+
+import threading
+import time
+
+import pytest
+
+from utils.hedging import HedgingPolicy
+from zebpay_core.transport import DeadlineExceeded
+
+ENDPOINT = '/api/v1/market/orderBook'
+
+
+class FakeResponse:
+    def __init__(self, name, status_code=200):
+        self.name = name
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeLimiter:
+    def try_acquire(self):
+        return True
+
+
+class FakeMetrics:
+    def __init__(self):
+        self.hedges = []
+
+    def observe_hedge(self, endpoint, outcome):
+        self.hedges.append(outcome)
+
+
+def hedged_policy(**kwargs):
+    policy = HedgingPolicy(**kwargs)
+    policy._delays[ENDPOINT] = 0.01
+    return policy
+
+
+def test_error_response_from_the_hedge_does_not_beat_a_slow_success():
+    policy = hedged_policy()
+    original, hedge = FakeResponse('original'), FakeResponse('hedge', 503)
+
+    def send(is_original):
+        if is_original:
+            time.sleep(0.1)
+            return original
+        return hedge
+
+    metrics = FakeMetrics()
+    assert policy.run(ENDPOINT, send, FakeLimiter(), metrics) is original
+    assert metrics.hedges == ['lost']
+    assert hedge.closed
+
+
+def test_successful_hedge_beats_a_slow_original():
+    policy = hedged_policy()
+    original, hedge = FakeResponse('original'), FakeResponse('hedge')
+
+    def send(is_original):
+        if is_original:
+            time.sleep(0.1)
+            return original
+        return hedge
+
+    metrics = FakeMetrics()
+    assert policy.run(ENDPOINT, send, FakeLimiter(), metrics) is hedge
+    assert metrics.hedges == ['won']
+
+
+def test_original_error_response_is_returned_when_both_attempts_fail():
+    policy = hedged_policy()
+    original, hedge = FakeResponse('original', 500), FakeResponse('hedge', 429)
+
+    def send(is_original):
+        if is_original:
+            time.sleep(0.05)
+            return original
+        return hedge
+
+    metrics = FakeMetrics()
+    assert policy.run(ENDPOINT, send, FakeLimiter(), metrics) is original
+    assert metrics.hedges == ['lost']
+    assert hedge.closed
+
+
+def test_saturated_pool_raises_at_the_deadline_without_sending():
+    policy = hedged_policy(max_workers=1)
+    release = threading.Event()
+    policy._get_executor().submit(release.wait)
+    sent = []
+    try:
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded) as info:
+            policy.run(ENDPOINT, sent.append, FakeLimiter(), FakeMetrics(), deadline=started + 0.05)
+        assert time.monotonic() - started < 1.0
+        assert info.value.stage == 'queue'
+    finally:
+        release.set()
+    time.sleep(0.05)
+    assert sent == []
@@ -0,0 +1,99 @@
+"""
+KillSwitch runs against fake futures and spot clients, including partial failures.
+"""
+
+from client.kill_switch import KillSwitch
+
+
+class FakeFuturesClient:
+    def __init__(self, positions, fail_close=()):
+        self.positions = {p.get('id', f"anon{i}"): p for i, p in enumerate(positions)}
+        self.fail_close = set(fail_close)
+        self.closed = []
+        self.cancelled = False
+
+    def cancel_all_orders(self):
+        self.cancelled = True
+        return {'data': {}}
+
+    def get_positions(self, symbols=None, status=None):
+        return {'data': list(self.positions.values())}
+
+    def close_position(self, close_params):
+        position_id = close_params['positionId']
+        if position_id in self.fail_close:
+            raise ConnectionError(f"close of {position_id} failed")
+        self.closed.append(position_id)
+        del self.positions[position_id]
+        return {'data': {'positionId': position_id}}
+
+
+class FakeSpotClient:
+    def __init__(self, orders_by_symbol, fail_cancel=()):
+        self.orders = {symbol: [{'orderId': f"{symbol}-{i}", 'status': 'ACTIVE'} for i in range(count)]
+                       for symbol, count in orders_by_symbol.items()}
+        self.fail_cancel = set(fail_cancel)
+        self.statuses = []
+
+    def get_trading_pairs(self):
+        return {'data': [{'symbol': symbol} for symbol in self.orders]}
+
+    def get_orders(self, symbol, status=None, current_page=1, page_size=20):
+        self.statuses.append(status)
+        active = [o for o in self.orders[symbol] if o['status'] == (status or 'ACTIVE')]
+        start = (current_page - 1) * page_size
+        return {'data': {'items': active[start:start + page_size]}}
+
+    def cancel_all_orders(self, symbol):
+        if symbol in self.fail_cancel:
+            raise ConnectionError(f"cancel on {symbol} failed")
+        for order in self.orders[symbol]:
+            order['status'] = 'CANCELLED'
+        return {'data': {}}
+
+
+def failures(report):
+    return {(a['action'], a['target']) for a in report['actions'] if a['error'] is not None}
+
+
+def test_flattens_everything_and_verifies():
+    futures = FakeFuturesClient([{'id': 'p1', 'symbol': 'BTCUSDT'}, {'id': 'p2', 'symbol': 'ETHUSDT'}])
+    spot = FakeSpotClient({'BTC-INR': 3, 'ETH-INR': 0})
+
+    report = KillSwitch(futures, spot).trigger(deadline=5.0)
+
+    assert report['flat'] is True
+    assert futures.cancelled and sorted(futures.closed) == ['p1', 'p2']
+    cancelled = {a['target'] for a in report['actions'] if a['action'] == 'cancel_spot_orders'}
+    assert cancelled == {'BTC-INR'}
+    assert set(spot.statuses) == {'ACTIVE'}
+
+
+def test_partial_failure_does_not_stop_the_run():
+    futures = FakeFuturesClient(
+        [{'id': 'p1', 'symbol': 'BTCUSDT'}, {'symbol': 'XRPUSDT', 'side': 'long'}, {'id': 'p3', 'symbol': 'ETHUSDT'}],
+        fail_close={'p1'}
+    )
+    spot = FakeSpotClient({'BTC-INR': 2, 'ETH-INR': 2}, fail_cancel={'ETH-INR'})
+
+    report = KillSwitch(futures, spot).trigger(deadline=5.0)
+
+    assert futures.closed == ['p3']
+    assert failures(report) == {
+        ('close_position', 'p1'),
+        ('close_position', 'XRPUSDT long'),
+        ('cancel_spot_orders', 'ETH-INR'),
+    }
+    assert all(o['status'] == 'CANCELLED' for o in spot.orders['BTC-INR'])
+    assert report['flat'] is False
+    assert len(report['openPositions']) == 2
+
+
+def test_verification_reads_every_page_of_spot_orders():
+    futures = FakeFuturesClient([])
+    spot = FakeSpotClient({'BTC-INR': 250}, fail_cancel={'BTC-INR'})
+
+    report = KillSwitch(futures, spot, spot_symbols=['BTC-INR']).trigger(deadline=5.0)
+
+    assert report['flat'] is False
+    assert len(report['openSpotOrders']['BTC-INR']) == 250
@@ -0,0 +1,80 @@
+"""
+Kline resampling: partial first and last buckets are flagged (or dropped) in both resample() and
+the incremental KlineResampler.
+"""
+
+import numpy as np
+import pytest
+
+from utils.klines import KlineResampler, interval_ms, parse_klines, resample
+
+MINUTE = 60_000
+
+
+def candles(first_minute, last_minute):
+    # Open rises by one per minute; volume is 1 per candle.
+    return [[m * MINUTE, 100 + m, 101 + m, 99 + m, 100.5 + m, 1, (m + 1) * MINUTE]
+            for m in range(first_minute, last_minute + 1)]
+
+
+def test_resample_flags_leading_and_trailing_partial_buckets():
+    # Minutes 2..12: the 0-5 bucket is missing its start, the 10-15 bucket its end.
+    result = resample(candles(2, 12), '1m', '5m')
+    assert result.open_time.tolist() == [0, 5 * MINUTE, 10 * MINUTE]
+    assert result.complete.tolist() == [False, True, False]
+    assert result.open.tolist() == [102, 105, 110]
+    assert result.high.tolist() == [105, 110, 113]
+    assert result.low.tolist() == [101, 104, 109]
+    assert result.close.tolist() == [104.5, 109.5, 112.5]
+    assert result.volume.tolist() == [3, 5, 3]
+
+
+def test_resample_without_partial_keeps_only_fully_covered_buckets():
+    result = resample(candles(2, 12), '1m', '5m', include_partial=False)
+    assert result.open_time.tolist() == [5 * MINUTE]
+    assert result.complete.all()
+
+
+def test_resample_exactly_covered_buckets_are_complete():
+    result = resample(candles(0, 9), '1m', '5m', include_partial=False)
+    assert result.open_time.tolist() == [0, 5 * MINUTE]
+    assert result.complete.tolist() == [True, True]
+
+
+def test_month_intervals_are_rejected():
+    with pytest.raises(ValueError):
+        interval_ms('1M')
+    with pytest.raises(ValueError):
+        resample(candles(0, 9), '1m', '1M')
+
+
+def test_resampler_matches_resample_when_fed_one_candle_at_a_time():
+    rows = candles(2, 12)
+    resampler = KlineResampler('1m', ['5m'])
+    for row in rows:
+        resampler.update([row])
+    expected = resample(rows, '1m', '5m')
+    for include_partial in (True, False):
+        actual = resampler.candles('5m', include_partial=include_partial)
+        wanted = expected if include_partial else expected[expected.complete]
+        for name in ('open_time', 'open', 'high', 'low', 'close', 'volume', 'complete'):
+            np.testing.assert_array_equal(getattr(actual, name), getattr(wanted, name), err_msg=name)
+
+
+def test_resampler_trailing_bucket_completes_with_its_last_base_candle():
+    resampler = KlineResampler('1m', ['5m'])
+    resampler.update(candles(0, 13))
+    assert resampler.candles('5m').complete.tolist() == [True, True, False]
+    resampler.update(candles(14, 14))
+    assert resampler.candles('5m').complete.tolist() == [True, True, True]
+
+
+def test_resampler_revision_of_the_open_candle_replaces_it():
+    resampler = KlineResampler('1m', ['5m'])
+    resampler.update(candles(0, 6))
+    revised = candles(6, 6)[0]
+    revised[2], revised[5] = 200, 4
+    resampler.update(parse_klines([revised]))
+    last = resampler.candles('5m')[-1:]
+    assert last.high.tolist() == [200]
+    assert last.volume.tolist() == [5]
@@ -0,0 +1,106 @@
+"""
+OrderManager reconciliation against fake futures and spot clients.
+"""
+
+from client.order_manager import OrderManager
+
+
+class FakeSpotClient:
+    """
+    Spot orders listed by status, currentPage and pageSize, like GET /api/v2/ex/orders.
+    """
+
+    def __init__(self) -> None:
+        self.orders = {}
+
+    def place_order(self, symbol, side, type, price=None, quantity=None, **kwargs):
+        order_id = len(self.orders) + 1
+        self.orders[order_id] = {'orderId': order_id, 'symbol': symbol, 'side': side, 'status': 'ACTIVE'}
+        return {'data': dict(self.orders[order_id])}
+
+    def get_orders(self, symbol, status=None, current_page=1, page_size=20):
+        matching = [dict(o) for o in self.orders.values()
+                    if o['symbol'] == symbol and o['status'] == (status or 'ACTIVE')]
+        start = (current_page - 1) * page_size
+        return {'data': {'items': matching[start:start + page_size]}}
+
+
+class FakeFuturesClient:
+    """
+    Futures open orders in pages of `page_size`, oldest first, continued with since=nextTimestamp.
+    """
+    page_size = 20
+
+    def __init__(self) -> None:
+        self.orders = {}
+        self.get_order_calls = 0
+
+    def create_order(self, params):
+        order_id = f"c{len(self.orders) + 1}"
+        self.orders[order_id] = {'clientOrderId': order_id, 'symbol': params['symbol'], 'status': 'new',
+                                 'timestamp': 1000 + len(self.orders)}
+        return {'data': dict(self.orders[order_id])}
+
+    def get_open_orders(self, symbol, limit=None, since=None):
+        listed = sorted((o for o in self.orders.values() if o['symbol'] == symbol and o['status'] == 'new'),
+                        key=lambda o: o['timestamp'])
+        page = [dict(o) for o in listed if since is None or o['timestamp'] > since][:self.page_size]
+        more = len(page) == self.page_size
+        return {'data': {'items': page, 'nextTimestamp': page[-1]['timestamp'] if more else None}}
+
+    def get_order(self, order_id):
+        self.get_order_calls += 1
+        return {'data': dict(self.orders[order_id])}
+
+
+def test_spot_reconcile_reads_every_page_of_active_orders():
+    client = FakeSpotClient()
+    manager = OrderManager(client)
+    for _ in range(130):
+        manager.create_order('BTC-INR', 'BUY', 'LIMIT', price='100', quantity='1')
+
+    events = manager.reconcile()
+
+    assert [e for e in events if e['order']['status'] == 'CLOSED'] == []
+    assert len(manager.live_orders('BTC-INR')) == 130
+
+
+def test_spot_reconcile_resolves_filled_and_cancelled_orders():
+    client = FakeSpotClient()
+    manager = OrderManager(client)
+    for _ in range(30):
+        manager.create_order('BTC-INR', 'BUY', 'LIMIT', price='100', quantity='1')
+    client.orders[3]['status'] = 'FILLED'
+    client.orders[25]['status'] = 'CANCELLED'
+
+    manager.reconcile()
+
+    assert manager.get('3')['status'] == 'FILLED'
+    assert manager.get('25')['status'] == 'CANCELED'
+    assert len(manager.live_orders('BTC-INR')) == 28
+
+
+def test_futures_reconcile_follows_next_timestamp():
+    client = FakeFuturesClient()
+    manager = OrderManager(client)
+    for _ in range(45):
+        manager.create_order({'symbol': 'BTCUSDT'})
+
+    manager.reconcile()
+
+    assert len(manager.live_orders('BTCUSDT')) == 45
+    assert client.get_order_calls == 0
+
+
+def test_futures_reconcile_looks_up_orders_missing_from_every_page():
+    client = FakeFuturesClient()
+    manager = OrderManager(client)
+    for _ in range(45):
+        manager.create_order({'symbol': 'BTCUSDT'})
+    client.orders['c40']['status'] = 'filled'
+
+    manager.reconcile()
+
+    assert manager.get('c40')['status'] == 'FILLED'
+    assert client.get_order_calls == 1
+    assert len(manager.live_orders('BTCUSDT')) == 44
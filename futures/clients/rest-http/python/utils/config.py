@@ -4,6 +4,25 @@ Configuration settings for the Zebpay futures API client.
 # Base URL for API requests
 BASE_URL = 'https://futuresbe.zebpay.com'
 
+# Client-side rate limit, matching the exchange's 180 requests per minute rule
+RATE_LIMIT = {
+    'max_requests': 180,
+    'period': 60
+}
+
+# Default number of concurrent workers used by batch operations
+BATCH_MAX_WORKERS = 8
+
+# Recommended request timeout in seconds per endpoint class (see utils.timeouts). Opt in with
+# FuturesApiClient(..., timeout_classes=config.TIMEOUT_CLASSES); capped at the client's timeout
+TIMEOUT_CLASSES = {
+    'market_data': 5,
+    'reference': 15,
+    'account': 10,
+    'order': 10,
+    'cancel': 5
+}
+
 # API endpoints
 ENDPOINTS = {
     # Public endpoints (no authentication required)
@@ -51,3 +70,22 @@ ENDPOINTS = {
         }
     }
 }
+
+
+def get_endpoint(path):
+    """
+    Resolve an endpoint path from the ENDPOINTS tree.
+
+    Args:
+        path (List[str]): Keys leading to the endpoint, e.g. ['private', 'trade', 'order'].
+
+    Returns:
+        str: The endpoint path.
+
+    Raises:
+        KeyError: If the path does not exist in ENDPOINTS.
+    """
+    node = ENDPOINTS
+    for key in path:
+        node = node[key]
+    return node
@@ -0,0 +1,241 @@
+"""
+Hedged requests for the Zebpay futures API client.
+
+A hedged request races a duplicate against a slow original: if no response has arrived by a
+percentile of the endpoint's recent latency, the same idempotent GET is sent again on another
+pooled connection and whichever answers first is used. This trims the tail caused by the
+occasional slow connection at the cost of a few extra requests, which are capped as a share
+of traffic and always paid for from the client's rate budget.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, Optional
+
+from zebpay_core.transport import DeadlineExceeded
+
+from . import config
+
+# Market-data endpoints hedged by default: idempotent, cheap and latency-sensitive. Klines are
+# left out because get_klines is a POST, and only GETs are hedged.
+DEFAULT_HEDGED_ENDPOINTS: FrozenSet[str] = frozenset(
+    config.get_endpoint(['public', 'market', name])
+    for name in ('order_book', 'ticker_24hr', 'agg_trade', 'market_info', 'markets')
+)
+
+
+def _succeeded(future: Future) -> bool:
+    """
+    True if a finished attempt returned a response with a success status. An error response
+    (e.g. a fast 429 or 5xx) does not win the race; the caller would only raise it.
+    """
+    if future.exception() is not None:
+        return False
+    return getattr(future.result(), 'ok', True)
+
+
+def _close_response(future: Future) -> None:
+    """
+    Done-callback for the attempt that lost the race: release its connection back to the pool.
+    """
+    if not future.cancelled() and future.exception() is None:
+        close = getattr(future.result(), 'close', None)
+        if close is not None:
+            close()
+
+
+class HedgingPolicy:
+    """
+    Opt-in hedging for idempotent GET requests.
+
+    The hedge delay for each endpoint is the `percentile` of its last `window` latencies (never
+    less than `min_delay`). Endpoints with fewer than `min_samples` observations are sent without
+    hedging. Hedges are limited by a credit bucket that earns `max_ratio` of a hedge per request
+    (up to `burst`), and each hedge must also claim a free slot from the client's RateLimiter
+    without waiting; when either is exhausted the original request simply runs to completion.
+
+    A policy may be shared by several clients. Hedged requests run on the policy's thread pool,
+    so the pool must allow two connections per in-flight request (requests' default is 10 per host).
+
+    Example:
+        client = FuturesApiClient(jwt=token, hedging=HedgingPolicy(percentile=95, max_ratio=0.05))
+        client.get_order_book("BTCUSDT")
+        print(client.metrics.snapshot()["endpoints"]["/api/v1/market/orderBook"]["hedges"])
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        endpoints: Optional[Iterable[str]] = None,
+        min_delay: float = 0.002,
+        max_ratio: float = 0.05,
+        burst: float = 5.0,
+        window: int = 256,
+        min_samples: int = 20,
+        max_workers: int = 32
+    ) -> None:
+        """
+        Args:
+            percentile (float): Latency percentile after which a hedge is sent.
+            endpoints (Optional[Iterable[str]]): Endpoint paths to hedge (default: DEFAULT_HEDGED_ENDPOINTS).
+                Only GET requests are ever hedged.
+            min_delay (float): Lower bound on the hedge delay in seconds.
+            max_ratio (float): Long-run maximum hedges per request, e.g. 0.05 for 5%.
+            burst (float): Maximum hedges that can be sent back to back after a quiet period.
+            window (int): Recent latencies kept per endpoint.
+            min_samples (int): Observations needed before an endpoint is hedged.
+            max_workers (int): Threads available to hedged requests and their hedges.
+
+        Raises:
+            ValueError: If percentile is outside (0, 100) or max_ratio is negative.
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if max_ratio < 0:
+            raise ValueError("max_ratio must not be negative")
+        self.percentile = percentile
+        self.endpoints = frozenset(endpoints) if endpoints is not None else DEFAULT_HEDGED_ENDPOINTS
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self.burst = burst
+        self.window = window
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._delays: Dict[str, float] = {}
+        self._credit = burst
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def applies(self, method: str, endpoint: str) -> bool:
+        return method == 'GET' and endpoint in self.endpoints
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """
+        Current hedge delay in seconds for an endpoint, or None while it has too little history.
+        """
+        return self._delays.get(endpoint)
+
+    def _observe(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+            latencies.append(seconds)
+            count = len(latencies)
+            # Re-derive the threshold every few samples rather than sorting on every request.
+            if count >= self.min_samples and (count % 16 == 0 or endpoint not in self._delays):
+                ordered = sorted(latencies)
+                index = min(count - 1, int(count * self.percentile / 100))
+                self._delays[endpoint] = max(self.min_delay, ordered[index])
+
+    def _timed(self, endpoint: str, send: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            return send()
+        finally:
+            self._observe(endpoint, time.perf_counter() - started)
+
+    def _take_credit(self) -> bool:
+        with self._lock:
+            if self._credit < 1:
+                return False
+            self._credit -= 1
+            return True
+
+    def run(
+        self,
+        endpoint: str,
+        send: Callable[[bool], Any],
+        rate_limiter: Any,
+        metrics: Any,
+        deadline: Optional[float] = None
+    ) -> Any:
+        """
+        Send a request, hedging it if it is still outstanding after the endpoint's hedge delay.
+
+        Only a response with a success status wins the race: if one attempt fails or gets an error
+        status first, the other is still awaited. When neither succeeds, the original's outcome is
+        returned or raised.
+
+        Args:
+            endpoint (str): Endpoint path, used for latency history and metrics.
+            send (Callable[[bool], Any]): Performs the request and returns the response. Called with
+                True for the original and False for the hedge.
+            rate_limiter (Any): Limiter the hedge must claim a slot from (via try_acquire()).
+            metrics (Any): ClientMetrics receiving hedge outcomes.
+            deadline (Optional[float]): time.monotonic() by which the request must complete. Bounds
+                the wait for a free worker to send the original on.
+
+        Returns:
+            Any: The first successful response, else the original's response.
+
+        Raises:
+            DeadlineExceeded: If no worker picked up the original before the deadline (nothing was sent).
+            Exception: The original's error if both attempts fail (or no hedge was sent).
+        """
+        with self._lock:
+            self._credit = min(self.burst, self._credit + self.max_ratio)
+        delay = self._delays.get(endpoint)
+        if delay is None:
+            # Not enough history yet to know what slow means for this endpoint.
+            return self._timed(endpoint, lambda: send(True))
+
+        executor = self._get_executor()
+        sent = threading.Event()
+
+        def send_original() -> Any:
+            sent.set()
+            return self._timed(endpoint, lambda: send(True))
+
+        original = executor.submit(send_original)
+        # The delay runs from when the original is sent, not from when it was queued on the pool.
+        # A saturated pool must not hold the caller past its deadline.
+        if not sent.wait(None if deadline is None else max(0.0, deadline - time.monotonic())):
+            if original.cancel():
+                raise DeadlineExceeded(f"Deadline passed while waiting for a hedging worker: {endpoint}",
+                                       endpoint, 'queue')
+            sent.wait()  # Picked up just now; it is being sent.
+        done, _ = wait([original], timeout=delay)
+        if done:
+            return original.result()
+        if not self._take_credit():
+            metrics.observe_hedge(endpoint, 'capped')
+            return original.result()
+        if not rate_limiter.try_acquire():
+            with self._lock:
+                self._credit += 1  # Refund: no hedge was sent.
+            metrics.observe_hedge(endpoint, 'capped')
+            return original.result()
+
+        hedge = executor.submit(self._timed, endpoint, lambda: send(False))
+        pending = {original, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Prefer the original when both finished in the same wake-up.
+            for future in (original, hedge):
+                if future in done and _succeeded(future):
+                    metrics.observe_hedge(endpoint, 'won' if future is hedge else 'lost')
+                    (original if future is hedge else hedge).add_done_callback(_close_response)
+                    return future.result()
+        # Neither succeeded: the caller sees the original's error or error response.
+        metrics.observe_hedge(endpoint, 'lost')
+        hedge.add_done_callback(_close_response)
+        return original.result()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='zebpay-hedge')
+            return self._executor
+
+    def close(self) -> None:
+        """
+        Stop the policy's worker threads; outstanding losing requests are left to finish.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
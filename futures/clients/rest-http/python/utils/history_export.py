@@ -0,0 +1,386 @@
+"""
+Streaming export of trade and transaction history for the Zebpay futures API client.
+
+get_trade_history and get_transaction_history return one page at a time, walking back through
+time with `nextTimestamp`. Collecting months of pages into one list before writing it out makes
+memory grow with the size of the export. The exporters here write each page's rows into typed
+column buffers instead and flush them to disk every `chunk_rows` rows, so memory stays bounded
+by one chunk whatever the length of the history:
+
+    result = export_trade_history(client, "trades.parquet", since=start_ms)      # needs pyarrow
+    result = export_transaction_history(client, "transactions")                  # chunked .npz, numpy only
+    for chunk in read_history("transactions"):
+        print(chunk["amount"].sum())
+
+Two formats are supported:
+
+- "parquet": one Parquet file with a row group per chunk (optional dependency: pip install pyarrow).
+- "npz": a directory of numbered .npz archives (part-00000.npz, ...), one per chunk, each holding the
+  chunk's columns as numpy arrays.
+
+Exports are written to `<path>.partial` and renamed into place once complete, so an interrupted
+export never leaves a truncated file under the final name.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import shutil
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from client.client import FuturesApiClient
+    from .types import ExportResult
+
+# Column kinds: float64 (missing values are NaN), int64 (missing values are 0) and text.
+FLOAT = 'float'
+INT = 'int'
+TEXT = 'text'
+
+# (column name, kind, field name or path into nested dictionaries)
+ColumnSpec = Tuple[str, str, Union[str, Tuple[str, ...]]]
+
+TRADE_COLUMNS: Tuple[ColumnSpec, ...] = (
+    ('id', TEXT, 'id'),
+    ('timestamp', INT, 'timestamp'),
+    ('symbol', TEXT, 'symbol'),
+    ('order', TEXT, 'order'),
+    ('type', TEXT, 'type'),
+    ('side', TEXT, 'side'),
+    ('takerOrMaker', TEXT, 'takerOrMaker'),
+    ('price', FLOAT, 'price'),
+    ('amount', FLOAT, 'amount'),
+    ('cost', FLOAT, 'cost'),
+    ('feeCost', FLOAT, ('fee', 'cost')),
+    ('feeCurrency', TEXT, ('fee', 'currency'))
+)
+
+TRANSACTION_COLUMNS: Tuple[ColumnSpec, ...] = (
+    ('txid', TEXT, 'txid'),
+    ('timestamp', INT, 'timestamp'),
+    ('type', TEXT, 'type'),
+    ('amount', FLOAT, 'amount'),
+    ('currency', TEXT, 'currency'),
+    ('status', TEXT, 'status'),
+    ('feeCurrency', TEXT, ('fee', 'currency'))
+)
+
+DEFAULT_CHUNK_ROWS = 50_000
+
+_NUMPY_DTYPES = {FLOAT: np.float64, INT: np.int64, TEXT: np.str_}
+
+
+def _float(value: Any) -> float:
+    if value is None or value == '':
+        return float('nan')
+    return float(value)
+
+
+def _int(value: Any) -> int:
+    if value is None or value == '':
+        return 0
+    return int(value)
+
+
+def _text(value: Any) -> str:
+    return '' if value is None else str(value)
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {FLOAT: _float, INT: _int, TEXT: _text}
+
+
+def _getter(source: Union[str, Tuple[str, ...]]) -> Callable[[Dict[str, Any]], Any]:
+    if isinstance(source, str):
+        return lambda item: item.get(source)
+
+    def get(item: Dict[str, Any]) -> Any:
+        value: Any = item
+        for key in source:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+    return get
+
+
+def iter_history_pages(
+    fetch: Callable[..., Any],
+    page_size: Optional[int] = None,
+    until: Optional[int] = None,
+    since: Optional[int] = None,
+    max_pages: Optional[int] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield the items of successive history pages, newest page first.
+
+    Pages are requested with `timestamp` set to the previous page's `nextTimestamp` until a page
+    comes back empty, the cursor stops moving back in time, or the items reach `since`.
+
+    Args:
+        fetch (Callable[..., Any]): Paged history method, e.g. client.get_trade_history.
+        page_size (Optional[int]): Items per page; None uses the exchange default.
+        until (Optional[int]): Start from items before this time (ms); None starts from the newest.
+        since (Optional[int]): Stop at items older than this time (ms); they are not yielded.
+        max_pages (Optional[int]): Stop after this many pages.
+
+    Yields:
+        List[Dict[str, Any]]: Items of one page.
+    """
+    cursor = until
+    pages = 0
+    while max_pages is None or pages < max_pages:
+        data = fetch(page_size=page_size, timestamp=cursor).get('data') or {}
+        items = data.get('items') or []
+        pages += 1
+        if since is not None:
+            kept = [item for item in items if _int(item.get('timestamp')) >= since]
+            if len(kept) < len(items):
+                yield kept
+                return
+        yield items
+        next_cursor = data.get('nextTimestamp')
+        if not items or next_cursor is None or (cursor is not None and next_cursor >= cursor):
+            return
+        cursor = next_cursor
+
+
+class _NpzWriter:
+    """
+    Writes each chunk as the next part-NNNNN.npz archive in a directory.
+    """
+
+    def __init__(self, path: str, columns: Sequence[ColumnSpec], compression: Optional[str]) -> None:
+        os.makedirs(path)
+        self.path = path
+        self.save = np.savez_compressed if compression else np.savez
+        self.parts = 0
+
+    def write(self, chunk: Dict[str, np.ndarray]) -> None:
+        self.save(os.path.join(self.path, f"part-{self.parts:05d}.npz"), **chunk)
+        self.parts += 1
+
+    def close(self) -> None:
+        pass
+
+
+class _ParquetWriter:
+    """
+    Writes each chunk as a row group of one Parquet file.
+    """
+
+    def __init__(self, path: str, columns: Sequence[ColumnSpec], compression: Optional[str]) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export requires pyarrow: pip install pyarrow (or use format='npz')") from None
+        types = {FLOAT: pa.float64(), INT: pa.int64(), TEXT: pa.string()}
+        self.pa = pa
+        self.schema = pa.schema([(name, types[kind]) for name, kind, _ in columns])
+        self.writer = pq.ParquetWriter(path, self.schema, compression=compression or 'none')
+
+    def write(self, chunk: Dict[str, np.ndarray]) -> None:
+        self.writer.write_table(self.pa.Table.from_pydict(chunk, schema=self.schema))
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+_WRITERS = {'npz': _NpzWriter, 'parquet': _ParquetWriter}
+
+
+def _disk_usage(path: str) -> int:
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+    return os.path.getsize(path)
+
+
+def export_history(
+    pages: Iterator[List[Dict[str, Any]]],
+    path: str,
+    columns: Sequence[ColumnSpec],
+    format: Optional[str] = None,
+    compression: Optional[str] = 'zstd',
+    chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> ExportResult:
+    """
+    Write history pages to disk as columns, flushing every `chunk_rows` rows.
+
+    Only the current page and one chunk of column buffers are held in memory. Rows repeated at a
+    page boundary (same first-column value as a row of the previous page) are written once.
+
+    Args:
+        pages (Iterator[List[Dict[str, Any]]]): Pages of items, e.g. from iter_history_pages().
+        path (str): Output file (parquet) or directory (npz). Must not exist yet.
+        columns (Sequence[ColumnSpec]): Columns to write, e.g. TRADE_COLUMNS.
+        format (Optional[str]): 'parquet' or 'npz'; None picks parquet for paths ending in .parquet, else npz.
+        compression (Optional[str]): Parquet codec ('zstd', 'snappy', 'gzip', ...). For npz, any value
+            writes deflate-compressed archives. None writes uncompressed.
+        chunk_rows (int): Rows per chunk (Parquet row group or .npz part).
+
+    Returns:
+        ExportResult: Rows, pages and chunks written, size on disk and time taken.
+
+    Raises:
+        FileExistsError: If path already exists.
+        ImportError: If format is 'parquet' and pyarrow is not installed.
+        ValueError: If format is unknown or chunk_rows is not positive.
+    """
+    if format is None:
+        format = 'parquet' if path.endswith('.parquet') else 'npz'
+    if format not in _WRITERS:
+        raise ValueError(f"Unknown export format {format!r}; expected 'parquet' or 'npz'")
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive")
+    if os.path.exists(path):
+        raise FileExistsError(path)
+
+    started = time.perf_counter()
+    partial = f"{path}.partial"
+    if os.path.isdir(partial):
+        shutil.rmtree(partial)
+    elif os.path.exists(partial):
+        os.remove(partial)
+
+    fields = [(name, kind, _getter(source), _CONVERTERS[kind]) for name, kind, source in columns]
+    buffers: List[List[Any]] = [[] for _ in fields]
+    key_get = fields[0][2]
+    previous_keys: Set[Any] = set()
+    rows = pages_read = chunks = duplicates = 0
+
+    writer = _WRITERS[format](partial, columns, compression)
+    try:
+        def flush() -> None:
+            nonlocal chunks
+            writer.write({
+                name: np.array(buffer, dtype=_NUMPY_DTYPES[kind])
+                for (name, kind, _, _), buffer in zip(fields, buffers)
+            })
+            for buffer in buffers:
+                buffer.clear()
+            chunks += 1
+
+        for items in pages:
+            pages_read += 1
+            keys = set()
+            for item in items:
+                key = key_get(item)
+                if key is not None:
+                    if key in previous_keys:
+                        duplicates += 1
+                        continue
+                    keys.add(key)
+                for (_, _, get, convert), buffer in zip(fields, buffers):
+                    buffer.append(convert(get(item)))
+                rows += 1
+                if len(buffers[0]) >= chunk_rows:
+                    flush()
+            previous_keys = keys
+        if buffers[0] or not chunks:
+            flush()  # An empty export still gets its (empty) columns.
+        writer.close()
+    except BaseException:
+        if os.path.isdir(partial):
+            shutil.rmtree(partial, ignore_errors=True)
+        elif os.path.exists(partial):
+            os.remove(partial)
+        raise
+    os.replace(partial, path)
+
+    return {
+        'path': path,
+        'format': format,
+        'rows': rows,
+        'pages': pages_read,
+        'chunks': chunks,
+        'duplicates': duplicates,
+        'bytes': _disk_usage(path),
+        'latencyMs': (time.perf_counter() - started) * 1000
+    }
+
+
+def export_trade_history(
+    client: FuturesApiClient,
+    path: str,
+    since: Optional[int] = None,
+    until: Optional[int] = None,
+    page_size: Optional[int] = None,
+    format: Optional[str] = None,
+    compression: Optional[str] = 'zstd',
+    chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> ExportResult:
+    """
+    Stream the account's trade history to disk (columns: TRADE_COLUMNS).
+
+    Args:
+        client (FuturesApiClient): Authenticated client.
+        path (str): Output file (.parquet) or directory (npz).
+        since (Optional[int]): Oldest trade time to include (ms); None exports the whole history.
+        until (Optional[int]): Export trades before this time (ms); None starts from the newest.
+        page_size (Optional[int]): Trades per request; larger pages mean fewer requests.
+        format (Optional[str]): 'parquet' or 'npz'; see export_history().
+        compression (Optional[str]): See export_history().
+        chunk_rows (int): Rows held in memory before each write.
+
+    Returns:
+        ExportResult: Rows, pages and chunks written, size on disk and time taken.
+
+    Example:
+        export_trade_history(client, "trades.parquet", since=int((time.time() - 90 * 86400) * 1000), page_size=500)
+    """
+    pages = iter_history_pages(client.get_trade_history, page_size, until=until, since=since)
+    return export_history(pages, path, TRADE_COLUMNS, format, compression, chunk_rows)
+
+
+def export_transaction_history(
+    client: FuturesApiClient,
+    path: str,
+    since: Optional[int] = None,
+    until: Optional[int] = None,
+    page_size: Optional[int] = None,
+    format: Optional[str] = None,
+    compression: Optional[str] = 'zstd',
+    chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> ExportResult:
+    """
+    Stream the account's wallet transactions to disk (columns: TRANSACTION_COLUMNS).
+
+    Arguments are as for export_trade_history().
+    """
+    pages = iter_history_pages(client.get_transaction_history, page_size, until=until, since=since)
+    return export_history(pages, path, TRANSACTION_COLUMNS, format, compression, chunk_rows)
+
+
+def read_history(path: str, columns: Optional[Sequence[str]] = None) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Read an export back one chunk at a time, so it can be processed in bounded memory.
+
+    Args:
+        path (str): File or directory written by export_history().
+        columns (Optional[Sequence[str]]): Columns to load; None loads all.
+
+    Yields:
+        Dict[str, np.ndarray]: One chunk's columns.
+    """
+    if os.path.isdir(path):
+        for part in sorted(glob.glob(os.path.join(path, 'part-*.npz'))):
+            with np.load(part) as archive:
+                yield {name: archive[name] for name in (columns or archive.files)}
+        return
+    import pyarrow.parquet as pq
+    parquet = pq.ParquetFile(path)
+    for group in range(parquet.num_row_groups):
+        table = parquet.read_row_group(group, columns=list(columns) if columns else None)
+        yield {name: table.column(name).to_numpy() for name in table.column_names}
+
+
+def load_history(path: str, columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+    """
+    Read a whole export into memory as one array per column.
+    """
+    chunks = list(read_history(path, columns))
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]} if chunks else {}
@@ -0,0 +1,317 @@
+"""
+Local kline resampling for the Zebpay API clients.
+
+Builds higher-interval candles (5m, 15m, 1h, 4h, ...) from one base series (e.g. 1m) so a
+single get_klines call replaces one call per interval. resample() aggregates a whole history
+with vectorized numpy operations; KlineResampler keeps several intervals up to date as new or
+revised base candles arrive.
+
+Candles are bucketed by open time, aligned to the Unix epoch in UTC (weeks start on Monday),
+or to a custom offset such as IST midnight for daily candles. OHLCV aggregation follows the
+exchange: first open, highest high, lowest low, last close, summed volume.
+"""
+
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+INTERVAL_UNITS_MS = {'m': 60_000, 'h': 3_600_000, 'd': 86_400_000, 'w': 604_800_000}
+
+# The epoch was a Thursday; weekly candles open on Monday 1970-01-05.
+WEEK_ORIGIN_MS = 4 * 86_400_000
+
+
+def interval_ms(interval: str) -> int:
+    """
+    Convert an interval such as '1m', '15m', '4h', '1d' or '1w' to milliseconds.
+
+    Raises:
+        ValueError: If the interval is not a positive count followed by m, h, d or w. Month
+            intervals ('1M') are rejected: months have no fixed length.
+    """
+    if interval[-1:] == 'M':
+        raise ValueError(f"Unsupported interval: {interval!r} (month candles cannot be resampled locally)")
+    count, unit = interval[:-1], interval[-1:].lower()
+    if unit not in INTERVAL_UNITS_MS or not count.isdigit() or int(count) <= 0:
+        raise ValueError(f"Unsupported interval: {interval!r}")
+    return int(count) * INTERVAL_UNITS_MS[unit]
+
+
+def _origin(interval: str, offset_ms: int) -> int:
+    return offset_ms + (WEEK_ORIGIN_MS if interval[-1:].lower() == 'w' else 0)
+
+
+class Klines:
+    """
+    Candles as typed columns: int64 open times (ms) and float64 prices and volumes.
+
+    `complete` marks candles whose whole interval is covered by the base series; only the first
+    candle (the base series started inside its interval) and the last one (its interval is still
+    running) of a resampled series can be incomplete. Indexing with a slice (klines[-100:]) or a
+    boolean mask (klines[klines.complete]) indexes every column.
+    """
+    __slots__ = ('open_time', 'open', 'high', 'low', 'close', 'volume', 'complete')
+
+    def __init__(self, open_time: np.ndarray, open: np.ndarray, high: np.ndarray, low: np.ndarray,
+                 close: np.ndarray, volume: np.ndarray, complete: np.ndarray) -> None:
+        self.open_time = open_time
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.complete = complete
+
+    def __len__(self) -> int:
+        return len(self.open_time)
+
+    def __getitem__(self, index: Union[slice, np.ndarray]) -> 'Klines':
+        return Klines(*(getattr(self, name)[index] for name in self.__slots__))
+
+    def __repr__(self) -> str:
+        return f"Klines({len(self)} candles)"
+
+    def to_list(self, interval: str) -> List[List[Any]]:
+        """
+        Convert back to the API's k-line arrays: [startTime, open, high, low, close, volume, endTime].
+        """
+        step = interval_ms(interval)
+        return [
+            [int(t), float(o), float(h), float(lo), float(c), float(v), int(t) + step]
+            for t, o, h, lo, c, v in zip(self.open_time, self.open, self.high, self.low, self.close, self.volume)
+        ]
+
+
+def parse_klines(klines: Any) -> Klines:
+    """
+    Convert k-line arrays (or a get_klines response) into typed columns.
+
+    Accepts FuturesApiClient.get_klines and SpotClient.get_kline output. Prices and volumes may be
+    numbers or numeric strings. Rows are sorted by open time and duplicate open times keep the last row.
+    """
+    rows: Sequence[Sequence[Any]] = klines.get('data', []) if isinstance(klines, dict) else klines
+    if not rows:
+        empty = np.empty(0)
+        return Klines(np.empty(0, dtype=np.int64), empty, empty, empty, empty, empty, np.empty(0, dtype=bool))
+    count = len(rows)
+    # One fromiter pass per column; float() also parses the API's numeric strings.
+    open_time = np.fromiter(map(int, map(itemgetter(0), rows)), np.int64, count)
+    values = [np.fromiter(map(float, map(itemgetter(index), rows)), np.float64, count) for index in range(1, 6)]
+    # Keep the last row for each open time, in time order (the API may repeat a revised candle).
+    _, last = np.unique(open_time[::-1], return_index=True)
+    keep = len(open_time) - 1 - last
+    if len(keep) != len(open_time) or np.any(np.diff(open_time) < 0):
+        open_time = open_time[keep]
+        values = [column[keep] for column in values]
+    return Klines(open_time, *values, np.ones(len(open_time), dtype=bool))
+
+
+def resample(
+    klines: Any,
+    base_interval: str,
+    target_interval: str,
+    include_partial: bool = True,
+    offset_ms: int = 0
+) -> Klines:
+    """
+    Aggregate base-interval candles into a higher interval.
+
+    Args:
+        klines (Any): Base candles: a Klines, k-line arrays, or a get_klines response.
+        base_interval (str): Interval of the input, e.g. '1m'.
+        target_interval (str): Interval to build, e.g. '15m'; must be a multiple of base_interval.
+        include_partial (bool): Keep the first and last candles if their intervals are not fully
+            covered by the base candles (the history starts inside the first one, or the last one is
+            still open). Their `complete` flag is False.
+        offset_ms (int): Shift bucket boundaries from the UTC epoch, e.g. -19_800_000 for IST-aligned days.
+
+    Returns:
+        Klines: Resampled candles. Buckets with no base candles (no trading) are omitted.
+
+    Raises:
+        ValueError: If the target interval is not a multiple of the base interval.
+
+    Example:
+        base = parse_klines(client.get_klines({"symbol": "BTCUSDT", "interval": "1m", "limit": 1000}))
+        hourly = resample(base, "1m", "1h")
+    """
+    base = klines if isinstance(klines, Klines) else parse_klines(klines)
+    base_ms, target_ms = interval_ms(base_interval), interval_ms(target_interval)
+    if target_ms % base_ms:
+        raise ValueError(f"{target_interval} is not a multiple of {base_interval}")
+    if not len(base):
+        return base
+
+    origin = _origin(target_interval, offset_ms)
+    bucket_open = (base.open_time - origin) // target_ms * target_ms + origin
+    starts = np.flatnonzero(np.r_[True, bucket_open[1:] != bucket_open[:-1]])
+    ends = np.r_[starts[1:], len(bucket_open)] - 1
+
+    complete = np.ones(len(starts), dtype=bool)
+    # The oldest bucket may have started before the base history, and the newest one may be missing
+    # base candles still to come; gaps in between are periods without trades.
+    complete[0] = base.open_time[0] == bucket_open[0]
+    complete[-1] &= base.open_time[-1] + base_ms >= bucket_open[-1] + target_ms and bool(base.complete[-1])
+    result = Klines(
+        bucket_open[starts],
+        base.open[starts],
+        np.maximum.reduceat(base.high, starts),
+        np.minimum.reduceat(base.low, starts),
+        base.close[ends],
+        np.add.reduceat(base.volume, starts),
+        complete
+    )
+    return result if include_partial or complete.all() else result[complete]
+
+
+class _Series:
+    """
+    Closed candles of one interval in a fixed-capacity ring, plus the open (partial) candle.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.open_time = np.zeros(capacity, dtype=np.int64)
+        self.values = np.zeros((5, capacity))
+        self.complete = np.ones(capacity, dtype=bool)
+        self.size = 0
+        self.head = 0  # Next write position.
+        # The open candle is kept as the aggregate of its finished base candles plus the latest base
+        # candle, so a revision of the latest base candle can be applied without losing the rest.
+        self.bucket: Optional[int] = None
+        self.folded: Optional[List[float]] = None
+        self.latest: Optional[List[float]] = None
+        self.latest_time: Optional[int] = None
+        # Bucket of the first base candle, if that candle did not open the bucket (history started inside it).
+        self.partial_bucket: Optional[int] = None
+
+    def push(self, open_time: int, values: Sequence[float]) -> None:
+        self.open_time[self.head] = open_time
+        self.values[:, self.head] = values
+        self.complete[self.head] = open_time != self.partial_bucket
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def current(self) -> Optional[List[float]]:
+        if self.latest is None:
+            return self.folded
+        if self.folded is None:
+            return self.latest
+        return _merge(self.folded, self.latest)
+
+    def ordered(self) -> np.ndarray:
+        return (np.arange(self.size) + self.head - self.size) % self.capacity
+
+
+def _merge(first: Sequence[float], second: Sequence[float]) -> List[float]:
+    return [first[0], max(first[1], second[1]), min(first[2], second[2]), second[3], first[4] + second[4]]
+
+
+class KlineResampler:
+    """
+    Keeps several higher intervals updated incrementally from one base-interval stream.
+
+    Seed it with history, then feed each new base candle (or revision of the latest one, as the
+    API returns for the still-open candle) to update(). Each update costs O(number of intervals),
+    independent of history length; completed candles are kept in fixed-size numpy rings.
+
+    Example:
+        resampler = KlineResampler("1m", ["5m", "15m", "1h", "4h"])
+        resampler.update(client.get_klines({"symbol": "BTCUSDT", "interval": "1m", "limit": 1000}))
+        ...
+        resampler.update(client.get_klines({"symbol": "BTCUSDT", "interval": "1m", "limit": 2}))
+        four_hour = resampler.candles("4h")
+    """
+
+    def __init__(self, base_interval: str, intervals: Iterable[str], capacity: int = 1000, offset_ms: int = 0) -> None:
+        """
+        Args:
+            base_interval (str): Interval of the candles fed to update(), e.g. '1m'.
+            intervals (Iterable[str]): Higher intervals to maintain; each a multiple of base_interval.
+            capacity (int): Completed candles kept per interval.
+            offset_ms (int): Bucket boundary offset from the UTC epoch (see resample()).
+
+        Raises:
+            ValueError: If an interval is not a multiple of base_interval.
+        """
+        self.base_interval = base_interval
+        self.base_ms = interval_ms(base_interval)
+        self.offset_ms = offset_ms
+        self._series: Dict[str, _Series] = {}
+        self._steps: Dict[str, int] = {}
+        for interval in intervals:
+            step = interval_ms(interval)
+            if step % self.base_ms:
+                raise ValueError(f"{interval} is not a multiple of {base_interval}")
+            self._series[interval] = _Series(capacity)
+            self._steps[interval] = step
+        self.last_open_time: Optional[int] = None
+
+    @property
+    def intervals(self) -> List[str]:
+        return list(self._series)
+
+    def update(self, klines: Any) -> None:
+        """
+        Apply base candles in time order. Candles older than the latest one seen are ignored; one with
+        the same open time replaces it.
+
+        Args:
+            klines (Any): A Klines, k-line arrays, or a get_klines response.
+        """
+        base = klines if isinstance(klines, Klines) else parse_klines(klines)
+        if not len(base):
+            return
+        start = 0
+        if self.last_open_time is not None:
+            start = int(np.searchsorted(base.open_time, self.last_open_time, side='left'))
+        rows = np.column_stack((base.open, base.high, base.low, base.close, base.volume))[start:].tolist()
+        for open_time, values in zip(base.open_time[start:].tolist(), rows):
+            self._apply(open_time, values)
+            self.last_open_time = open_time
+
+    def _apply(self, open_time: int, values: List[float]) -> None:
+        for interval, series in self._series.items():
+            step = self._steps[interval]
+            origin = _origin(interval, self.offset_ms)
+            bucket = (open_time - origin) // step * step + origin
+            if series.bucket is None and open_time != bucket:
+                series.partial_bucket = bucket
+            elif series.bucket is not None and bucket != series.bucket:
+                # The base candle opens a new bucket: the previous one is complete.
+                series.push(series.bucket, series.current())
+                series.folded = series.latest = series.latest_time = None
+            elif series.latest_time is not None and open_time != series.latest_time:
+                # A newer base candle in the same bucket: the previous latest is final.
+                series.folded = series.current()
+                series.latest = None
+            series.bucket = bucket
+            series.latest = values
+            series.latest_time = open_time
+
+    def candles(self, interval: str, include_partial: bool = True) -> Klines:
+        """
+        Return closed candles for an interval (oldest first), plus the open candle if requested.
+
+        With include_partial=False only fully covered candles are returned: the open candle and
+        the first candle, if the base candles started inside its interval, are left out.
+
+        Raises:
+            KeyError: If the interval is not maintained by this resampler.
+        """
+        series = self._series[interval]
+        order = series.ordered()
+        open_time = series.open_time[order]
+        values = series.values[:, order]
+        complete = series.complete[order]
+        current = series.current()
+        if include_partial and current is not None:
+            open_time = np.append(open_time, series.bucket)
+            values = np.column_stack((values, current))
+            covered = (series.latest_time + self.base_ms >= series.bucket + self._steps[interval]
+                       and series.bucket != series.partial_bucket)
+            complete = np.append(complete, covered)
+        elif not complete.all():
+            open_time, values, complete = open_time[complete], values[:, complete], complete[complete]
+        return Klines(open_time, *values, complete)
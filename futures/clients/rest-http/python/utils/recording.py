@@ -0,0 +1,325 @@
+"""
+Record-and-replay transport for the Zebpay API clients.
+
+RecordingAdapter captures every request and response (headers, bodies and timings) to a
+gzip-compressed JSON-lines log during a live session. ReplayAdapter serves those responses
+back with the original or accelerated latency, and replay_traffic() re-issues the recorded
+requests on their original schedule. Together they let parsing, caching and scheduling
+changes be benchmarked against production traffic without network variance.
+
+Both adapters plug into the requests.Session of either client:
+
+    recorder = start_recording(client, "session.jsonl.gz")   # FuturesApiClient or SpotClient
+    ...
+    recorder.close()
+
+    start_replay(client, "session.jsonl.gz", speed=10)        # 10x faster than recorded
+"""
+
+import base64
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from io import BytesIO
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+# Request headers replaced with '***' in recordings unless redact=False.
+SENSITIVE_HEADERS = frozenset({'authorization', 'x-auth-apikey', 'x-auth-signature', 'x-api-key', 'x-api-secret'})
+
+
+def _encode_body(body: Any) -> Tuple[Optional[str], bool]:
+    """
+    Return (text, is_base64) for a request or response body.
+    """
+    if body is None:
+        return None, False
+    if isinstance(body, str):
+        return body, False
+    try:
+        return body.decode('utf-8'), False
+    except UnicodeDecodeError:
+        return base64.b64encode(body).decode('ascii'), True
+
+
+def _decode_body(text: Optional[str], is_base64: bool) -> bytes:
+    if text is None:
+        return b''
+    return base64.b64decode(text) if is_base64 else text.encode('utf-8')
+
+
+def request_key(method: str, url: str, body: Optional[str]) -> Tuple[str, str, str, str]:
+    """
+    Key used to match a live request to a recorded one: method, path, sorted query and body.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return method.upper(), parts.path, query, body or ''
+
+
+def load_records(path: str) -> List[Dict[str, Any]]:
+    """
+    Read every record from a log written by RecordingAdapter.
+    """
+    return list(iter_records(path))
+
+
+def iter_records(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records from a log written by RecordingAdapter.
+    """
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class RecordingAdapter(BaseAdapter):
+    """
+    Transport adapter that forwards to an inner adapter and logs each exchange.
+
+    Each record holds: `t` (seconds since recording started), `method`, `url`, request
+    `headers` and `body`, response `status`, `reason`, `responseHeaders` and `responseBody`,
+    and `elapsed` (seconds until the full body was read). Failed requests are recorded with
+    `error` instead of a response.
+    """
+
+    def __init__(self, path: str, inner: Optional[BaseAdapter] = None, redact: bool = True) -> None:
+        """
+        Args:
+            path (str): Log file; gzip-compressed when it ends in '.gz'.
+            inner (Optional[BaseAdapter]): Adapter that performs the requests (default: a new HTTPAdapter).
+            redact (bool): Mask credential headers in the log.
+        """
+        super().__init__()
+        self.inner = inner or HTTPAdapter()
+        self.redact = redact
+        self._file = (gzip.open if path.endswith('.gz') else open)(path, 'wt', encoding='utf-8')
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self.count = 0
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        offset = time.perf_counter() - self._origin
+        body, body_b64 = _encode_body(request.body)
+        headers = {
+            key: ('***' if self.redact and key.lower() in SENSITIVE_HEADERS else value)
+            for key, value in request.headers.items()
+        }
+        record: Dict[str, Any] = {'t': round(offset, 6), 'method': request.method, 'url': request.url,
+                                  'headers': headers, 'body': body}
+        if body_b64:
+            record['bodyBase64'] = True
+        try:
+            response = self.inner.send(request, **kwargs)
+            content = response.content
+        except Exception as e:
+            record['error'] = f"{type(e).__name__}: {e}"
+            record['elapsed'] = round(time.perf_counter() - self._origin - offset, 6)
+            self._write(record)
+            raise
+        record['elapsed'] = round(time.perf_counter() - self._origin - offset, 6)
+        response_body, response_b64 = _encode_body(content)
+        record.update({'status': response.status_code, 'reason': response.reason,
+                       'responseHeaders': dict(response.headers), 'responseBody': response_body})
+        if response_b64:
+            record['responseBodyBase64'] = True
+        self._write(record)
+        return response
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self.count += 1
+
+    def close(self) -> None:
+        """
+        Flush and close the log, and close the inner adapter.
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        self.inner.close()
+
+
+class ReplayMissError(requests.exceptions.ConnectionError):
+    """
+    Raised when a request has no matching recorded exchange.
+    """
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Transport adapter that answers requests from a recording instead of the network.
+
+    Requests are matched on method, path, query and body; repeated identical requests get
+    the recorded responses in order. With strict=False, a request whose body or query differs
+    falls back to the next unused recording for the same method and path.
+    """
+
+    def __init__(self, records: List[Dict[str, Any]], speed: Optional[float] = 1.0, strict: bool = False) -> None:
+        """
+        Args:
+            records (List[Dict[str, Any]]): Records from load_records().
+            speed (Optional[float]): Latency scale: 1.0 waits the recorded time, 10 is ten times faster,
+                None or 0 answers immediately.
+            strict (bool): Only serve exact matches.
+        """
+        super().__init__()
+        self.speed = speed
+        self.strict = strict
+        self._exact: Dict[Tuple[str, str, str, str], Deque[Dict[str, Any]]] = {}
+        self._by_path: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        for record in records:
+            key = request_key(record['method'], record['url'], record.get('body'))
+            self._exact.setdefault(key, deque()).append(record)
+            self._by_path.setdefault(key[:2], deque()).append(record)
+        self.served = 0
+        self.misses = 0
+
+    @classmethod
+    def from_file(cls, path: str, speed: Optional[float] = 1.0, strict: bool = False) -> 'ReplayAdapter':
+        return cls(load_records(path), speed, strict)
+
+    def _take(self, request: requests.PreparedRequest) -> Optional[Dict[str, Any]]:
+        body, _ = _encode_body(request.body)
+        key = request_key(request.method, request.url, body)
+        with self._lock:
+            for queue in (self._exact.get(key),) if self.strict else (self._exact.get(key), self._by_path.get(key[:2])):
+                while queue:
+                    record = queue.popleft()
+                    # Each record sits in both indexes; skip ones already served through the other.
+                    if not record.get('_served'):
+                        record['_served'] = True
+                        return record
+        return None
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        record = self._take(request)
+        if record is None:
+            self.misses += 1
+            raise ReplayMissError(f"No recorded response for {request.method} {request.url}", request=request)
+        self.served += 1
+        if self.speed:
+            time.sleep(record.get('elapsed', 0.0) / self.speed)
+        if 'error' in record:
+            raise requests.exceptions.ConnectionError(f"Replayed error: {record['error']}", request=request)
+
+        response = requests.Response()
+        response.status_code = record['status']
+        response.reason = record.get('reason') or ''
+        response.headers = CaseInsensitiveDict(record.get('responseHeaders') or {})
+        response._content = _decode_body(record.get('responseBody'), record.get('responseBodyBase64', False))
+        response.raw = BytesIO(response._content)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=record.get('elapsed', 0.0))
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _session_of(client: Any) -> requests.Session:
+    # FuturesApiClient keeps its session in http_session, SpotClient in session.
+    return getattr(client, 'http_session', None) or client.session
+
+
+def start_recording(client: Any, path: str, redact: bool = True) -> RecordingAdapter:
+    """
+    Record all of a client's traffic to `path`, on top of its current transport.
+
+    Args:
+        client (Any): A FuturesApiClient or SpotClient.
+        path (str): Log file; use a '.gz' suffix for a compressed log.
+        redact (bool): Mask credential headers in the log.
+
+    Returns:
+        RecordingAdapter: Call close() on it to finish the log.
+    """
+    session = _session_of(client)
+    recorder = RecordingAdapter(path, session.get_adapter('https://'), redact)
+    session.mount('https://', recorder)
+    session.mount('http://', recorder)
+    return recorder
+
+
+def start_replay(client: Any, path: str, speed: Optional[float] = 1.0, strict: bool = False) -> ReplayAdapter:
+    """
+    Serve all of a client's requests from a recording instead of the network.
+
+    Args:
+        client (Any): A FuturesApiClient or SpotClient.
+        path (str): Log written by start_recording().
+        speed (Optional[float]): Latency scale (1.0 = as recorded, None = no delay).
+        strict (bool): Only serve exact request matches.
+
+    Returns:
+        ReplayAdapter: Exposes `served` and `misses` counters.
+    """
+    session = _session_of(client)
+    replayer = ReplayAdapter.from_file(path, speed, strict)
+    session.mount('https://', replayer)
+    session.mount('http://', replayer)
+    return replayer
+
+
+def replay_traffic(
+    records: List[Dict[str, Any]],
+    send: Callable[[Dict[str, Any]], Any],
+    speed: Optional[float] = 1.0,
+    max_workers: int = 32
+) -> List[Tuple[Dict[str, Any], Any, Optional[BaseException], float]]:
+    """
+    Re-issue recorded requests on their original schedule, preserving concurrency.
+
+    Args:
+        records (List[Dict[str, Any]]): Records from load_records().
+        send (Callable[[Dict[str, Any]], Any]): Performs one request given its record, e.g. via a session
+            pointed at a stub server or through a client method.
+        speed (Optional[float]): Schedule scale (1.0 = recorded inter-arrival times, 10 = ten times faster,
+            None or 0 = as fast as possible).
+        max_workers (int): Maximum requests in flight.
+
+    Returns:
+        List of (record, result, error, latency seconds) in recorded order.
+
+    Example:
+        session = requests.Session()
+        results = replay_traffic(
+            load_records("session.jsonl.gz"),
+            lambda r: session.request(r["method"], r["url"].replace(PROD, STUB), data=r["body"]),
+            speed=5,
+        )
+    """
+    def run(record: Dict[str, Any], due: float) -> Tuple[Dict[str, Any], Any, Optional[BaseException], float]:
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        started = time.perf_counter()
+        try:
+            return record, send(record), None, time.perf_counter() - started
+        except Exception as e:
+            return record, None, e, time.perf_counter() - started
+
+    ordered = sorted(records, key=lambda record: record.get('t', 0.0))
+    origin = time.perf_counter()
+    first = ordered[0].get('t', 0.0) if ordered else 0.0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(run, record, origin + ((record.get('t', 0.0) - first) / speed if speed else 0.0))
+            for record in ordered
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,54 @@
+"""
+Request timeouts for the Zebpay futures API client: per-endpoint timeout classes and per-call deadlines.
+
+A client given per-class timeouts (e.g. config.TIMEOUT_CLASSES) uses the timeout of each request's
+class, so a stuck market-data poll gives up quickly while order placement gets more time. Deadlines
+come from zebpay_core.deadlines and are re-exported here:
+
+    with deadline(2.0):
+        client.cancel_order({"clientOrderId": "order123"})   # DeadlineExceeded after 2s at most
+"""
+
+from typing import Dict, Optional
+
+from zebpay_core.deadlines import current_deadline, deadline, deadline_at  # noqa: F401
+
+from . import config
+
+# Timeout classes (keys of config.TIMEOUT_CLASSES).
+MARKET_DATA = 'market_data'
+REFERENCE = 'reference'
+ACCOUNT = 'account'
+ORDER = 'order'
+CANCEL = 'cancel'
+
+# Class of reads from each endpoint group in config.ENDPOINTS.
+_GROUP_CLASSES = {
+    'market': MARKET_DATA,
+    'system': MARKET_DATA,
+    'exchange': REFERENCE,
+    'wallet': ACCOUNT,
+    'trade': ACCOUNT
+}
+
+ROUTE_CLASSES: Dict[str, str] = {
+    path: _GROUP_CLASSES[group]
+    for groups in config.ENDPOINTS.values()
+    for group, endpoints in groups.items()
+    for path in endpoints.values()
+}
+
+# Writes that reduce exposure share the cancel class whatever their method.
+CANCEL_ROUTES = frozenset({config.get_endpoint(['private', 'trade', 'close_position'])})
+
+
+def timeout_class(method: str, route: str) -> Optional[str]:
+    """
+    Timeout class of a request: DELETEs and position closes are CANCEL, other writes are ORDER,
+    and reads take the class of their endpoint group. None for routes not in config.ENDPOINTS.
+    """
+    if method == 'DELETE' or route in CANCEL_ROUTES:
+        return CANCEL
+    if method != 'GET':
+        return ORDER
+    return ROUTE_CLASSES.get(route)
@@ -0,0 +1,288 @@
+"""
+Aggregated-trade tape for the Zebpay futures API client.
+
+get_agg_trade returns a window of the most recent trades, so consecutive polls overlap. A
+TradeTape keeps one symbol's trades exactly once, de-duplicated by aggregate trade id, in a
+fixed-capacity ring of typed numpy columns. Rolling aggregates (volume, VWAP, buy/sell split)
+over the last N seconds are computed with binary searches and vectorized sums over the ring,
+so memory stays bounded and queries do not walk Python lists.
+
+    tape = TradeTape("BTCUSDT", capacity=50_000)
+    while True:
+        tape.poll(client)
+        print(tape.vwap(60), tape.volume(10, side="BUY"))
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .types import TradeWindowStats
+
+# Taker side stored in the `side` column.
+SIDE_BUY = 1
+SIDE_SELL = -1
+
+# Field names used by the documented API and by the compact exchange format.
+_LONG_FIELDS = ('aggregateTradeId', 'price', 'quantity', 'tradeTime', 'isBuyerMarketMaker')
+_SHORT_FIELDS = ('a', 'p', 'q', 'T', 'm')
+
+
+class Trades:
+    """
+    Trades as typed columns, oldest first: int64 ids and times (ms), float64 prices and quantities,
+    and int8 taker side (SIDE_BUY or SIDE_SELL).
+    """
+    __slots__ = ('trade_id', 'price', 'quantity', 'time', 'side')
+
+    def __init__(self, trade_id: np.ndarray, price: np.ndarray, quantity: np.ndarray, time: np.ndarray,
+                 side: np.ndarray) -> None:
+        self.trade_id = trade_id
+        self.price = price
+        self.quantity = quantity
+        self.time = time
+        self.side = side
+
+    def __len__(self) -> int:
+        return len(self.trade_id)
+
+    def __getitem__(self, index: slice) -> 'Trades':
+        return Trades(*(getattr(self, name)[index] for name in self.__slots__))
+
+    def __repr__(self) -> str:
+        return f"Trades({len(self)} trades)"
+
+
+def parse_agg_trades(trades: Any) -> Trades:
+    """
+    Convert aggregate trades (or a get_agg_trade response) into typed columns sorted by trade id.
+
+    Accepts both the documented field names (aggregateTradeId, price, ...) and the compact
+    ones (a, p, q, T, m). Prices and quantities may be numbers or numeric strings.
+    """
+    rows: Sequence[Any] = (trades.get('data') or []) if isinstance(trades, dict) else trades
+    count = len(rows)
+    if not count:
+        return Trades(np.empty(0, dtype=np.int64), np.empty(0), np.empty(0), np.empty(0, dtype=np.int64),
+                      np.empty(0, dtype=np.int8))
+    id_key, price_key, qty_key, time_key, maker_key = _LONG_FIELDS if _LONG_FIELDS[0] in rows[0] else _SHORT_FIELDS
+    trade_id = np.fromiter((int(row[id_key]) for row in rows), np.int64, count)
+    price = np.fromiter((float(row[price_key]) for row in rows), np.float64, count)
+    quantity = np.fromiter((float(row[qty_key]) for row in rows), np.float64, count)
+    trade_time = np.fromiter((int(row[time_key]) for row in rows), np.int64, count)
+    # The buyer being the maker means the taker sold.
+    side = np.fromiter((SIDE_SELL if row[maker_key] else SIDE_BUY for row in rows), np.int8, count)
+    if np.any(np.diff(trade_id) <= 0):
+        _, keep = np.unique(trade_id, return_index=True)
+        trade_id, price, quantity, trade_time, side = (
+            column[keep] for column in (trade_id, price, quantity, trade_time, side)
+        )
+    return Trades(trade_id, price, quantity, trade_time, side)
+
+
+class TradeTape:
+    """
+    One symbol's aggregate trades, de-duplicated by id, in a fixed-capacity ring buffer.
+
+    Aggregate trade ids increase with time, so a trade is new exactly when its id is above the
+    newest id already stored; overlapping polls cost one comparison per trade and no lookup
+    table. When the ring is full the oldest trades are overwritten, so windows longer than the
+    retained history only see what is still stored (see oldest_time). A jump in ids between
+    polls means trades were missed because polling was too slow; it is counted in `missed`.
+
+    Updates and queries are thread-safe.
+    """
+
+    def __init__(self, symbol: Optional[str] = None, capacity: int = 10_000) -> None:
+        """
+        Args:
+            symbol (Optional[str]): Symbol polled by poll(); not needed when feeding update() directly.
+            capacity (int): Maximum number of trades kept.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.symbol = symbol
+        self.capacity = capacity
+        self._trade_id = np.zeros(capacity, dtype=np.int64)
+        self._price = np.zeros(capacity)
+        self._quantity = np.zeros(capacity)
+        self._time = np.zeros(capacity, dtype=np.int64)
+        self._side = np.zeros(capacity, dtype=np.int8)
+        self._size = 0
+        self._head = 0  # Next write position.
+        self.last_id: Optional[int] = None
+        self.duplicates = 0
+        self.missed = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"TradeTape({self.symbol!r}, {self._size}/{self.capacity} trades)"
+
+    # ------------------- INGESTION -------------------
+    def poll(self, client: Any) -> int:
+        """
+        Fetch the latest trades with client.get_agg_trade(symbol) and add the new ones.
+
+        Returns:
+            int: Number of trades added.
+
+        Raises:
+            ValueError: If the tape was created without a symbol.
+        """
+        if not self.symbol:
+            raise ValueError("TradeTape.poll() needs a symbol")
+        return self.update(client.get_agg_trade(self.symbol))
+
+    def update(self, trades: Any) -> int:
+        """
+        Add trades not seen before; ids at or below the newest stored id are skipped.
+
+        Args:
+            trades (Any): A Trades, a list of aggregate trades, or a get_agg_trade response.
+
+        Returns:
+            int: Number of trades added.
+        """
+        batch = trades if isinstance(trades, Trades) else parse_agg_trades(trades)
+        with self._lock:
+            if self.last_id is not None:
+                start = int(np.searchsorted(batch.trade_id, self.last_id, side='right'))
+                self.duplicates += start
+                batch = batch[start:]
+            added = len(batch)
+            if not added:
+                return 0
+            first_id = int(batch.trade_id[0])
+            if self.last_id is not None and first_id > self.last_id + 1:
+                self.missed += first_id - self.last_id - 1
+            self.last_id = int(batch.trade_id[-1])
+
+            if added > self.capacity:
+                batch = batch[-self.capacity:]
+            positions = (self._head + np.arange(len(batch))) % self.capacity
+            self._trade_id[positions] = batch.trade_id
+            self._price[positions] = batch.price
+            self._quantity[positions] = batch.quantity
+            self._time[positions] = batch.time
+            self._side[positions] = batch.side
+            self._head = (self._head + len(batch)) % self.capacity
+            self._size = min(self._size + len(batch), self.capacity)
+            return added
+
+    # ------------------- QUERIES -------------------
+    @property
+    def oldest_time(self) -> Optional[int]:
+        """Trade time (ms) of the oldest stored trade, or None when empty."""
+        with self._lock:
+            return int(self._time[(self._head - self._size) % self.capacity]) if self._size else None
+
+    @property
+    def latest_time(self) -> Optional[int]:
+        """Trade time (ms) of the newest stored trade, or None when empty."""
+        with self._lock:
+            return int(self._time[self._head - 1]) if self._size else None
+
+    def _segments(self) -> List[slice]:
+        # The ring holds two runs in time order: [head, capacity) is older than [0, head) once full.
+        if self._size < self.capacity:
+            return [slice(0, self._size)]
+        return [slice(self._head, self.capacity), slice(0, self._head)]
+
+    def _window(self, seconds: Optional[float], end_ms: Optional[int]) -> Tuple[List[slice], int, int]:
+        latest = int(self._time[self._head - 1]) if self._size else 0
+        end = max(int(time.time() * 1000), latest) if end_ms is None else end_ms
+        start = -2 ** 63 if seconds is None else end - int(seconds * 1000)
+        slices = []
+        for segment in self._segments():
+            times = self._time[segment]
+            lo = int(np.searchsorted(times, start, side='left'))
+            hi = int(np.searchsorted(times, end, side='right'))
+            if hi > lo:
+                slices.append(slice(segment.start + lo, segment.start + hi))
+        return slices, start, end
+
+    def trades(self, seconds: Optional[float] = None, end_ms: Optional[int] = None) -> Trades:
+        """
+        Copy of the stored trades, oldest first, optionally limited to a window.
+
+        Args:
+            seconds (Optional[float]): Only trades from the last `seconds` before end_ms (default: all).
+            end_ms (Optional[int]): Window end in ms (default: now, or the newest trade if later).
+        """
+        with self._lock:
+            slices, _, _ = self._window(seconds, end_ms)
+            columns = (self._trade_id, self._price, self._quantity, self._time, self._side)
+            return Trades(*(np.concatenate([column[s] for s in slices]) if slices else column[:0].copy()
+                            for column in columns))
+
+    def stats(self, seconds: float, end_ms: Optional[int] = None) -> TradeWindowStats:
+        """
+        Volume, buy/sell split, notional, VWAP and price range over the last `seconds`.
+
+        Args:
+            seconds (float): Window length in seconds.
+            end_ms (Optional[int]): Window end in ms (default: now, or the newest trade if later).
+                Server trade times are compared as-is, so pass a server-clock time if clocks differ.
+
+        Returns:
+            TradeWindowStats: Aggregates over trades with start <= tradeTime <= end.
+
+        Example:
+            stats = tape.stats(60)
+            imbalance = (stats["buyVolume"] - stats["sellVolume"]) / max(stats["volume"], 1e-12)
+        """
+        with self._lock:
+            slices, start, end = self._window(seconds, end_ms)
+            trades = volume = buy_volume = notional = 0.0
+            high = low = last = None
+            for s in slices:
+                quantity, price = self._quantity[s], self._price[s]
+                trades += len(quantity)
+                volume += float(quantity.sum())
+                buy_volume += float(quantity[self._side[s] == SIDE_BUY].sum())
+                notional += float(price @ quantity)
+                high = max(high, float(price.max())) if high is not None else float(price.max())
+                low = min(low, float(price.min())) if low is not None else float(price.min())
+                last = float(price[-1])
+        return {
+            'trades': int(trades),
+            'volume': volume,
+            'buyVolume': buy_volume,
+            'sellVolume': volume - buy_volume,
+            'notional': notional,
+            'vwap': notional / volume if volume else None,
+            'high': high,
+            'low': low,
+            'last': last,
+            'startTime': start,
+            'endTime': end
+        }
+
+    def volume(self, seconds: float, side: Optional[str] = None, end_ms: Optional[int] = None) -> float:
+        """
+        Quantity traded over the last `seconds`, optionally only taker 'BUY' or 'SELL' trades.
+        """
+        stats = self.stats(seconds, end_ms)
+        if side is None:
+            return stats['volume']
+        side = side.upper()
+        if side not in ('BUY', 'SELL'):
+            raise ValueError("side must be 'BUY' or 'SELL'")
+        return stats['buyVolume'] if side == 'BUY' else stats['sellVolume']
+
+    def vwap(self, seconds: float, end_ms: Optional[int] = None) -> Optional[float]:
+        """
+        Volume-weighted average price over the last `seconds`, or None without trades.
+        """
+        return self.stats(seconds, end_ms)['vwap']
@@ -796,3 +796,357 @@ class TransactionsListResponse(TypedDict):
     items: List[Transaction]
     totalCount: int
     nextTimestamp: int
+
+# ---------------------------
+# Batch Operation Types
+# ---------------------------
+class BatchItemResult(TypedDict):
+    """
+    Outcome of a single request within a batch operation.
+
+    Attributes:
+        index (int): Position of the request in the submitted batch.
+        request (Dict[str, Any]): Parameters that were submitted.
+        response (Optional[ApiResponse[Any]]): API response, or None if the request failed.
+        error (Optional[Exception]): Exception raised by the request, or None on success.
+        latencyMs (float): Time taken by this request in milliseconds.
+    """
+    index: int
+    request: Dict[str, Any]
+    response: Optional[ApiResponse[Any]]
+    error: Optional[Exception]
+    latencyMs: float
+
+class BatchResult(TypedDict):
+    """
+    Represents the outcome of a batch operation.
+
+    Attributes:
+        results (List[BatchItemResult]): Per-request outcomes, in input order.
+        succeeded (int): Number of requests that completed without error.
+        failed (int): Number of requests that raised an error.
+        latencyMs (float): End-to-end batch latency in milliseconds.
+    """
+    results: List[BatchItemResult]
+    succeeded: int
+    failed: int
+    latencyMs: float
+
+# ---------------------------
+# Kill Switch Types
+# ---------------------------
+class KillSwitchAction(TypedDict):
+    """
+    Outcome of a single cancel or close request issued by the kill switch.
+
+    Attributes:
+        action (str): One of "cancel_futures_orders", "cancel_spot_orders", "close_position",
+            or "get_positions", "get_trading_pairs" or "get_spot_orders" when that lookup failed.
+        target (Optional[str]): Spot symbol or futures position ID the action applied to (symbol and side
+            for a position without an ID).
+        response (Optional[Any]): API response, or None if the request failed or timed out.
+        error (Optional[Exception]): Exception raised, TimeoutError if the deadline passed first.
+        latencyMs (float): Time from kill switch start until this action finished, in milliseconds.
+    """
+    action: str
+    target: Optional[str]
+    response: Optional[Any]
+    error: Optional[Exception]
+    latencyMs: float
+
+class KillSwitchReport(TypedDict):
+    """
+    Represents the result of a kill switch run.
+
+    Attributes:
+        actions (List[KillSwitchAction]): Every cancel and close that was issued.
+        flat (Optional[bool]): True if verification found nothing open, None if verification was skipped or failed.
+        openPositions (List[Position]): Futures positions still open after verification.
+        openSpotOrders (Dict[str, List[Dict[str, Any]]]): Spot orders still active after verification, by symbol.
+        latencyMs (float): Total run time in milliseconds.
+    """
+    actions: List[KillSwitchAction]
+    flat: Optional[bool]
+    openPositions: List[Position]
+    openSpotOrders: Dict[str, List[Dict[str, Any]]]
+    latencyMs: float
+
+# ---------------------------
+# Order Manager Types
+# ---------------------------
+class TrackedOrder(TypedDict):
+    """
+    Client-side view of an order maintained by the order manager.
+
+    Attributes:
+        id (str): Order identifier (clientOrderId for futures, orderId for spot).
+        symbol (str): Trading symbol.
+        side (Optional[str]): 'BUY' or 'SELL', when known.
+        status (str): One of OPEN, PARTIALLY_FILLED, PENDING_CANCEL, FILLED, CANCELED, REJECTED or CLOSED.
+        price (Optional[float]): Order price, when known.
+        amount (Optional[float]): Order quantity, when known.
+        filled (float): Quantity filled so far.
+        updatedAt (float): Local time (seconds since epoch) of the last state change.
+        raw (Dict[str, Any]): Latest order payload received from the exchange.
+    """
+    id: str
+    symbol: str
+    side: Optional[str]
+    status: str
+    price: Optional[float]
+    amount: Optional[float]
+    filled: float
+    updatedAt: float
+    raw: Dict[str, Any]
+
+class OrderEvent(TypedDict):
+    """
+    Change notification emitted by the order manager.
+
+    Attributes:
+        type (str): 'NEW' for a newly tracked order, 'FILL' when the filled quantity grows,
+            or 'STATUS' when the status changes.
+        order (TrackedOrder): Order state after the change.
+        previousStatus (Optional[str]): Status before the change (None for NEW).
+        filledDelta (float): Quantity filled since the previous state (FILL events).
+    """
+    type: str
+    order: TrackedOrder
+    previousStatus: Optional[str]
+    filledDelta: float
+
+# ---------------------------
+# Account State Types
+# ---------------------------
+class AccountSnapshot(TypedDict, Generic[T]):
+    """
+    Cached account data served by the account state view.
+
+    Attributes:
+        data (T): Cached `data` field of the last successful response.
+        fetchedAt (float): Local time (seconds since epoch) the data was fetched.
+        ageSeconds (float): Seconds elapsed since the data was fetched.
+        stale (bool): True if one of our own mutations happened after the fetch.
+    """
+    data: T
+    fetchedAt: float
+    ageSeconds: float
+    stale: bool
+
+# ---------------------------
+# Client Pool Types
+# ---------------------------
+class AccountResult(TypedDict):
+    """
+    Outcome of one account's request within a scatter-gather call.
+
+    Attributes:
+        response (Optional[ApiResponse[Any]]): API response, or None if the request failed.
+        error (Optional[Exception]): Exception raised by the request, or None on success.
+        latencyMs (float): Time taken by this account's request in milliseconds, including rate-limit waits.
+    """
+    response: Optional[ApiResponse[Any]]
+    error: Optional[Exception]
+    latencyMs: float
+
+class ScatterResult(TypedDict):
+    """
+    Consolidated outcome of a call made for many accounts at once.
+
+    Attributes:
+        results (Dict[str, AccountResult]): Per-account outcomes keyed by account id, in pool order.
+        succeeded (int): Number of accounts whose request completed without error.
+        failed (int): Number of accounts whose request raised an error.
+        latencyMs (float): End-to-end latency of the whole call in milliseconds.
+    """
+    results: Dict[str, AccountResult]
+    succeeded: int
+    failed: int
+    latencyMs: float
+
+# ---------------------------
+# Trade Tape Types
+# ---------------------------
+class TradeWindowStats(TypedDict):
+    """
+    Aggregates over the trades of a rolling time window.
+
+    Attributes:
+        trades (int): Number of aggregate trades in the window.
+        volume (float): Total quantity traded.
+        buyVolume (float): Quantity of trades where the taker was the buyer.
+        sellVolume (float): Quantity of trades where the taker was the seller.
+        notional (float): Sum of price * quantity.
+        vwap (Optional[float]): Volume-weighted average price, or None without trades.
+        high (Optional[float]): Highest trade price, or None without trades.
+        low (Optional[float]): Lowest trade price, or None without trades.
+        last (Optional[float]): Most recent trade price, or None without trades.
+        startTime (int): Window start in milliseconds (inclusive).
+        endTime (int): Window end in milliseconds (inclusive).
+    """
+    trades: int
+    volume: float
+    buyVolume: float
+    sellVolume: float
+    notional: float
+    vwap: Optional[float]
+    high: Optional[float]
+    low: Optional[float]
+    last: Optional[float]
+    startTime: int
+    endTime: int
+
+# ---------------------------
+# Connection Prewarming Types
+# ---------------------------
+class PrewarmResult(TypedDict):
+    """
+    Outcome of opening pooled connections ahead of the first request.
+
+    Attributes:
+        host (str): Host whose connection pool was warmed.
+        opened (int): New connections established (DNS, TCP and TLS done).
+        reused (int): Pooled connections that were already open and still alive.
+        failed (int): Connections that could not be opened.
+        errors (List[str]): Error messages for the failed connections (and a failed ping).
+        pingMs (Optional[float]): Round trip of the validating get_system_time call, or None if not sent or failed.
+        latencyMs (float): Total time taken in milliseconds.
+    """
+    host: str
+    opened: int
+    reused: int
+    failed: int
+    errors: List[str]
+    pingMs: Optional[float]
+    latencyMs: float
+
+# ---------------------------
+# History Export Types
+# ---------------------------
+class ExportResult(TypedDict):
+    """
+    Outcome of streaming a paged history to disk.
+
+    Attributes:
+        path (str): File (parquet) or directory (npz) written.
+        format (str): 'parquet' or 'npz'.
+        rows (int): Rows written.
+        pages (int): Pages requested.
+        chunks (int): Chunks written (Parquet row groups or .npz parts).
+        duplicates (int): Rows skipped because the previous page already contained them.
+        bytes (int): Size of the export on disk.
+        latencyMs (float): Total time taken in milliseconds, including requests.
+    """
+    path: str
+    format: str
+    rows: int
+    pages: int
+    chunks: int
+    duplicates: int
+    bytes: int
+    latencyMs: float
+
+# ---------------------------
+# PnL Analytics Types
+# ---------------------------
+class SymbolPnL(TypedDict):
+    """
+    Trading result for one symbol over a set of fills.
+
+    Attributes:
+        symbol (str): Trading symbol.
+        fills (int): Number of fills.
+        boughtQty (float): Total quantity bought.
+        soldQty (float): Total quantity sold.
+        notional (float): Traded value (price x amount) in the quote currency.
+        position (float): Open position after the last fill, negative when short.
+        avgEntryPrice (Optional[float]): Entry price of the open position, or None when flat.
+        costBasis (float): Entry value of the open position (avgEntryPrice x |position|).
+        realizedPnl (float): PnL of closed quantity in the quote currency, before fees.
+        unrealizedPnl (Optional[float]): PnL of the open position at markPrice, or None without a mark.
+        markPrice (Optional[float]): Price used for unrealizedPnl.
+        fees (Dict[str, float]): Fees paid per fee currency.
+        firstTimestamp (int): Time of the first fill in milliseconds.
+        lastTimestamp (int): Time of the last fill in milliseconds.
+    """
+    symbol: str
+    fills: int
+    boughtQty: float
+    soldQty: float
+    notional: float
+    position: float
+    avgEntryPrice: Optional[float]
+    costBasis: float
+    realizedPnl: float
+    unrealizedPnl: Optional[float]
+    markPrice: Optional[float]
+    fees: Dict[str, float]
+    firstTimestamp: int
+    lastTimestamp: int
+
+# ---------------------------
+# Risk Engine Types
+# ---------------------------
+class PositionRisk(TypedDict):
+    """
+    Locally computed margin state of one position at its latest mark price.
+
+    Attributes:
+        id (str): Position id.
+        symbol (str): Trading symbol.
+        side (str): 'long' or 'short'.
+        marginMode (str): 'isolated' or 'cross'.
+        size (float): Position size in base units (contracts x contractSize).
+        entryPrice (float): Average entry price.
+        markPrice (float): Mark price used.
+        notional (float): size x markPrice.
+        unrealizedPnl (float): PnL at markPrice.
+        marginBalance (float): Collateral plus PnL (isolated), or cross wallet balance plus all cross PnL (cross).
+        maintenanceMargin (float): Maintenance margin of this position at markPrice.
+        marginRatio (float): Maintenance margin over margin balance (account-wide for cross); liquidation at 1.
+        liquidationPrice (Optional[float]): Mark price at which marginRatio reaches 1, or None if there is none.
+        liquidationDistance (Optional[float]): Fraction of markPrice the price can move against the position
+            before liquidationPrice; negative once past it.
+    """
+    id: str
+    symbol: str
+    side: str
+    marginMode: str
+    size: float
+    entryPrice: float
+    markPrice: float
+    notional: float
+    unrealizedPnl: float
+    marginBalance: float
+    maintenanceMargin: float
+    marginRatio: float
+    liquidationPrice: Optional[float]
+    liquidationDistance: Optional[float]
+
+class RiskSummary(TypedDict):
+    """
+    Account-wide view of the risk engine.
+
+    Attributes:
+        positions (int): Open positions tracked.
+        notional (float): Total notional at mark prices.
+        unrealizedPnl (float): Total unrealized PnL.
+        maintenanceMargin (float): Total maintenance margin.
+        maxMarginRatio (Optional[float]): Highest margin ratio, or None without positions.
+        minLiquidationDistance (Optional[float]): Smallest distance to liquidation, or None if no position has one.
+        crossBalance (float): Cross wallet balance used for cross positions.
+        reconciledAt (Optional[float]): Unix time of the last reconcile.
+        ageSeconds (Optional[float]): Seconds since the last reconcile.
+        liquidationDrift (Optional[float]): Largest relative gap between local and server liquidation
+            prices at the last reconcile.
+    """
+    positions: int
+    notional: float
+    unrealizedPnl: float
+    maintenanceMargin: float
+    maxMarginRatio: Optional[float]
+    minLiquidationDistance: Optional[float]
+    crossBalance: float
+    reconciledAt: Optional[float]
+    ageSeconds: Optional[float]
+    liquidationDrift: Optional[float]
@@ -0,0 +1,8 @@
+"""
+Test setup: import zebpay_core from this checkout when it is not installed.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
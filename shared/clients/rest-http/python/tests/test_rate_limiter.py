@@ -0,0 +1,88 @@
+"""
+RateLimiter window accounting and waiter ordering.
+"""
+
+import threading
+import time
+
+import pytest
+
+from zebpay_core.rate_limiter import PRIORITY_CRITICAL, PRIORITY_NORMAL, RateLimiter
+
+
+def wait_for_waiters(limiter, count):
+    give_up = time.monotonic() + 2
+    while len(limiter._waiters) < count:
+        assert time.monotonic() < give_up, 'waiter never queued'
+        time.sleep(0.001)
+
+
+def test_never_exceeds_the_window():
+    limiter = RateLimiter(max_requests=2, period=0.1)
+    granted = []
+    for _ in range(6):
+        limiter.acquire()
+        granted.append(time.monotonic())
+
+    for i in range(2, len(granted)):
+        assert granted[i] - granted[i - 2] >= 0.1 - 1e-3
+
+
+def test_queued_callers_are_served_by_priority_then_arrival():
+    # The first slot frees after one period, by which time every caller below is queued.
+    limiter = RateLimiter(max_requests=1, period=0.2)
+    limiter.acquire()
+    served = []
+
+    def caller(name, priority):
+        limiter.acquire(priority)
+        served.append(name)
+
+    threads = []
+    for name, priority in [('n1', PRIORITY_NORMAL), ('n2', PRIORITY_NORMAL), ('c1', PRIORITY_CRITICAL),
+                           ('n3', PRIORITY_NORMAL), ('c2', PRIORITY_CRITICAL)]:
+        thread = threading.Thread(target=caller, args=(name, priority))
+        thread.start()
+        threads.append(thread)
+        wait_for_waiters(limiter, len(threads))
+    for thread in threads:
+        thread.join(5)
+
+    assert served == ['c1', 'c2', 'n1', 'n2', 'n3']
+
+
+def test_thread_priority_context_applies_to_acquire():
+    limiter = RateLimiter(max_requests=1, period=0.2)
+    limiter.acquire()
+    served = []
+
+    def normal():
+        limiter.acquire()
+        served.append('normal')
+
+    def critical():
+        with limiter.priority(PRIORITY_CRITICAL):
+            limiter.acquire()
+        served.append('critical')
+
+    first = threading.Thread(target=normal)
+    first.start()
+    wait_for_waiters(limiter, 1)
+    second = threading.Thread(target=critical)
+    second.start()
+    wait_for_waiters(limiter, 2)
+    for thread in (first, second):
+        thread.join(5)
+
+    assert served == ['critical', 'normal']
+
+
+def test_timed_out_waiter_leaves_the_queue():
+    limiter = RateLimiter(max_requests=1, period=60)
+    limiter.acquire()
+
+    with pytest.raises(TimeoutError):
+        limiter.acquire(timeout=0.02)
+
+    assert limiter._waiters == []
+    assert limiter.try_acquire() is False
@@ -0,0 +1,87 @@
+"""
+Transport request path: signing order and rate-limit queueing.
+"""
+
+import json
+import threading
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from zebpay_core.deadlines import deadline
+from zebpay_core.rate_limiter import RateLimiter
+from zebpay_core.transport import DeadlineExceeded, Transport
+
+
+class CannedAdapter(BaseAdapter):
+    """
+    Answers every request with 200 and an empty JSON object, keeping the requests it saw.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({}).encode()
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class RecordingLimiter:
+    """
+    Stand-in limiter that records when a slot was granted.
+    """
+
+    def __init__(self, log) -> None:
+        self.log = log
+
+    def acquire(self, timeout=None):
+        self.log.append('acquire')
+        return 0.0
+
+
+def make_transport():
+    session = requests.Session()
+    adapter = CannedAdapter()
+    session.mount('http://', adapter)
+    return Transport(session=session), adapter
+
+
+def test_signs_after_rate_limit_slot_is_acquired():
+    transport, adapter = make_transport()
+    log = []
+
+    def sign():
+        log.append('sign')
+        return {'x-auth-signature': 'sig'}
+
+    transport.request('POST', 'http://exchange.test/order', '/order', json_body={'a': 1}, sign=sign,
+                      rate_limiter=RecordingLimiter(log))
+
+    assert log == ['acquire', 'sign']
+    assert adapter.sent[0].headers['x-auth-signature'] == 'sig'
+
+
+def test_request_queued_past_its_deadline_is_not_signed_or_sent():
+    transport, adapter = make_transport()
+    limiter = RateLimiter(max_requests=1, period=60)
+    limiter.acquire()
+    signed = threading.Event()
+
+    with pytest.raises(DeadlineExceeded) as info:
+        with deadline(0.05):
+            transport.request('GET', 'http://exchange.test/order', '/order', sign=lambda: signed.set() or {},
+                              rate_limiter=limiter)
+
+    assert info.value.stage == 'queue'
+    assert not signed.is_set()
+    assert adapter.sent == []
@@ -0,0 +1,15 @@
+"""
+Request core shared by the Zebpay spot and futures Python clients.
+
+Modules:
+    transport: connection pool, limiter registry, request path and the ZebpayError hierarchy.
+    rate_limiter: sliding-window client-side rate limiter with priority scheduling.
+    deadlines: per-thread deadlines bounding whole calls.
+    submission: non-blocking submission with per-key ordering.
+    validator: local pre-trade validation against symbol rules.
+    metrics: latency histograms, request counters and Prometheus export.
+    tracing: per-phase request tracing with pluggable span sinks.
+    circuit_breaker: circuit breaker driven by error rates and exchange status.
+"""
+
+__version__ = '1.0.0'
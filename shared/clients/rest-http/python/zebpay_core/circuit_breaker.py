@@ -0,0 +1,337 @@
+"""
+Circuit breaker for the Zebpay API clients.
+
+During exchange maintenance every request fails slowly, after the full timeout, tying up
+threads and rate budget. A CircuitBreaker watches request outcomes and the exchange's status
+endpoint, and while the exchange is down makes requests fail immediately with
+CircuitOpenError instead. It probes the status endpoint in the background and lets traffic
+through again once the service recovers.
+
+    breaker = CircuitBreaker(status_check=status_check_for(client))
+    client = FuturesApiClient(jwt=token, circuit_breaker=breaker)   # or SpotClient(..., circuit_breaker=breaker)
+    breaker.start()                                                # also poll status while healthy
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from .transport import TransportError
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Status values the futures ("ok") and spot ("open") status endpoints report when operational.
+OPERATIONAL_STATUSES = frozenset({'ok', 'open', 'normal', 'operational', 'up', 'online'})
+
+
+class CircuitOpenError(TransportError):
+    """
+    Raised instead of sending a request while the circuit is open. A TransportError, so also a ConnectionError.
+    """
+
+    def __init__(self, reason: str, retry_after: float) -> None:
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"Circuit open ({reason}); not sending request. Next probe in {retry_after:.1f}s")
+
+
+def is_operational(response: Any) -> bool:
+    """
+    Return True if a system/service status response reports the exchange as operational.
+    """
+    data = response.get('data', response) if isinstance(response, dict) else response
+    status = data.get('status') if isinstance(data, dict) else data
+    return isinstance(status, str) and status.strip().lower() in OPERATIONAL_STATUSES
+
+
+def status_check_for(client: Any) -> Callable[[], bool]:
+    """
+    Build a status check from a FuturesApiClient (get_system_status) or SpotClient (get_service_status).
+    """
+    fetch = getattr(client, 'get_system_status', None) or client.get_service_status
+    return lambda: is_operational(fetch())
+
+
+class CircuitBreaker:
+    """
+    Thread-safe closed / open / half-open circuit breaker.
+
+    The circuit opens when `consecutive_failures` requests fail in a row, when at least
+    `min_requests` requests in the last `window` seconds failed at `failure_rate` or more,
+    or when the status check reports the exchange as not operational. Only timeouts,
+    connection errors and 5xx responses count as failures; 4xx responses (including 429)
+    mean the exchange is up.
+
+    While open, requests raise CircuitOpenError without touching the network or the rate limiter.
+    With a status check, a background thread probes it every `probe_interval` seconds and moves the
+    circuit to half-open when the exchange reports operational; without one, the circuit becomes
+    half-open `reset_timeout` seconds after opening. In half-open, one trial request at a time is let
+    through: success closes the circuit, failure re-opens it. A half-open circuit whose status check
+    still passes on the next probe closes on its own, so an idle client recovers too.
+
+    One breaker may be shared by several clients talking to the same exchange.
+    """
+
+    def __init__(
+        self,
+        status_check: Optional[Callable[[], bool]] = None,
+        consecutive_failures: int = 5,
+        failure_rate: float = 0.5,
+        min_requests: int = 20,
+        window: float = 30.0,
+        reset_timeout: float = 10.0,
+        probe_interval: float = 5.0,
+        status_interval: float = 30.0,
+        on_state_change: Optional[Callable[[str, str, str], None]] = None
+    ) -> None:
+        """
+        Args:
+            status_check (Optional[Callable[[], bool]]): Returns True while the exchange is operational,
+                e.g. status_check_for(client). A check that raises leaves the state unchanged.
+            consecutive_failures (int): Failures in a row that open the circuit.
+            failure_rate (float): Failure share over the window that opens the circuit.
+            min_requests (int): Requests needed in the window before failure_rate applies.
+            window (float): Length in seconds of the failure-rate window.
+            reset_timeout (float): Seconds before an open circuit without a status check turns half-open.
+            probe_interval (float): Seconds between status probes while the circuit is not closed.
+            status_interval (float): Seconds between status polls while closed, once start() is called.
+            on_state_change (Optional[Callable[[str, str, str], None]]): Called with (old, new, reason)
+                on every transition.
+        """
+        self.status_check = status_check
+        self.consecutive_failures = consecutive_failures
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.probe_interval = probe_interval
+        self.status_interval = status_interval
+        self.on_state_change = on_state_change
+
+        self._state = CLOSED
+        self._reason = ''
+        self._opened_at = 0.0
+        self._streak = 0
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures_in_window = 0
+        self._trial_in_flight = False
+        self._rejected = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._monitoring = False
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    # ------------------- REQUEST PATH -------------------
+    def before_request(self) -> None:
+        """
+        Admit or reject a request. Called by the client before it queues for the rate limiter.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a trial already in flight.
+        """
+        if self._state == CLOSED or getattr(self._local, 'bypass', False):
+            return
+        with self._lock:
+            now = time.monotonic()
+            if self._state == OPEN and self.status_check is None and now - self._opened_at >= self.reset_timeout:
+                self._transition(HALF_OPEN, 'reset timeout elapsed')
+            if self._state == HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                self._local.trial = True
+                return
+            if self._state == CLOSED:
+                return
+            self._rejected += 1
+            interval = self.probe_interval if self.status_check else self.reset_timeout
+            retry_after = max(0.0, interval - (now - self._opened_at) % interval)
+            raise CircuitOpenError(self._reason, retry_after)
+
+    def record(self, failed: bool) -> None:
+        """
+        Record the outcome of an admitted request.
+
+        Args:
+            failed (bool): True for timeouts, connection errors and 5xx responses.
+        """
+        if getattr(self._local, 'bypass', False):
+            return
+        trial = getattr(self._local, 'trial', False)
+        if self._state == CLOSED and not trial:
+            now = time.monotonic()
+            with self._lock:
+                self._add_outcome(now, failed)
+                if failed and self._should_open():
+                    self._open('too many failures' if self._streak < self.consecutive_failures
+                               else f"{self._streak} consecutive failures")
+            return
+        with self._lock:
+            if trial:
+                self._local.trial = False
+                self._trial_in_flight = False
+            if failed:
+                if self._state != OPEN:
+                    self._open('trial request failed')
+            elif self._state == HALF_OPEN:
+                self._close('trial request succeeded')
+
+    def release(self) -> None:
+        """
+        Withdraw an admitted request that was never sent, e.g. because its deadline passed while it
+        queued for the rate limiter. Nothing is recorded; a half-open trial slot is freed for the next request.
+        """
+        if getattr(self._local, 'trial', False):
+            with self._lock:
+                self._local.trial = False
+                self._trial_in_flight = False
+
+    def _add_outcome(self, now: float, failed: bool) -> None:
+        self._outcomes.append((now, failed))
+        self._failures_in_window += failed
+        cutoff = now - self.window
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            _, old_failed = self._outcomes.popleft()
+            self._failures_in_window -= old_failed
+        self._streak = self._streak + 1 if failed else 0
+
+    def _should_open(self) -> bool:
+        if self._streak >= self.consecutive_failures:
+            return True
+        total = len(self._outcomes)
+        return total >= self.min_requests and self._failures_in_window >= self.failure_rate * total
+
+    # ------------------- TRANSITIONS (lock held) -------------------
+    def _transition(self, state: str, reason: str) -> None:
+        old, self._state = self._state, state
+        if old != state and self.on_state_change:
+            self.on_state_change(old, state, reason)
+
+    def _open(self, reason: str) -> None:
+        self._reason = reason
+        self._opened_at = time.monotonic()
+        self._transition(OPEN, reason)
+        if self.status_check is not None:
+            self._ensure_thread()
+
+    def _close(self, reason: str) -> None:
+        self._outcomes.clear()
+        self._failures_in_window = 0
+        self._streak = 0
+        self._trial_in_flight = False
+        self._reason = ''
+        self._transition(CLOSED, reason)
+
+    def trip(self, reason: str = 'tripped manually') -> None:
+        """
+        Open the circuit now, e.g. on an external maintenance notice.
+        """
+        with self._lock:
+            self._open(reason)
+
+    def reset(self) -> None:
+        """
+        Close the circuit now and forget recent failures.
+        """
+        with self._lock:
+            self._close('reset manually')
+
+    # ------------------- STATUS PROBING -------------------
+    @contextmanager
+    def bypass(self) -> Iterator[None]:
+        """
+        Let requests made by the current thread through regardless of state, without recording them.
+        Used for status probes, which must reach the exchange while the circuit is open.
+        """
+        previous = getattr(self._local, 'bypass', False)
+        self._local.bypass = True
+        try:
+            yield
+        finally:
+            self._local.bypass = previous
+
+    def probe(self) -> bool:
+        """
+        Run the status check once and update the state from it.
+
+        Returns:
+            bool: True if the exchange reported operational.
+        """
+        if self.status_check is None:
+            return self._state == CLOSED
+        try:
+            with self.bypass():
+                operational = bool(self.status_check())
+        except Exception:
+            operational = None
+        with self._lock:
+            if operational:
+                if self._state == OPEN:
+                    self._transition(HALF_OPEN, 'status operational')
+                elif self._state == HALF_OPEN:
+                    self._close('status operational')
+            elif operational is False and self._state != OPEN:
+                self._open('status not operational')
+            # A failed probe (operational is None) leaves the state alone: request outcomes decide.
+        return bool(operational)
+
+    def start(self) -> 'CircuitBreaker':
+        """
+        Also poll the status check every status_interval seconds while closed, so the circuit
+        opens as soon as the exchange announces maintenance rather than after failed requests.
+        """
+        with self._lock:
+            self._monitoring = True
+            self._stop.clear()
+            self._ensure_thread()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop background probing.
+        """
+        with self._lock:
+            self._monitoring = False
+            thread, self._thread = self._thread, None
+        self._stop.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None and self.status_check is not None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='zebpay-circuit-probe', daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if self._state == CLOSED and not self._monitoring:
+                    self._thread = None
+                    return
+                interval = self.status_interval if self._state == CLOSED else self.probe_interval
+            if self._stop.wait(interval):
+                return
+            self.probe()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the current state, its reason, recent failure counts and requests rejected so far.
+        """
+        with self._lock:
+            return {
+                'state': self._state,
+                'reason': self._reason,
+                'openForSeconds': time.monotonic() - self._opened_at if self._state != CLOSED else 0.0,
+                'recentRequests': len(self._outcomes),
+                'recentFailures': self._failures_in_window,
+                'consecutiveFailures': self._streak,
+                'rejected': self._rejected
+            }
@@ -0,0 +1,64 @@
+"""
+Per-call deadlines for the Zebpay API clients.
+
+A deadline bounds a whole call: rate-limit queueing, retries and the network call all draw from
+the same remaining time, and a request whose deadline has passed is not sent at all. Deadlines
+are per thread and apply to every request sent through a Transport from inside the block,
+including batch and scatter-gather workers started there:
+
+    with deadline(2.0):
+        client.cancel_order({"clientOrderId": "order123"})   # DeadlineExceeded after 2s at most
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+_local = threading.local()
+
+
+def current_deadline() -> Optional[float]:
+    """
+    The current thread's deadline as a time.monotonic() value, or None outside any deadline block.
+    """
+    return getattr(_local, 'deadline', None)
+
+
+@contextmanager
+def deadline_at(expires: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Apply an absolute deadline (a time.monotonic() value) to the current thread for the block.
+
+    A nested deadline can only shorten an enclosing one; None keeps the enclosing deadline.
+    Used to carry a caller's deadline into worker threads: deadline_at(current_deadline()).
+
+    Yields:
+        Optional[float]: The deadline in effect inside the block.
+    """
+    previous = current_deadline()
+    if expires is None or (previous is not None and previous < expires):
+        expires = previous
+    _local.deadline = expires
+    try:
+        yield expires
+    finally:
+        _local.deadline = previous
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[Optional[float]]:
+    """
+    Bound every request made by the current thread inside the block to finish within `seconds`.
+
+    Time spent queueing for the rate limiter, waiting to retry and on the wire all counts.
+    A request that cannot finish in time raises DeadlineExceeded (a RequestTimeout) and
+    nothing more is sent for it.
+
+    Example:
+        with deadline(1.5):
+            book = client.get_order_book("BTCUSDT")
+            client.create_order_fast("BTCUSDT", "BUY", 0.01, price=book["data"]["asks"][0][0])
+    """
+    with deadline_at(time.monotonic() + seconds) as expires:
+        yield expires
@@ -0,0 +1,291 @@
+"""
+Request instrumentation for the Zebpay API clients.
+
+Keeps per-endpoint latency histograms and request counters with low overhead, and exposes
+them as a snapshot dictionary or in the Prometheus text exposition format.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# Bucket boundaries (seconds) used when exporting histograms to Prometheus.
+PROMETHEUS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram of latencies, recorded in microseconds.
+
+    Each power-of-two range is split into 2**SUB_BUCKET_BITS linear sub-buckets, so any
+    recorded value is reported within 1/2**SUB_BUCKET_BITS (12.5%) of its true value while
+    recording stays a constant-time index computation and a list increment.
+    Not thread-safe on its own; ClientMetrics serializes access.
+    """
+    SUB_BUCKET_BITS = 3
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+    def __init__(self) -> None:
+        self.counts: List[int] = []
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        shift = value.bit_length() - (cls.SUB_BUCKET_BITS + 1)
+        if shift <= 0:
+            return value
+        top = value >> shift
+        return cls.SUB_BUCKETS + shift * cls.SUB_BUCKETS + (top - cls.SUB_BUCKETS)
+
+    @classmethod
+    def _upper_bound(cls, index: int) -> int:
+        """
+        Largest value (in microseconds) that maps to the bucket at `index`.
+        """
+        if index < 2 * cls.SUB_BUCKETS:
+            return index
+        shift, offset = divmod(index - cls.SUB_BUCKETS, cls.SUB_BUCKETS)
+        return ((cls.SUB_BUCKETS + offset + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """
+        Record one latency sample.
+        """
+        value = max(0, int(seconds * 1_000_000))
+        index = self._index(value)
+        if index >= len(self.counts):
+            self.counts.extend([0] * (index + 1 - len(self.counts)))
+        self.counts[index] += 1
+        self.count += 1
+        self.total_us += value
+        if value > self.max_us:
+            self.max_us = value
+
+    def percentile(self, percent: float) -> float:
+        """
+        Return the latency (seconds) at or below which `percent` of samples fall.
+        """
+        if not self.count:
+            return 0.0
+        target = max(1, int(round(self.count * percent / 100.0)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(self._upper_bound(index), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    def cumulative(self, boundaries: Tuple[float, ...]) -> List[int]:
+        """
+        Return cumulative sample counts at or below each boundary (seconds).
+        """
+        result = []
+        position, seen = 0, 0
+        for boundary in boundaries:
+            limit_us = boundary * 1_000_000
+            while position < len(self.counts) and self._upper_bound(position) <= limit_us:
+                seen += self.counts[position]
+                position += 1
+            result.append(seen)
+        return result
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels: Any) -> str:
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+class ClientMetrics:
+    """
+    Thread-safe registry of request metrics for one or more clients.
+
+    Tracks, per endpoint: request counts by method and status, error counts by error class,
+    latency histograms, retries and hedges; plus rate-limit waits and bytes transferred.
+
+    Example:
+        metrics = ClientMetrics()
+        client = FuturesApiClient(jwt=token, metrics=metrics)
+        ...
+        print(metrics.snapshot()["endpoints"])
+        text = metrics.to_prometheus()   # serve on /metrics
+    """
+
+    def __init__(self, namespace: str = 'zebpay_client') -> None:
+        """
+        Args:
+            namespace (str): Prefix for exported Prometheus metric names.
+        """
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._errors: Dict[Tuple[str, str], int] = {}
+        self._latency: Dict[str, LatencyHistogram] = {}
+        self._retries: Dict[str, int] = {}
+        self._hedges: Dict[Tuple[str, str], int] = {}
+        self._rate_limit_waits = 0
+        self._rate_limit_wait_seconds = 0.0
+        self._bytes_sent = 0
+        self._bytes_received = 0
+
+    def observe_request(
+        self,
+        endpoint: str,
+        method: str,
+        status: Optional[int],
+        seconds: float,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Record a completed (or failed) request.
+
+        Args:
+            endpoint (str): Endpoint path or route template.
+            method (str): HTTP method.
+            status (Optional[int]): HTTP status code, or None if no response was received.
+            seconds (float): Request latency in seconds, excluding rate-limit waits.
+            bytes_sent (int): Request body size.
+            bytes_received (int): Response body size.
+            error (Optional[str]): Error class name if the request failed.
+        """
+        key = (endpoint, method.upper(), str(status) if status is not None else 'none')
+        with self._lock:
+            self._requests[key] = self._requests.get(key, 0) + 1
+            histogram = self._latency.get(endpoint)
+            if histogram is None:
+                histogram = self._latency[endpoint] = LatencyHistogram()
+            histogram.record(seconds)
+            self._bytes_sent += bytes_sent
+            self._bytes_received += bytes_received
+            if error:
+                error_key = (endpoint, error)
+                self._errors[error_key] = self._errors.get(error_key, 0) + 1
+
+    def observe_rate_limit_wait(self, seconds: float) -> None:
+        """
+        Record time spent waiting for the rate limiter (only non-zero waits are counted).
+        """
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._rate_limit_waits += 1
+            self._rate_limit_wait_seconds += seconds
+
+    def observe_retry(self, endpoint: str) -> None:
+        """
+        Record a retried request.
+        """
+        with self._lock:
+            self._retries[endpoint] = self._retries.get(endpoint, 0) + 1
+
+    def observe_hedge(self, endpoint: str, outcome: str) -> None:
+        """
+        Record a hedging decision for a slow request.
+
+        Args:
+            endpoint (str): Endpoint path.
+            outcome (str): 'won' (the hedge answered first), 'lost' (the original answered first)
+                or 'capped' (no hedge was sent because the hedge cap or rate budget was exhausted).
+        """
+        key = (endpoint, outcome)
+        with self._lock:
+            self._hedges[key] = self._hedges.get(key, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a point-in-time copy of all metrics.
+
+        Returns:
+            Dict[str, Any]: {
+                "endpoints": {endpoint: {"count", "p50", "p90", "p99", "max", "mean", "statuses", "errors", "retries",
+                                         "hedges"}},
+                "rateLimit": {"waits", "waitSeconds"},
+                "bytesSent": int,
+                "bytesReceived": int
+            }
+            Latencies are in seconds.
+        """
+        with self._lock:
+            endpoints: Dict[str, Dict[str, Any]] = {}
+            for endpoint, histogram in self._latency.items():
+                endpoints[endpoint] = {
+                    'count': histogram.count,
+                    'p50': histogram.percentile(50),
+                    'p90': histogram.percentile(90),
+                    'p99': histogram.percentile(99),
+                    'max': histogram.max_us / 1_000_000,
+                    'mean': histogram.total_us / histogram.count / 1_000_000 if histogram.count else 0.0,
+                    'statuses': {},
+                    'errors': {},
+                    'retries': self._retries.get(endpoint, 0),
+                    'hedges': {}
+                }
+            for (endpoint, method, status), count in self._requests.items():
+                statuses = endpoints[endpoint]['statuses']
+                statuses[f'{method} {status}'] = count
+            for (endpoint, error), count in self._errors.items():
+                endpoints[endpoint]['errors'][error] = count
+            for (endpoint, outcome), count in self._hedges.items():
+                if endpoint in endpoints:
+                    endpoints[endpoint]['hedges'][outcome] = count
+            return {
+                'endpoints': endpoints,
+                'rateLimit': {'waits': self._rate_limit_waits, 'waitSeconds': self._rate_limit_wait_seconds},
+                'bytesSent': self._bytes_sent,
+                'bytesReceived': self._bytes_received
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format (version 0.0.4).
+        """
+        ns = self.namespace
+        lines: List[str] = []
+        with self._lock:
+            lines += [f'# HELP {ns}_requests_total Requests sent, by endpoint, method and status.',
+                      f'# TYPE {ns}_requests_total counter']
+            for (endpoint, method, status), count in sorted(self._requests.items()):
+                lines.append(f'{ns}_requests_total{_labels(endpoint=endpoint, method=method, status=status)} {count}')
+
+            lines += [f'# HELP {ns}_request_errors_total Failed requests, by endpoint and error class.',
+                      f'# TYPE {ns}_request_errors_total counter']
+            for (endpoint, error), count in sorted(self._errors.items()):
+                lines.append(f'{ns}_request_errors_total{_labels(endpoint=endpoint, error=error)} {count}')
+
+            lines += [f'# HELP {ns}_request_retries_total Retried requests, by endpoint.',
+                      f'# TYPE {ns}_request_retries_total counter']
+            for endpoint, count in sorted(self._retries.items()):
+                lines.append(f'{ns}_request_retries_total{_labels(endpoint=endpoint)} {count}')
+
+            lines += [f'# HELP {ns}_request_hedges_total Hedging decisions for slow requests, by endpoint and outcome.',
+                      f'# TYPE {ns}_request_hedges_total counter']
+            for (endpoint, outcome), count in sorted(self._hedges.items()):
+                lines.append(f'{ns}_request_hedges_total{_labels(endpoint=endpoint, outcome=outcome)} {count}')
+
+            lines += [f'# HELP {ns}_request_duration_seconds Request latency, excluding rate-limit waits.',
+                      f'# TYPE {ns}_request_duration_seconds histogram']
+            for endpoint, histogram in sorted(self._latency.items()):
+                for boundary, count in zip(PROMETHEUS_BUCKETS, histogram.cumulative(PROMETHEUS_BUCKETS)):
+                    lines.append(f'{ns}_request_duration_seconds_bucket{_labels(endpoint=endpoint, le=boundary)} {count}')
+                lines.append(f'{ns}_request_duration_seconds_bucket{_labels(endpoint=endpoint, le="+Inf")} {histogram.count}')
+                lines.append(f'{ns}_request_duration_seconds_sum{_labels(endpoint=endpoint)} {histogram.total_us / 1_000_000}')
+                lines.append(f'{ns}_request_duration_seconds_count{_labels(endpoint=endpoint)} {histogram.count}')
+
+            lines += [f'# HELP {ns}_rate_limit_waits_total Requests that had to wait for the rate limiter.',
+                      f'# TYPE {ns}_rate_limit_waits_total counter',
+                      f'{ns}_rate_limit_waits_total {self._rate_limit_waits}',
+                      f'# HELP {ns}_rate_limit_wait_seconds_total Time spent waiting for the rate limiter.',
+                      f'# TYPE {ns}_rate_limit_wait_seconds_total counter',
+                      f'{ns}_rate_limit_wait_seconds_total {self._rate_limit_wait_seconds}',
+                      f'# HELP {ns}_bytes_sent_total Request body bytes sent.',
+                      f'# TYPE {ns}_bytes_sent_total counter',
+                      f'{ns}_bytes_sent_total {self._bytes_sent}',
+                      f'# HELP {ns}_bytes_received_total Response body bytes received.',
+                      f'# TYPE {ns}_bytes_received_total counter',
+                      f'{ns}_bytes_received_total {self._bytes_received}']
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,132 @@
+"""
+Client-side rate limiting for the Zebpay API clients.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Iterator, List, Optional, Tuple
+
+# Scheduling priorities: lower values are served first when requests queue up.
+PRIORITY_CRITICAL = 0
+PRIORITY_NORMAL = 10
+
+
+class RateLimiter:
+    """
+    Thread-safe sliding-window rate limiter with priority scheduling.
+
+    Allows at most ``max_requests`` calls to ``acquire`` within any ``period``
+    second window. Callers that would exceed the budget block until a slot frees up,
+    so concurrent workers sharing one limiter never exceed the exchange limit.
+    When several callers are waiting, the one with the lowest priority value gets
+    the next slot, with ties served in arrival order.
+    """
+
+    def __init__(self, max_requests: int, period: float) -> None:
+        """
+        Args:
+            max_requests (int): Maximum number of requests allowed per window.
+            period (float): Window length in seconds.
+
+        Raises:
+            ValueError: If max_requests or period is not positive.
+        """
+        if max_requests <= 0 or period <= 0:
+            raise ValueError("max_requests and period must be positive")
+        self.max_requests = max_requests
+        self.period = period
+        self._timestamps: Deque[float] = deque()
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._local = threading.local()
+
+    @contextmanager
+    def priority(self, level: int) -> Iterator[None]:
+        """
+        Set the scheduling priority for requests made by the current thread.
+
+        Args:
+            level (int): Priority value, e.g. PRIORITY_CRITICAL.
+
+        Example:
+            with client.rate_limiter.priority(PRIORITY_CRITICAL):
+                client.cancel_all_orders()
+        """
+        previous = getattr(self._local, 'priority', PRIORITY_NORMAL)
+        self._local.priority = level
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def acquire(self, priority: Optional[int] = None, timeout: Optional[float] = None) -> float:
+        """
+        Block until a request slot is available and claim it.
+
+        Args:
+            priority (Optional[int]): Priority for this request. Defaults to the level
+                set for the current thread via priority(), or PRIORITY_NORMAL.
+            timeout (Optional[float]): Seconds to wait at most (default: no limit).
+
+        Returns:
+            float: Seconds spent waiting for the slot (0.0 if none was needed).
+
+        Raises:
+            TimeoutError: If no slot was free within `timeout`; the caller leaves the queue.
+        """
+        if priority is None:
+            priority = getattr(self._local, 'priority', PRIORITY_NORMAL)
+        started = time.monotonic()
+        expires = None if timeout is None else started + timeout
+        ticket = (priority, next(self._sequence))
+        with self._condition:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    # Drop timestamps that have left the window.
+                    while self._timestamps and now - self._timestamps[0] >= self.period:
+                        self._timestamps.popleft()
+                    if self._waiters[0] != ticket:
+                        # Someone more urgent (or earlier) is ahead; wait to be woken.
+                        wait = None
+                    elif len(self._timestamps) < self.max_requests:
+                        heapq.heappop(self._waiters)
+                        self._timestamps.append(now)
+                        self._condition.notify_all()
+                        return now - started
+                    else:
+                        wait = self.period - (now - self._timestamps[0])
+                    if expires is not None:
+                        if now >= expires:
+                            raise TimeoutError(f"No rate limit slot free within {timeout:.3f}s")
+                        wait = expires - now if wait is None else min(wait, expires - now)
+                    self._condition.wait(wait)
+            except BaseException:
+                # Leave the queue cleanly if the waiting thread is interrupted or times out.
+                if ticket in self._waiters:
+                    self._waiters.remove(ticket)
+                    heapq.heapify(self._waiters)
+                    self._condition.notify_all()
+                raise
+
+    def try_acquire(self) -> bool:
+        """
+        Claim a request slot only if one is free right now and nobody is queued for it.
+
+        Returns:
+            bool: True if a slot was claimed; False (without waiting) otherwise.
+        """
+        with self._condition:
+            now = time.monotonic()
+            while self._timestamps and now - self._timestamps[0] >= self.period:
+                self._timestamps.popleft()
+            if self._waiters or len(self._timestamps) >= self.max_requests:
+                return False
+            self._timestamps.append(now)
+            return True
@@ -0,0 +1,194 @@
+"""
+Non-blocking request submission for the Zebpay API clients.
+
+A strategy loop that calls create_order directly waits a full round trip per order. An
+OrderSubmitter runs the calls on a managed pool of worker threads and hands back a
+concurrent.futures.Future at once, so order entry overlaps with the loop's own work:
+
+    handle = client.submit_order({...})           # returns immediately
+    handle.add_done_callback(on_done)              # or submit_order(..., callback=on_done)
+    ...
+    handle.cancel()                                # True if the request had not been sent yet
+
+Calls submitted with the same key (the symbol, for orders and cancels) run one at a time in
+submission order, so a cancel never overtakes the order it refers to and completions for a
+symbol arrive in order; calls with different keys run in parallel. Handles work with asyncio
+through asyncio.wrap_future(handle).
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+from .deadlines import current_deadline, deadline_at
+
+# Default number of worker threads, matching the clients' BATCH_MAX_WORKERS.
+DEFAULT_MAX_WORKERS = 8
+
+# (handle, function, args, kwargs, deadline of the submitting thread)
+_Call = Tuple[Future, Callable[..., Any], Tuple[Any, ...], Dict[str, Any], Optional[float]]
+
+
+class OrderSubmitter:
+    """
+    Runs client calls on up to `max_workers` threads and returns Future handles immediately.
+
+    Each key has a FIFO queue; a worker takes the next call of a key that is not already running,
+    so calls sharing a key never overlap and complete in submission order. Keys take turns, so a
+    busy symbol does not starve the others. A handle cancelled before a worker picks it up is
+    skipped without sending anything (Future.cancel() returns True); once running it cannot be
+    cancelled. The submitting thread's deadline (zebpay_core.deadlines.deadline) travels with the call,
+    so a call still queued when it passes fails with DeadlineExceeded instead of being sent late.
+
+    Workers are started on demand and are daemon threads. Thread-safe.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, name: str = 'zebpay-submit') -> None:
+        """
+        Args:
+            max_workers (int): Maximum calls in flight at once.
+            name (str): Prefix of the worker thread names.
+
+        Raises:
+            ValueError: If max_workers is not positive.
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        self.max_workers = max_workers
+        self.name = name
+        # Per-key queues; a key is present while it has queued or running calls.
+        self._queues: Dict[Hashable, Deque[_Call]] = {}
+        # Keys with queued calls and no call running, in the order they become runnable.
+        self._ready: Deque[Hashable] = deque()
+        self._condition = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._idle = 0
+        self._closed = False
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        key: Optional[Hashable] = None,
+        callback: Optional[Callable[[Future], Any]] = None,
+        **kwargs: Any
+    ) -> Future:
+        """
+        Queue fn(*args, **kwargs) and return its handle without waiting.
+
+        Args:
+            fn (Callable[..., Any]): Call to run, e.g. client.create_order.
+            key (Optional[Hashable]): Ordering key; calls with the same key run one at a time in
+                submission order. None runs the call independently of all others.
+            callback (Optional[Callable[[Future], Any]]): Called with the handle when the call completes,
+                fails or is cancelled (see Future.add_done_callback).
+
+        Returns:
+            Future: Handle resolving to fn's return value or raising its exception.
+
+        Raises:
+            RuntimeError: If the submitter has been closed.
+        """
+        future: Future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        call = (future, fn, args, kwargs, current_deadline())
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("OrderSubmitter is closed")
+            if key is None:
+                key = object()  # A queue of its own.
+            queue = self._queues.get(key)
+            if queue is None:
+                self._queues[key] = deque([call])
+                self._ready.append(key)
+                if len(self._ready) > self._idle and len(self._workers) < self.max_workers:
+                    self._start_worker()
+                self._condition.notify()
+            else:
+                # The key is queued or running; the call runs after the ones before it.
+                queue.append(call)
+        return future
+
+    def _start_worker(self) -> None:
+        worker = threading.Thread(target=self._work, name=f"{self.name}-{len(self._workers)}", daemon=True)
+        self._workers.append(worker)
+        worker.start()
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while not self._ready:
+                    if self._closed:
+                        return
+                    self._idle += 1
+                    self._condition.wait()
+                    self._idle -= 1
+                key = self._ready.popleft()
+                future, fn, args, kwargs, expires = self._queues[key].popleft()
+            # False when the handle was cancelled while queued: skip it without sending anything.
+            if future.set_running_or_notify_cancel():
+                try:
+                    with deadline_at(expires):
+                        result = fn(*args, **kwargs)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            with self._condition:
+                if self._queues[key]:
+                    # Back of the line, so other keys get a turn.
+                    self._ready.append(key)
+                    self._condition.notify()
+                else:
+                    del self._queues[key]
+
+    @property
+    def pending(self) -> int:
+        """
+        Calls queued and not yet started (including cancelled ones not yet skipped).
+        """
+        with self._condition:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def cancel_pending(self, key: Optional[Hashable] = None) -> int:
+        """
+        Cancel queued calls that have not started, for one key or for all keys.
+
+        Returns:
+            int: Number of handles cancelled.
+        """
+        with self._condition:
+            if key is None:
+                queues = list(self._queues.values())
+            else:
+                queues = [self._queues[key]] if key in self._queues else []
+            futures = [call[0] for queue in queues for call in queue]
+        # Outside the lock: cancel() runs done-callbacks, which may submit again.
+        return sum(1 for future in futures if future.cancel())
+
+    def close(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """
+        Stop accepting calls. Queued calls still run unless cancel_pending is set.
+
+        Args:
+            wait (bool): Block until the workers have finished.
+            cancel_pending (bool): Cancel calls that have not started instead of running them.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            workers = list(self._workers)
+        if cancel_pending:
+            self.cancel_pending()
+        if wait:
+            for worker in workers:
+                if worker is not threading.current_thread():
+                    worker.join()
+
+    def __enter__(self) -> 'OrderSubmitter':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
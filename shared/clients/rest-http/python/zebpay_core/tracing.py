@@ -0,0 +1,290 @@
+"""
+Request lifecycle tracing for the Zebpay API clients.
+
+A Tracer times each phase of a request and hands the finished spans to a pluggable sink:
+
+    queue          waiting for the client-side rate limiter
+    sign           building authentication headers
+    acquire        taking a connection from the pool (attribute `reused` tells if it was warm)
+    connect        DNS lookup and TCP connect, only for new connections
+    tls            TLS handshake, only for new HTTPS connections
+    ttfb           sending the request until response headers arrive (includes server time)
+    body           reading the response body
+    decode         parsing the JSON body
+
+Transport phases are captured by TracingHTTPAdapter, which swaps in instrumented urllib3
+pool and connection classes; the client records the remaining phases around its own code.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class Span:
+    """
+    A timed operation. Times are monotonic nanoseconds from time.perf_counter_ns(),
+    plus `wall_start_ns` (epoch nanoseconds) on root spans for exporters that need it.
+    """
+    __slots__ = ('name', 'start_ns', 'end_ns', 'attributes', 'parent', 'wall_start_ns')
+
+    def __init__(self, name: str, start_ns: int, end_ns: int = 0,
+                 attributes: Optional[Dict[str, Any]] = None, parent: Optional['Span'] = None) -> None:
+        self.name = name
+        self.start_ns = start_ns
+        self.end_ns = end_ns
+        self.attributes = attributes or {}
+        self.parent = parent
+        self.wall_start_ns = 0
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    def __repr__(self) -> str:
+        return f"Span({self.name!r}, {self.duration_ms:.3f}ms, {self.attributes})"
+
+
+class RequestTrace:
+    """
+    Collects the root span of one request and the spans of its phases.
+    """
+
+    def __init__(self, method: str, endpoint: str) -> None:
+        self.root = Span('http.request', time.perf_counter_ns(), attributes={
+            'http.method': method.upper(),
+            'http.route': endpoint,
+        })
+        self.root.wall_start_ns = time.time_ns()
+        self.phases: List[Span] = []
+
+    def record(self, name: str, start_ns: int, end_ns: int, **attributes: Any) -> None:
+        """
+        Add a completed phase span.
+        """
+        self.phases.append(Span(name, start_ns, end_ns, attributes, self.root))
+
+    @contextmanager
+    def phase(self, name: str, **attributes: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time the enclosed block as a phase. Yields the attribute dict so callers can add to it.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield attributes
+        finally:
+            self.record(name, start, time.perf_counter_ns(), **attributes)
+
+    def breakdown(self) -> Dict[str, float]:
+        """
+        Return total milliseconds spent in each phase.
+        """
+        totals: Dict[str, float] = {}
+        for span in self.phases:
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration_ms
+        return totals
+
+
+class InMemorySpanSink:
+    """
+    Keeps the most recent finished traces in memory; handy for debugging and benchmarks.
+    """
+
+    def __init__(self, max_traces: int = 1000) -> None:
+        self.max_traces = max_traces
+        self.traces: List[RequestTrace] = []
+        self._lock = threading.Lock()
+
+    def export(self, trace: RequestTrace) -> None:
+        with self._lock:
+            self.traces.append(trace)
+            if len(self.traces) > self.max_traces:
+                del self.traces[:len(self.traces) - self.max_traces]
+
+
+class OpenTelemetrySpanSink:
+    """
+    Re-emits traces through an OpenTelemetry tracer (opentelemetry-api is not required
+    by this package; pass any object with the `opentelemetry.trace.Tracer` interface).
+
+    Example:
+        from opentelemetry import trace
+        sink = OpenTelemetrySpanSink(trace.get_tracer("zebpay-client"))
+    """
+
+    def __init__(self, otel_tracer: Any) -> None:
+        self.otel_tracer = otel_tracer
+
+    def export(self, trace: RequestTrace) -> None:
+        # Convert monotonic times to epoch nanoseconds anchored at the root span.
+        offset = trace.root.wall_start_ns - trace.root.start_ns
+        root = self.otel_tracer.start_span(
+            trace.root.name, start_time=trace.root.start_ns + offset, attributes=trace.root.attributes
+        )
+        try:
+            from opentelemetry import trace as otel_trace
+            context = otel_trace.set_span_in_context(root)
+        except ImportError:
+            context = None
+        for span in trace.phases:
+            child = self.otel_tracer.start_span(
+                span.name, context=context, start_time=span.start_ns + offset, attributes=span.attributes
+            )
+            child.end(end_time=span.end_ns + offset)
+        root.end(end_time=trace.root.end_ns + offset)
+
+
+class Tracer:
+    """
+    Creates request traces and delivers them to a sink when they finish.
+
+    While a request is on the wire its trace is tracked per thread (see activate()), so
+    the instrumented transport can attach connection-level phases to the right request.
+
+    Example:
+        sink = InMemorySpanSink()
+        client = FuturesApiClient(jwt=token, tracer=Tracer(sink))
+        client.get_balance()
+        print(sink.traces[-1].breakdown())   # {'queue': 0.0, 'sign': 0.02, 'acquire': ..., 'ttfb': ...}
+    """
+
+    def __init__(self, sink: Any) -> None:
+        """
+        Args:
+            sink (Any): Object with an `export(trace: RequestTrace)` method,
+                e.g. InMemorySpanSink or OpenTelemetrySpanSink.
+        """
+        self.sink = sink
+
+    def start(self, method: str, endpoint: str) -> RequestTrace:
+        """
+        Begin tracing a request.
+        """
+        return RequestTrace(method, endpoint)
+
+    @contextmanager
+    def activate(self, trace: RequestTrace) -> Iterator[RequestTrace]:
+        """
+        Make `trace` the current thread's trace while the transport runs, so the
+        instrumented connection pools record their phases into it.
+        """
+        previous = getattr(_active, 'trace', None)
+        _active.trace = trace
+        try:
+            yield trace
+        finally:
+            _active.trace = previous
+
+    def finish(self, trace: RequestTrace, status: Optional[int] = None, error: Optional[str] = None) -> None:
+        """
+        Close the root span and export the trace.
+        """
+        trace.root.end_ns = time.perf_counter_ns()
+        if status is not None:
+            trace.root.attributes['http.status_code'] = status
+        if error:
+            trace.root.attributes['error.type'] = error
+        self.sink.export(trace)
+
+    def instrument(self, session: Any, **adapter_kwargs: Any) -> None:
+        """
+        Mount a TracingHTTPAdapter on a requests.Session for both http and https.
+        Keyword arguments (e.g. pool_maxsize) are passed to the adapter.
+        """
+        adapter = TracingHTTPAdapter(**adapter_kwargs)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+
+# The trace active on this thread, shared with the instrumented transport classes.
+_active = threading.local()
+
+
+def _current_trace() -> Optional[RequestTrace]:
+    return getattr(_active, 'trace', None)
+
+
+class _TracedConnectionMixin:
+    """
+    Times TCP connect and TLS handshake on new connections.
+    """
+
+    def _new_conn(self) -> Any:
+        start = time.perf_counter_ns()
+        sock = super()._new_conn()
+        end = time.perf_counter_ns()
+        self._tcp_connected_ns = end
+        trace = _current_trace()
+        if trace:
+            trace.record('connect', start, end, **{'net.peer.name': self.host, 'net.peer.port': self.port})
+        return sock
+
+    def connect(self) -> None:
+        self._tcp_connected_ns = 0
+        super().connect()
+        trace = _current_trace()
+        if trace and isinstance(self, HTTPSConnection) and self._tcp_connected_ns:
+            trace.record('tls', self._tcp_connected_ns, time.perf_counter_ns())
+
+
+class TracedHTTPConnection(_TracedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TracedHTTPSConnection(_TracedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TracedPoolMixin:
+    """
+    Times connection acquisition and request send until response headers.
+    """
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        start = time.perf_counter_ns()
+        conn = super()._get_conn(timeout)
+        trace = _current_trace()
+        if trace:
+            trace.record('acquire', start, time.perf_counter_ns(), reused=bool(getattr(conn, 'is_connected', False)))
+        return conn
+
+    def _make_request(self, conn: Any, method: str, url: str, *args: Any, **kwargs: Any) -> Any:
+        trace = _current_trace()
+        if not trace:
+            return super()._make_request(conn, method, url, *args, **kwargs)
+        # New connections connect lazily inside the call; measure ttfb from after that.
+        start = time.perf_counter_ns()
+        connected_before = len(trace.phases)
+        response = super()._make_request(conn, method, url, *args, **kwargs)
+        for span in trace.phases[connected_before:]:
+            if span.name in ('connect', 'tls'):
+                start = max(start, span.end_ns)
+        trace.record('ttfb', start, time.perf_counter_ns())
+        return response
+
+
+class TracedHTTPConnectionPool(_TracedPoolMixin, HTTPConnectionPool):
+    ConnectionCls = TracedHTTPConnection
+
+
+class TracedHTTPSConnectionPool(_TracedPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = TracedHTTPSConnection
+
+
+class TracingHTTPAdapter(HTTPAdapter):
+    """
+    requests adapter whose connection pools report phases to the active trace.
+    Requests made without an active trace pay only a thread-local lookup.
+    """
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TracedHTTPConnectionPool,
+            'https': TracedHTTPSConnectionPool,
+        }
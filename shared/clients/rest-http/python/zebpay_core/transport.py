@@ -0,0 +1,513 @@
+"""
+Shared HTTP transport for the Zebpay API clients.
+
+FuturesApiClient and SpotClient always send through a Transport. A Transport owns
+one requests.Session (urllib3 keeps one connection pool per host inside it), a registry of
+rate limiters keyed by host and credential, a ClientMetrics registry, and the request path
+itself: circuit-breaker check, rate-limit queueing, signing, send, status check, decode,
+metrics and tracing. Failures from either product surface as one exception hierarchy.
+
+A process trading both products shares one Transport so both clients reuse the same
+keep-alive connections, report into the same metrics and raise the same errors:
+
+    transport = Transport(pool_maxsize=32)
+    futures = FuturesApiClient(api_key=key, secret_key=secret, transport=transport)
+    spot = SpotClient(spot_key, spot_secret, transport=transport)
+    ...
+    transport.close()
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .metrics import ClientMetrics
+from .rate_limiter import RateLimiter
+from .deadlines import current_deadline
+
+if TYPE_CHECKING:
+    from .tracing import Tracer
+
+
+# ------------------- EXCEPTIONS -------------------
+class ZebpayError(Exception):
+    """
+    Base class of every error raised by the transport, for either product.
+    """
+
+
+class TransportError(ZebpayError, ConnectionError):
+    """
+    No usable response: connection refused or reset, DNS or TLS failure, undecodable body.
+    """
+    # No HTTP status; present so handlers can read e.status / e.code from any ZebpayError.
+    status: Optional[int] = None
+    code: Optional[int] = None
+
+    def __init__(self, message: str, url: Optional[str] = None) -> None:
+        super().__init__(message)
+        self.message = message
+        self.url = url
+
+
+class RequestTimeout(TransportError, TimeoutError):
+    """
+    The request did not complete within its timeout.
+    """
+
+
+class DeadlineExceeded(RequestTimeout):
+    """
+    The call's deadline (see zebpay_core.deadlines.deadline) passed before the request completed.
+
+    `stage` says where the time ran out: 'start' (already expired), 'queue' (waiting for the rate
+    limiter or a hedging worker; nothing was sent), 'send' (on the wire) or 'retry' (the wait before
+    a retry would overrun).
+    """
+
+    def __init__(self, message: str, url: Optional[str] = None, stage: str = 'send') -> None:
+        super().__init__(message, url)
+        self.stage = stage
+
+
+class HTTPStatusError(ZebpayError, ConnectionError):
+    """
+    The exchange answered with an HTTP error status.
+
+    Attributes:
+        status (int): HTTP status code (also available as `code`, like the spot client's ZebpayAPIError).
+        message (str): Raw response body.
+        detail (Any): Response body parsed as JSON, or the raw text if it is not JSON.
+        url (str): Requested URL.
+    """
+
+    def __init__(self, message: str, status: int, body: str, detail: Any, url: str) -> None:
+        super().__init__(message)
+        self.status = self.code = status
+        self.message = body
+        self.detail = detail
+        self.url = url
+
+
+class ClientError(HTTPStatusError):
+    """
+    4xx response: the request was rejected (bad parameters, authentication, unknown order).
+    """
+
+
+class RateLimitedError(ClientError):
+    """
+    429 response. `retry_after` holds the Retry-After header in seconds, if the exchange sent one.
+    """
+
+    def __init__(self, message: str, status: int, body: str, detail: Any, url: str,
+                 retry_after: Optional[float] = None) -> None:
+        super().__init__(message, status, body, detail, url)
+        self.retry_after = retry_after
+
+
+class ServerError(HTTPStatusError):
+    """
+    5xx response: the exchange failed to handle the request.
+    """
+
+
+def _status_error(error: requests.exceptions.HTTPError, url: str) -> HTTPStatusError:
+    response = error.response
+    try:
+        detail = response.json()
+    except ValueError:
+        detail = response.text
+    message = f"API Request Error: {error}. URL: {url}. Detail: {detail}"
+    status = response.status_code
+    if status == 429:
+        retry_after = response.headers.get('Retry-After')
+        return RateLimitedError(message, status, response.text, detail, url,
+                                float(retry_after) if retry_after and retry_after.isdigit() else None)
+    error_type = ServerError if status >= 500 else ClientError if status >= 400 else HTTPStatusError
+    return error_type(message, status, response.text, detail, url)
+
+
+class RequestTemplate:
+    """
+    A request to one method and URL, prepared once and copied for every send.
+
+    session.request() re-parses the URL, re-merges the session's headers and hooks, and resolves
+    proxy and TLS settings from the environment on every call; a template does all of that when
+    it is built. Session headers, cookies and environment proxy settings are captured at that
+    point, so later changes to them do not apply to existing templates.
+    """
+    __slots__ = ('method', 'url', 'prepared', 'settings')
+
+    def __init__(self, method: str, url: str, prepared: requests.PreparedRequest, settings: Dict[str, Any]) -> None:
+        self.method = method
+        self.url = url
+        self.prepared = prepared
+        self.settings = settings
+
+
+class Transport:
+    """
+    One connection pool, limiter registry, metrics registry and request path for any number of clients.
+
+    Thread-safe; share one instance between all clients of a process.
+    """
+
+    # Exposed on the class so code holding only a transport can catch them.
+    ZebpayError = ZebpayError
+    TransportError = TransportError
+    RequestTimeout = RequestTimeout
+    DeadlineExceeded = DeadlineExceeded
+    HTTPStatusError = HTTPStatusError
+    ClientError = ClientError
+    RateLimitedError = RateLimitedError
+    ServerError = ServerError
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        metrics: Optional[ClientMetrics] = None,
+        tracer: Optional[Tracer] = None,
+        session: Optional[requests.Session] = None
+    ) -> None:
+        """
+        Args:
+            pool_connections (int): Number of hosts whose connection pools are kept.
+            pool_maxsize (int): Keep-alive connections kept per host. Size it to the number of requests
+                in flight at once, or extra connections are opened and discarded under load.
+            metrics (Optional[ClientMetrics]): Default registry for requests sent through this transport
+                (default: a new one).
+            tracer (Optional[Tracer]): Request tracer; its adapter is mounted on the session so connection,
+                TLS and time-to-first-byte phases are recorded.
+            session (Optional[requests.Session]): Existing session to send through. Its owner configures
+                headers and adapters; pool sizes and tracer instrumentation are not applied to it.
+        """
+        self.metrics = metrics or ClientMetrics()
+        self.tracer = tracer
+        self._limiters: Dict[Hashable, RateLimiter] = {}
+        self._templates: Dict[Tuple[str, str], RequestTemplate] = {}
+        self._lock = threading.Lock()
+        # Monotonic time the last request started; lets keep-alive pings skip busy periods.
+        self.last_request = 0.0
+        if session is not None:
+            # Shared session: its owner configures headers and adapters.
+            self.session = session
+        else:
+            self.session = requests.Session()
+            self.session.headers.update({
+                'Accept': 'application/json',
+                'Content-Type': 'application/json'
+            })
+            if tracer:
+                tracer.instrument(self.session, pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            else:
+                adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+                self.session.mount('https://', adapter)
+                self.session.mount('http://', adapter)
+
+    def rate_limiter(self, key: Hashable, max_requests: int, period: float) -> RateLimiter:
+        """
+        Return the shared RateLimiter for a key, creating it with the given budget on first use.
+
+        Clients key their limiter by host and credential, so every client using the same API key
+        against the same exchange draws from one budget, while different keys stay independent.
+        """
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = self._limiters[key] = RateLimiter(max_requests=max_requests, period=period)
+            return limiter
+
+    def template(self, method: str, url: str) -> RequestTemplate:
+        """
+        Return the cached RequestTemplate for a method and URL, building it on first use.
+
+        Pass it to request(template=...) for requests to that URL, e.g. order placement, to skip
+        per-call request preparation. Build templates ahead of time (prewarm does it for the
+        order endpoint) so the first request does not pay for it.
+        """
+        key = (method, url)
+        template = self._templates.get(key)
+        if template is None:
+            prepared = self.session.prepare_request(requests.Request(method, url))
+            settings = self.session.merge_environment_settings(prepared.url, {}, None, None, None)
+            # The stream flag is chosen per request.
+            del settings['stream']
+            with self._lock:
+                template = self._templates.setdefault(key, RequestTemplate(method, url, prepared, settings))
+        return template
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        route: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_body: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        sign: Optional[Callable[[], Dict[str, str]]] = None,
+        timeout: Optional[float] = None,
+        rate_limiter: Any = None,
+        metrics: Optional[ClientMetrics] = None,
+        tracer: Optional[Tracer] = None,
+        circuit_breaker: Any = None,
+        hedging: Any = None,
+        template: Optional[RequestTemplate] = None,
+        body: Optional[bytes] = None,
+        deadline: Optional[float] = None,
+        retry_rate_limited: bool = False
+    ) -> Any:
+        """
+        Send a request and return its decoded JSON body.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full URL.
+            route (str): Endpoint template used as the metrics, tracing and hedging key
+                (e.g. '/api/v2/ex/orders/{order_id}').
+            params (Optional[Dict[str, Any]]): Query parameters.
+            json_body (Any): JSON request body.
+            headers (Optional[Dict[str, str]]): Extra request headers.
+            sign (Optional[Callable[[], Dict[str, str]]]): Returns authentication headers; timed as the
+                'sign' phase. Called just before sending, after the circuit-breaker check, the rate-limiter
+                wait and the deadline check, so the signed timestamp is current and rejected requests are
+                not signed.
+            timeout (Optional[float]): Request timeout in seconds (None waits indefinitely). Shortened to
+                the time left before the deadline, if that is sooner.
+            rate_limiter (Any): Limiter to queue on before sending (None: no client-side limit).
+            metrics (Optional[ClientMetrics]): Registry for this request (default: the transport's).
+            tracer (Optional[Tracer]): Tracer for this request (default: the transport's).
+            circuit_breaker (Any): Optional CircuitBreaker consulted before and updated after the request.
+            hedging (Any): Optional HedgingPolicy; used when it applies to this method and route.
+            template (Optional[RequestTemplate]): Prepared request for this method and URL (see template()).
+                When given, params and json_body are ignored: send an already serialized `body` instead.
+            body (Optional[bytes]): Serialized request body, sent as-is with a template.
+            deadline (Optional[float]): time.monotonic() by which the request must complete. The current
+                thread's deadline (zebpay_core.deadlines.deadline) applies too; the earlier of the two wins.
+            retry_rate_limited (bool): On a 429, wait for Retry-After (1 second if not sent) and send
+                again instead of raising RateLimitedError, for as long as the deadline allows.
+
+        Returns:
+            Any: Parsed JSON response.
+
+        Raises:
+            DeadlineExceeded: If the deadline passed before or while the request was queued or sent,
+                or would pass before a rate-limited request could be retried.
+            RequestTimeout: If the request timed out.
+            ClientError: For 4xx responses (RateLimitedError for 429).
+            ServerError: For 5xx responses.
+            TransportError: For connection failures and undecodable responses.
+            CircuitOpenError: If the circuit breaker is open.
+        """
+        metrics = metrics or self.metrics
+        if retry_rate_limited:
+            while True:
+                try:
+                    return self.request(method, url, route, params, json_body, headers, sign, timeout, rate_limiter,
+                                        metrics, tracer, circuit_breaker, hedging, template, body, deadline)
+                except RateLimitedError as e:
+                    metrics.observe_retry(route)
+                    wait = e.retry_after or 1
+                    expires = min((d for d in (deadline, current_deadline()) if d is not None), default=None)
+                    if expires is not None and time.monotonic() + wait >= expires:
+                        raise DeadlineExceeded(f"Deadline would pass before retrying the rate-limited request: {url}",
+                                               url, 'retry') from e
+                    time.sleep(wait)
+        tracer = tracer or self.tracer
+        self.last_request = time.monotonic()
+        ambient = current_deadline()
+        if ambient is not None and (deadline is None or ambient < deadline):
+            deadline = ambient
+        if deadline is not None and self.last_request >= deadline:
+            raise DeadlineExceeded(f"Deadline passed before the request started: {url}", url, 'start')
+        if circuit_breaker:
+            # Fail fast while the exchange is down, before signing or spending any rate budget.
+            circuit_breaker.before_request()
+
+        trace = tracer.start(method, route) if tracer else None
+
+        def send(traced: bool = True) -> requests.Response:
+            if trace and traced:
+                # Stream so the body read can be timed separately from time-to-first-byte.
+                with tracer.activate(trace):
+                    streamed = issue(True)
+                    with trace.phase('body'):
+                        streamed.content
+                return streamed
+            return issue(False)
+
+        def issue(stream: bool) -> requests.Response:
+            if template is None:
+                return self.session.request(method, url, params=params, json=json_body, headers=headers,
+                                            timeout=timeout, stream=stream)
+            prepared = template.prepared.copy()
+            if headers:
+                prepared.headers.update(headers)
+            if body is not None:
+                prepared.body = body
+                prepared.headers['Content-Length'] = str(len(body))
+            return self.session.send(prepared, timeout=timeout, stream=stream, **template.settings)
+
+        started = time.perf_counter()
+        response = None
+        error_class = None
+        sent = False
+        # True when the deadline, not the endpoint's timeout, bounds the network call.
+        deadline_bound = False
+        try:
+            if rate_limiter is not None:
+                # Wait for a slot in the rate limit window before touching the network.
+                with trace.phase('queue') if trace else nullcontext():
+                    if deadline is None:
+                        metrics.observe_rate_limit_wait(rate_limiter.acquire())
+                    else:
+                        try:
+                            metrics.observe_rate_limit_wait(
+                                rate_limiter.acquire(timeout=max(0.0, deadline - time.monotonic())))
+                        except TimeoutError as e:
+                            raise DeadlineExceeded(f"Deadline passed while waiting for the rate limiter: {url}",
+                                                   url, 'queue') from e
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DeadlineExceeded(f"Deadline passed while waiting for the rate limiter: {url}", url, 'queue')
+                if timeout is None or remaining < timeout:
+                    timeout, deadline_bound = remaining, True
+            if sign is not None:
+                # Signed only once a slot is ours, so the timestamp is not aged by the queue wait.
+                with trace.phase('sign') if trace else nullcontext():
+                    signed = sign()
+                headers = {**headers, **signed} if headers else signed
+            started = time.perf_counter()
+            sent = True
+            if hedging and hedging.applies(method, route):
+                # Only the original request is traced; a hedge is counted in metrics instead.
+                response = hedging.run(route, send, rate_limiter, metrics, deadline)
+            else:
+                response = send()
+            response.raise_for_status()
+            with trace.phase('decode') if trace else nullcontext():
+                return response.json()
+        except DeadlineExceeded:
+            error_class = DeadlineExceeded.__name__
+            raise
+        except requests.exceptions.Timeout as e:
+            if deadline_bound:
+                error_class = DeadlineExceeded.__name__
+                raise DeadlineExceeded(f"Deadline passed {timeout:.3f}s into the request: {url}", url, 'send') from e
+            error_class = RequestTimeout.__name__
+            raise RequestTimeout(f"Request timed out after {timeout} seconds: {url}", url) from e
+        except requests.exceptions.HTTPError as e:
+            error = _status_error(e, url)
+            error_class = type(error).__name__
+            raise error from e
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
+            error_class = TransportError.__name__
+            raise TransportError(f"API Request Error: {e}. URL: {url}. Detail: ", url) from e
+        finally:
+            status = response.status_code if response is not None else None
+            body = response.request.body if response is not None else None
+            metrics.observe_request(
+                route,
+                method,
+                status,
+                time.perf_counter() - started,
+                bytes_sent=len(body) if body else 0,
+                bytes_received=len(response.content) if response is not None else 0,
+                error=error_class
+            )
+            if trace:
+                tracer.finish(trace, status, error_class)
+            if circuit_breaker:
+                if not sent:
+                    # Abandoned before sending: says nothing about the exchange.
+                    circuit_breaker.release()
+                else:
+                    # Only outages count: no response at all, or a server error. 4xx means the exchange is up.
+                    circuit_breaker.record(error_class is not None and (response is None or status >= 500))
+
+    def prewarm(self, url: str, connections: int = 1, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Open up to `connections` keep-alive connections to the host of `url` and leave them in the pool.
+
+        DNS, TCP and TLS setup happen here, in parallel, instead of on the first request. Pooled
+        connections the server has dropped are detected and reopened; live ones are left alone.
+        No HTTP request is sent, so no rate budget is spent. The count is capped at the pool's
+        size (pool_maxsize), since extra connections would be discarded.
+
+        Args:
+            url (str): Any URL on the host, e.g. the client's base URL.
+            connections (int): Connections to have open afterwards.
+            timeout (Optional[float]): Connect timeout in seconds for new connections.
+
+        Returns:
+            Dict[str, Any]: host, connections opened, reused and failed, errors, pingMs (always None here)
+                and latencyMs; the futures client returns it as its PrewarmResult.
+        """
+        started = time.perf_counter()
+        prepared = self.session.prepare_request(requests.Request('GET', url))
+        # Same proxy and TLS settings as session.request(), so the connections land in the pool it will use.
+        settings = self.session.merge_environment_settings(prepared.url, {}, None, None, None)
+        adapter = self.session.get_adapter(prepared.url)
+        result: Dict[str, Any] = {
+            'host': prepared.url.split('/')[2], 'opened': 0, 'reused': 0, 'failed': 0, 'errors': [],
+            'pingMs': None, 'latencyMs': 0.0
+        }
+        if not hasattr(adapter, 'get_connection_with_tls_context'):
+            # Not a pooling adapter (e.g. a replay adapter): nothing to warm.
+            result['latencyMs'] = (time.perf_counter() - started) * 1000
+            return result
+        pool = adapter.get_connection_with_tls_context(prepared, settings['verify'], settings['proxies'],
+                                                       settings['cert'])
+        count = max(0, min(connections, pool.pool.maxsize if pool.pool is not None else 0))
+        # Take the connections out of the pool together, so each one is a different socket.
+        taken = [pool._get_conn() for _ in range(count)]
+
+        def connect(conn: Any) -> bool:
+            if conn.is_connected:
+                return False
+            if timeout is not None:
+                conn.timeout = timeout
+            conn.connect()
+            return True
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, count)) as executor:
+                futures = [executor.submit(connect, conn) for conn in taken]
+            for conn, future in zip(taken, futures):
+                error = future.exception()
+                if error is not None:
+                    conn.close()
+                    result['failed'] += 1
+                    result['errors'].append(f"{type(error).__name__}: {error}")
+                elif future.result():
+                    result['opened'] += 1
+                else:
+                    result['reused'] += 1
+        finally:
+            for conn in taken:
+                pool._put_conn(conn)
+        result['latencyMs'] = (time.perf_counter() - started) * 1000
+        return result
+
+    def close(self) -> None:
+        """
+        Close all pooled connections.
+        """
+        self.session.close()
+
+    def __enter__(self) -> 'Transport':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
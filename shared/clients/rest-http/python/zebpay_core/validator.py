@@ -0,0 +1,270 @@
+"""
+Local pre-trade validation for the Zebpay API clients.
+
+Checks orders against exchange metadata before any network I/O, so malformed orders
+fail in microseconds instead of after a rejected round trip.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional
+
+
+class OrderValidationError(ValueError):
+    """
+    Raised when an order or leverage change violates the symbol's trading rules.
+    """
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, '') else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _off_grid(value: float, step: float) -> bool:
+    """
+    True if value is not a whole multiple of step, allowing for float rounding.
+    """
+    units = value / step
+    return abs(units - round(units)) > 1e-9 * max(1.0, abs(units))
+
+
+class SymbolRules:
+    """
+    Precompiled trading rules for one symbol.
+    """
+    __slots__ = (
+        'symbol', 'tick_size', 'min_price', 'max_price', 'step_size', 'min_qty', 'max_qty',
+        'market_step_size', 'market_min_qty', 'market_max_qty',
+        'min_notional', 'order_types', 'time_in_force', 'min_leverage', 'max_leverage'
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        tick_size: Optional[float] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        step_size: Optional[float] = None,
+        min_qty: Optional[float] = None,
+        max_qty: Optional[float] = None,
+        market_step_size: Optional[float] = None,
+        market_min_qty: Optional[float] = None,
+        market_max_qty: Optional[float] = None,
+        min_notional: Optional[float] = None,
+        order_types: Iterable[str] = (),
+        time_in_force: Iterable[str] = (),
+        min_leverage: Optional[float] = None,
+        max_leverage: Optional[float] = None
+    ) -> None:
+        self.symbol = symbol
+        self.tick_size = tick_size or None
+        self.min_price = min_price or None
+        self.max_price = max_price or None
+        self.step_size = step_size or None
+        self.min_qty = min_qty or None
+        self.max_qty = max_qty or None
+        # MARKET_LOT_SIZE: quantity rules for MARKET orders only, where the exchange publishes them.
+        self.market_step_size = market_step_size or None
+        self.market_min_qty = market_min_qty or None
+        self.market_max_qty = market_max_qty or None
+        self.min_notional = min_notional or None
+        # Empty sets mean the exchange did not publish a restriction.
+        self.order_types: FrozenSet[str] = frozenset(t.upper() for t in order_types)
+        self.time_in_force: FrozenSet[str] = frozenset(t.upper() for t in time_in_force)
+        self.min_leverage = min_leverage
+        self.max_leverage = max_leverage
+
+    @classmethod
+    def from_metadata(cls, symbol: str, meta: Mapping[str, Any]) -> 'SymbolRules':
+        """
+        Build rules from a MarketSymbol or PairInfo dictionary, including Binance-style filters,
+        or from a spot trading pair (tickSz / lotSz).
+        """
+        rules: Dict[str, Any] = {}
+        price_precision = _number(meta.get('pricePrecision'))
+        quantity_precision = _number(meta.get('quantityPrecision'))
+        if price_precision is not None:
+            rules['tick_size'] = 10 ** -int(price_precision)
+        if quantity_precision is not None:
+            rules['step_size'] = 10 ** -int(quantity_precision)
+        rules['tick_size'] = _number(meta.get('tickSz')) or rules.get('tick_size')
+        rules['step_size'] = _number(meta.get('lotSz')) or rules.get('step_size')
+        # Explicit filters override the precision-derived defaults.
+        for entry in meta.get('filters') or []:
+            filter_type = str(entry.get('filterType', '')).upper()
+            if filter_type == 'PRICE_FILTER':
+                rules['tick_size'] = _number(entry.get('tickSize')) or rules.get('tick_size')
+                rules['min_price'] = _number(entry.get('minPrice'))
+                rules['max_price'] = _number(entry.get('maxPrice'))
+            elif filter_type == 'LOT_SIZE':
+                rules['step_size'] = _number(entry.get('stepSize')) or rules.get('step_size')
+                rules['min_qty'] = _number(entry.get('minQty'))
+                rules['max_qty'] = _number(entry.get('maxQty'))
+            elif filter_type == 'MARKET_LOT_SIZE':
+                rules['market_step_size'] = _number(entry.get('stepSize'))
+                rules['market_min_qty'] = _number(entry.get('minQty'))
+                rules['market_max_qty'] = _number(entry.get('maxQty'))
+            elif filter_type in ('MIN_NOTIONAL', 'NOTIONAL'):
+                rules['min_notional'] = _number(entry.get('minNotional', entry.get('notional')))
+        return cls(
+            symbol,
+            order_types=meta.get('orderTypes') or (),
+            time_in_force=meta.get('timeInForce') or (),
+            min_leverage=_number(meta.get('minLeverage')),
+            max_leverage=_number(meta.get('maxLeverage')),
+            **rules
+        )
+
+
+class OrderValidator:
+    """
+    Validates orders locally against per-symbol trading rules.
+
+    Build it once from fetch_markets() or get_exchange_info() data and pass it to
+    FuturesApiClient(validator=...); create_order and update_leverage then raise
+    OrderValidationError before sending anything that the exchange would reject.
+    SpotClient(validator=...) takes one built with from_trading_pairs().
+    Symbols without metadata are passed through unchecked.
+    """
+
+    def __init__(self, rules: Iterable[SymbolRules]) -> None:
+        """
+        Args:
+            rules (Iterable[SymbolRules]): Rules for each known symbol.
+        """
+        self.rules: Dict[str, SymbolRules] = {rule.symbol.upper(): rule for rule in rules}
+
+    @classmethod
+    def from_markets(cls, markets: Mapping[str, Any]) -> 'OrderValidator':
+        """
+        Build a validator from the `data` of fetch_markets().
+
+        Example:
+            validator = OrderValidator.from_markets(client.fetch_markets()["data"])
+        """
+        return cls(SymbolRules.from_metadata(meta['symbol'], meta) for meta in markets.get('symbols', []))
+
+    @classmethod
+    def from_exchange_info(cls, exchange_info: Mapping[str, Any]) -> 'OrderValidator':
+        """
+        Build a validator from the `data` of get_exchange_info().
+
+        Example:
+            validator = OrderValidator.from_exchange_info(client.get_exchange_info()["data"])
+        """
+        return cls(SymbolRules.from_metadata(pair['pair'], pair) for pair in exchange_info.get('pairs', []))
+
+    @classmethod
+    def from_trading_pairs(cls, response: Any) -> 'OrderValidator':
+        """
+        Build a validator from a spot get_trading_pairs() response (or its `data`).
+
+        Example:
+            spot.validator = OrderValidator.from_trading_pairs(spot.get_trading_pairs())
+        """
+        data = response.get('data', response) if isinstance(response, dict) else response
+        pairs = data.get('symbols', []) if isinstance(data, dict) else data
+        return cls(SymbolRules.from_metadata(pair['symbol'], pair) for pair in pairs or [])
+
+    def validate(
+        self,
+        symbol: str,
+        order_type: Optional[str] = None,
+        price: Any = None,
+        amount: Any = None,
+        time_in_force: Optional[str] = None,
+        leverage: Any = None
+    ) -> None:
+        """
+        Check a single order against the symbol's rules.
+
+        Args:
+            symbol (str): Trading symbol.
+            order_type (Optional[str]): Order type, e.g. 'LIMIT' (not checked when omitted).
+            price (Any): Order price, if any.
+            amount (Any): Order quantity, if any.
+            time_in_force (Optional[str]): Time-in-force policy, if any.
+            leverage (Any): Leverage requested with the order, if any.
+
+        Raises:
+            OrderValidationError: If the order violates a rule.
+        """
+        rules = self.rules.get(symbol.upper()) if symbol else None
+        if rules is None:
+            return
+        if order_type and rules.order_types and order_type.upper() not in rules.order_types:
+            raise OrderValidationError(
+                f"{symbol}: order type {order_type} not supported. Allowed: {sorted(rules.order_types)}"
+            )
+        if time_in_force and rules.time_in_force and time_in_force.upper() not in rules.time_in_force:
+            raise OrderValidationError(
+                f"{symbol}: timeInForce {time_in_force} not supported. Allowed: {sorted(rules.time_in_force)}"
+            )
+
+        price_value = _number(price)
+        if price_value is not None:
+            if rules.tick_size and _off_grid(price_value, rules.tick_size):
+                raise OrderValidationError(f"{symbol}: price {price} is not a multiple of tick size {rules.tick_size}")
+            if rules.min_price and price_value < rules.min_price:
+                raise OrderValidationError(f"{symbol}: price {price} is below minimum {rules.min_price}")
+            if rules.max_price and price_value > rules.max_price:
+                raise OrderValidationError(f"{symbol}: price {price} is above maximum {rules.max_price}")
+
+        amount_value = _number(amount)
+        if amount_value is not None:
+            if amount_value <= 0:
+                raise OrderValidationError(f"{symbol}: amount must be positive")
+            step_size, min_qty, max_qty = rules.step_size, rules.min_qty, rules.max_qty
+            if order_type and order_type.upper() == 'MARKET':
+                # A MARKET_LOT_SIZE filter replaces LOT_SIZE for market orders, field by field.
+                step_size = rules.market_step_size or step_size
+                min_qty = rules.market_min_qty or min_qty
+                max_qty = rules.market_max_qty or max_qty
+            if step_size and _off_grid(amount_value, step_size):
+                raise OrderValidationError(f"{symbol}: amount {amount} is not a multiple of step size {step_size}")
+            if min_qty and amount_value < min_qty:
+                raise OrderValidationError(f"{symbol}: amount {amount} is below minimum quantity {min_qty}")
+            if max_qty and amount_value > max_qty:
+                raise OrderValidationError(f"{symbol}: amount {amount} is above maximum quantity {max_qty}")
+            if rules.min_notional and price_value is not None and price_value * amount_value < rules.min_notional:
+                raise OrderValidationError(
+                    f"{symbol}: notional {price_value * amount_value} is below minimum {rules.min_notional}"
+                )
+
+        if leverage is not None:
+            self.validate_leverage(symbol, leverage)
+
+    def validate_order(self, order_params: Dict[str, Any]) -> None:
+        """
+        Check a create_order parameter dictionary.
+
+        Raises:
+            OrderValidationError: If the order violates a rule.
+        """
+        self.validate(
+            order_params.get('symbol'),
+            order_params.get('type'),
+            price=order_params.get('price'),
+            amount=order_params.get('amount'),
+            time_in_force=order_params.get('timeInForce'),
+            leverage=order_params.get('leverage')
+        )
+
+    def validate_leverage(self, symbol: str, leverage: Any) -> None:
+        """
+        Check a leverage value against the symbol's minLeverage / maxLeverage.
+
+        Raises:
+            OrderValidationError: If the leverage is out of range.
+        """
+        rules = self.rules.get(symbol.upper()) if symbol else None
+        value = _number(leverage)
+        if rules is None or value is None:
+            return
+        if rules.min_leverage is not None and value < rules.min_leverage:
+            raise OrderValidationError(f"{symbol}: leverage {leverage} is below minimum {rules.min_leverage}")
+        if rules.max_leverage is not None and value > rules.max_leverage:
+            raise OrderValidationError(f"{symbol}: leverage {leverage} is above maximum {rules.max_leverage}")
@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 
 setup(
     name="zebpay-spot-client",
@@ -7,11 +7,15 @@ setup(
     author="Zebpay",
     author_email="support@zebpay.com",
     url="https://github.com/zebpay/api-references",
-    packages=find_packages(),
+    py_modules=["zebpay_spot_client"],
     install_requires=[
+        "zebpay-core>=1.0.0",
         "requests>=2.25.1",
         "typing-extensions>=3.7.4"
     ],
+    extras_require={
+        "analytics": ["numpy>=1.21"]
+    },
     python_requires=">=3.7",
     classifiers=[
         "Development Status :: 4 - Beta",
@@ -1,38 +1,261 @@
-import requests
+import threading
 import time
-from typing import Optional, Dict, Any, List, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import ContextManager, Optional, Dict, Any, List, Union, Callable
 
-class ZebpayAPIError(Exception):
-    def __init__(self, code: int, message: str):
-        self.code = code
-        self.message = message
-        super().__init__(f"API Error {code}: {message}")
+try:
+    import numpy as np  # Optional: only TickerSnapshot needs it (pip install zebpay-spot-client[analytics]).
+except ImportError:
+    np = None
+
+# The request path (Transport), rate limiter, submission pool, deadlines and validator come from zebpay_core,
+# the request core shared with the futures client.
+from zebpay_core.deadlines import current_deadline, deadline, deadline_at
+from zebpay_core.rate_limiter import PRIORITY_CRITICAL, PRIORITY_NORMAL, RateLimiter  # noqa: F401
+from zebpay_core.submission import OrderSubmitter
+from zebpay_core.transport import (  # noqa: F401
+    ClientError, DeadlineExceeded, HTTPStatusError, RateLimitedError, RequestTimeout, ServerError, Transport,
+    TransportError, ZebpayError
+)
+from zebpay_core.validator import OrderValidationError, OrderValidator  # noqa: F401
+
+# Client-side rate limit, matching the 600 requests per minute private endpoint limit
+DEFAULT_RATE_LIMIT = {"max_requests": 600, "period": 60}
+
+# Default number of concurrent workers used by batch operations
+BATCH_MAX_WORKERS = 8
+
+# Recommended request timeout in seconds per endpoint class (see _timeout_class). Opt in with
+# SpotClient(..., timeouts=DEFAULT_TIMEOUTS); capped at the client's timeout
+DEFAULT_TIMEOUTS = {"market_data": 5, "reference": 15, "account": 10, "order": 10, "cancel": 5}
+
+# Public reference data, which changes rarely and may be large.
+REFERENCE_ROUTES = frozenset({"/api/v2/ex/currencies", "/api/v2/ex/tradepairs"})
+
+# Every error the client raises is a ZebpayError; HTTP errors (HTTPStatusError) carry code and message.
+ZebpayAPIError = ZebpayError
+
+# Spot pairs are validated by the shared OrderValidator (orderTypes, tickSz, lotSz).
+SpotOrderValidator = OrderValidator
+
+def _timeout_class(method: str, route: str) -> str:
+    """Timeout class of a request: cancels, other writes, market data, reference data or account reads."""
+    if method == "DELETE":
+        return "cancel"
+    if method != "GET":
+        return "order"
+    if route.startswith("/api/v2/market") or route in ("/api/v2/status", "/api/v2/time"):
+        return "market_data"
+    return "reference" if route in REFERENCE_ROUTES else "account"
+
+# Numeric ticker fields stored as float64 columns in TickerSnapshot.
+TICKER_COLUMNS = ("last", "open", "high", "low", "close", "bid", "bidVolume", "ask", "askVolume", "change",
+                  "percentage", "average", "vwap", "baseVolume", "quoteVolume", "timestamp")
+
+class TickerSnapshot:
+    """Every pair's ticker from one get_all_tickers() response, as numpy columns indexed by symbol.
+
+    Lookups are O(1) dict hits; cross-symbol queries (movers, volume ranking, spread filters) are
+    vectorized over the columns. Missing or non-numeric fields are NaN. Requires numpy.
+    """
+
+    def __init__(self, response: Union[Dict, List[Dict]], fetched_at: Optional[float] = None):
+        if np is None:
+            raise ImportError("TickerSnapshot requires numpy: pip install numpy")
+        tickers = response.get("data", []) if isinstance(response, dict) else response
+        # The envelope (statusCode etc.) is reused for per-symbol responses served from the snapshot.
+        self._envelope = {k: v for k, v in response.items() if k != "data"} if isinstance(response, dict) else None
+        self.index: Dict[str, int] = {}
+        rows = []
+        for ticker in tickers or ():
+            symbol = str(ticker.get("symbol", "")).upper()
+            if symbol in self.index:
+                rows[self.index[symbol]] = ticker  # Later duplicates win.
+            else:
+                self.index[symbol] = len(rows)
+                rows.append(ticker)
+        self.rows = rows
+        self.symbols = np.array(list(self.index), dtype=object)
+        self.columns = {name: np.array([_to_float(row.get(name)) for row in rows], dtype=np.float64)
+                        for name in TICKER_COLUMNS}
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol.upper() in self.index
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was fetched."""
+        return time.time() - self.fetched_at
+
+    def get(self, symbol: str) -> Optional[Dict]:
+        """Ticker dict for a symbol, or None if it is not in the snapshot."""
+        row = self.index.get(symbol.upper())
+        return None if row is None else self.rows[row]
+
+    def response_for(self, symbol: str) -> Optional[Dict]:
+        """A get_ticker()-shaped response for a symbol, or None if it is not in the snapshot."""
+        ticker = self.get(symbol)
+        if ticker is None or self._envelope is None:
+            return ticker
+        return dict(self._envelope, data=ticker)
+
+    def column(self, name: str) -> "np.ndarray":
+        """A numeric column (see TICKER_COLUMNS), aligned with self.symbols."""
+        return self.columns[name]
+
+    def spread_bps(self) -> "np.ndarray":
+        """Bid/ask spread in basis points of the mid price, per symbol (NaN without both quotes)."""
+        bid, ask = self.columns["bid"], self.columns["ask"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spread = (ask - bid) / ((ask + bid) / 2) * 10_000
+        return np.where((bid > 0) & (ask > 0), spread, np.nan)
+
+    def _mask(self, quote: Optional[str], min_quote_volume: float) -> "np.ndarray":
+        mask = np.ones(len(self.rows), dtype=bool)
+        if quote:
+            suffix = "-" + quote.upper()
+            mask &= np.fromiter((symbol.endswith(suffix) for symbol in self.symbols), bool, len(self.rows))
+        if min_quote_volume:
+            mask &= np.nan_to_num(self.columns["quoteVolume"]) >= min_quote_volume
+        return mask
+
+    def _ranked(self, values: "np.ndarray", mask: "np.ndarray", n: int, descending: bool = True) -> List[Dict]:
+        candidates = np.flatnonzero(mask & ~np.isnan(values))
+        keys = -values[candidates] if descending else values[candidates]
+        if n < len(candidates):
+            # argpartition finds the top n in O(len); only those n are sorted.
+            candidates = candidates[np.argpartition(keys, n)[:n]]
+            keys = -values[candidates] if descending else values[candidates]
+        return [self.rows[i] for i in candidates[np.argsort(keys, kind="stable")]]
+
+    def top_movers(self, n: int = 10, direction: str = "both", quote: Optional[str] = None,
+                   min_quote_volume: float = 0.0) -> List[Dict]:
+        """Tickers with the largest 24h percentage change: "up", "down" or "both" (by absolute change)."""
+        change = self.columns["percentage"]
+        mask = self._mask(quote, min_quote_volume)
+        if direction == "up":
+            return self._ranked(change, mask & (change > 0), n)
+        if direction == "down":
+            return self._ranked(change, mask & (change < 0), n, descending=False)
+        if direction != "both":
+            raise ValueError("direction must be 'up', 'down' or 'both'")
+        return self._ranked(np.abs(change), mask, n)
+
+    def top_by_volume(self, n: int = 10, quote: Optional[str] = None, field: str = "quoteVolume") -> List[Dict]:
+        """Tickers with the highest 24h volume (quoteVolume by default, or baseVolume)."""
+        return self._ranked(self.columns[field], self._mask(quote, 0.0), n)
+
+    def filter_spread(self, max_bps: float, min_bps: float = 0.0, quote: Optional[str] = None,
+                      min_quote_volume: float = 0.0) -> List[str]:
+        """Symbols whose bid/ask spread is between min_bps and max_bps basis points."""
+        spread = self.spread_bps()
+        with np.errstate(invalid="ignore"):
+            mask = self._mask(quote, min_quote_volume) & (spread >= min_bps) & (spread <= max_bps)
+        return self.symbols[mask].tolist()
+
+    def where(self, mask: "np.ndarray") -> List[str]:
+        """Symbols selected by a boolean mask built from columns, e.g. snapshot.column("last") > 100."""
+        return self.symbols[mask].tolist()
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
 
 class SpotClient:
-    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.zebpay.com"):
+    def __init__(self, api_key: str, api_secret: str, base_url: str = "https://api.zebpay.com",
+                 rate_limiter: Optional[RateLimiter] = None, validator: Optional[OrderValidator] = None,
+                 metrics: Optional[Any] = None, tracer: Optional[Any] = None,
+                 circuit_breaker: Optional[Any] = None, transport: Optional[Transport] = None, timeout: float = 30.0,
+                 timeouts: Optional[Dict[str, float]] = None):
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.validator = validator
+        # Longest timeout of any request; requests use it unless `timeouts` gives their class one (opt-in).
+        self.timeout = timeout
+        self.timeouts = {name: min(seconds, timeout) for name, seconds in (timeouts or {}).items()}
+        # Optional circuit breaker, e.g. zebpay_core.circuit_breaker.CircuitBreaker.
+        self.circuit_breaker = circuit_breaker
+        # Shared request path, also used by FuturesApiClient; pass one to share connections, limiters and metrics.
+        self.transport = transport or Transport(tracer=tracer)
+        self.session = self.transport.session
+        self._auth_headers = {
             "X-API-KEY": api_key,
             "X-API-SECRET": api_secret
-        })
-
-    def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None) -> Any:
-        url = f"{self.base_url}{endpoint}"
-        try:
-            response = self.session.request(method, url, params=params, json=data)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 429:
-                # Rate limit hit, wait and retry
-                time.sleep(1)
-                return self._make_request(method, endpoint, params, data)
-            raise ZebpayAPIError(e.response.status_code, e.response.text)
-        except requests.exceptions.RequestException as e:
-            raise ZebpayAPIError(500, str(e))
+        }
+        self.rate_limiter = rate_limiter or self.transport.rate_limiter((base_url, api_key), **DEFAULT_RATE_LIMIT)
+        self.metrics = metrics or self.transport.metrics
+        self.tracer = tracer or self.transport.tracer
+        self._ticker_snapshot: Optional[TickerSnapshot] = None
+        self._ticker_snapshot_max_age: Optional[float] = None
+        self._ticker_snapshot_lock = threading.Lock()
+        self._submitter: Optional[OrderSubmitter] = None
+        self._submitter_lock = threading.Lock()
+
+    @staticmethod
+    def deadline(seconds: float) -> ContextManager[Optional[float]]:
+        """Bound every request this thread makes inside the block to finish within seconds.
+
+        Rate-limit queueing, 429 retries and the network call share the time; a request that cannot finish
+        in time raises DeadlineExceeded instead of being sent late. Nested deadlines can only shorten it.
+        """
+        return deadline(seconds)
+
+    def timeout_for(self, method: str, route: str) -> float:
+        """Timeout in seconds for a request: its class's entry in self.timeouts, else self.timeout."""
+        return self.timeouts.get(_timeout_class(method, route), self.timeout)
+
+    def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None,
+                      route: Optional[str] = None) -> Any:
+        # Metrics are keyed by route template so IDs in paths do not explode label cardinality.
+        route = route or endpoint
+        return self.transport.request(
+            method, f"{self.base_url}{endpoint}", route, params=params, json_body=data, headers=self._auth_headers,
+            timeout=self.timeout_for(method, route), rate_limiter=self.rate_limiter, metrics=self.metrics,
+            tracer=self.tracer, circuit_breaker=self.circuit_breaker, retry_rate_limited=True
+        )
+
+    def _run_batch(self, operation: Callable[[Any], Any], items: List[Any], max_workers: int) -> Dict:
+        """Run operation over items on a thread pool, collecting per-item results in input order.
+
+        Workers carry the caller's deadline, so items not sent before it passes fail with DeadlineExceeded.
+        """
+        expires = current_deadline()
+
+        def run_one(index: int, item: Any) -> Dict:
+            started = time.perf_counter()
+            response, error = None, None
+            try:
+                with deadline_at(expires):
+                    response = operation(item)
+            except Exception as e:
+                error = e
+            return {
+                "index": index,
+                "request": item,
+                "response": response,
+                "error": error,
+                "latencyMs": (time.perf_counter() - started) * 1000
+            }
+
+        batch_started = time.perf_counter()
+        results = []
+        if items:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+                results = list(executor.map(run_one, range(len(items)), items))
+        failed = sum(1 for result in results if result["error"] is not None)
+        return {
+            "results": results,
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "latencyMs": (time.perf_counter() - batch_started) * 1000
+        }
 
     # Market Data APIs
     def get_all_tickers(self) -> List[Dict]:
@@ -63,8 +286,40 @@ class SpotClient:
         return self._make_request("GET", "/api/v2/market/orderbook/ticker", params=params)
 
     def get_ticker(self, symbol: str) -> Dict:
-        """Get ticker information for a specific trading pair."""
-        return self._make_request("GET", f"/api/v2/market/ticker/{symbol}")
+        """Get ticker information for a specific trading pair.
+
+        With enable_ticker_snapshot(), served from the all-tickers snapshot while it is fresh.
+        """
+        if self._ticker_snapshot_max_age is not None:
+            response = self.get_ticker_snapshot(self._ticker_snapshot_max_age).response_for(symbol)
+            if response is not None:
+                return response
+        return self._make_request("GET", f"/api/v2/market/ticker/{symbol}", route="/api/v2/market/ticker/{symbol}")
+
+    def get_ticker_snapshot(self, max_age: float = 0.0) -> TickerSnapshot:
+        """Return a TickerSnapshot of every pair, reusing the cached one if younger than max_age seconds.
+
+        Concurrent callers that find the snapshot stale share a single get_all_tickers() request.
+        """
+        snapshot = self._ticker_snapshot
+        if snapshot is not None and snapshot.age < max_age:
+            return snapshot
+        with self._ticker_snapshot_lock:
+            snapshot = self._ticker_snapshot
+            if snapshot is None or snapshot.age >= max_age:
+                snapshot = self._ticker_snapshot = TickerSnapshot(self.get_all_tickers())
+        return snapshot
+
+    def enable_ticker_snapshot(self, max_age: float = 2.0) -> None:
+        """Serve get_ticker() from one all-tickers snapshot, refreshed when older than max_age seconds.
+
+        Symbols missing from the snapshot still go to the per-symbol endpoint.
+        """
+        self._ticker_snapshot_max_age = max_age
+
+    def disable_ticker_snapshot(self) -> None:
+        """Send every get_ticker() call to the per-symbol endpoint again."""
+        self._ticker_snapshot_max_age = None
 
     def get_recent_trades(self, symbol: str, limit: int = 200, page: int = 1) -> List[Dict]:
         """Get recent trades."""
@@ -92,7 +347,7 @@ class SpotClient:
     def get_exchange_fee(self, code: str, side: str) -> Dict:
         """Get maker and taker fee rates."""
         params = {"side": side}
-        return self._make_request("GET", f"/api/v2/ex/fee/{code}", params=params)
+        return self._make_request("GET", f"/api/v2/ex/fee/{code}", params=params, route="/api/v2/ex/fee/{code}")
 
     def get_orders(self, symbol: str, status: Optional[str] = None, current_page: int = 1, page_size: int = 20) -> Dict:
         """Get list of orders."""
@@ -109,6 +364,8 @@ class SpotClient:
                    quantity: Optional[str] = None, quote_order_qty: Optional[str] = None,
                    stop_price: Optional[str] = None, platform: Optional[str] = None) -> Dict:
         """Place a new order."""
+        if self.validator:
+            self.validator.validate(symbol, type, price, quantity)
         data = {
             "symbol": symbol,
             "side": side,
@@ -128,7 +385,46 @@ class SpotClient:
 
     def cancel_order(self, order_id: str) -> Dict:
         """Cancel a specific order."""
-        return self._make_request("DELETE", f"/api/v2/ex/orders/{order_id}")
+        return self._make_request("DELETE", f"/api/v2/ex/orders/{order_id}", route="/api/v2/ex/orders/{order_id}")
+
+    def create_orders(self, orders: List[Dict[str, Any]], max_workers: int = BATCH_MAX_WORKERS) -> Dict:
+        """Place several orders concurrently; each dict holds place_order keyword arguments."""
+        return self._run_batch(lambda order: self.place_order(**order), orders, max_workers)
+
+    def cancel_orders(self, order_ids: List[str], max_workers: int = BATCH_MAX_WORKERS) -> Dict:
+        """Cancel several orders concurrently by order ID."""
+        return self._run_batch(self.cancel_order, order_ids, max_workers)
+
+    @property
+    def submitter(self) -> OrderSubmitter:
+        """Worker pool behind submit(), submit_order() and submit_cancel(), started on first use."""
+        if self._submitter is None:
+            with self._submitter_lock:
+                if self._submitter is None:
+                    self._submitter = OrderSubmitter(BATCH_MAX_WORKERS, name="zebpay-spot-submit")
+        return self._submitter
+
+    def submit(self, operation: Callable[..., Any], *args: Any, key: Optional[str] = None,
+               callback: Optional[Callable[[Future], Any]] = None, **kwargs: Any) -> Future:
+        """Run a client call on the submission pool and return its Future without waiting.
+
+        Calls with the same key complete in submission order. The caller's deadline travels with the call.
+        """
+        return self.submitter.submit(operation, *args, key=key, callback=callback, **kwargs)
+
+    def submit_order(self, symbol: str, side: str, type: str, price: Optional[str] = None,
+                     quantity: Optional[str] = None, quote_order_qty: Optional[str] = None,
+                     stop_price: Optional[str] = None, platform: Optional[str] = None,
+                     callback: Optional[Callable[[Future], Any]] = None) -> Future:
+        """Place an order without waiting; orders and cancels for one symbol are sent in submission order."""
+        return self.submit(self.place_order, symbol, side, type, price=price, quantity=quantity,
+                           quote_order_qty=quote_order_qty, stop_price=stop_price, platform=platform,
+                           key=symbol, callback=callback)
+
+    def submit_cancel(self, order_id: str, symbol: Optional[str] = None,
+                      callback: Optional[Callable[[Future], Any]] = None) -> Future:
+        """Cancel an order without waiting; give its symbol to send the cancel after orders queued for it."""
+        return self.submit(self.cancel_order, order_id, key=symbol, callback=callback)
 
     def cancel_all_orders(self, symbol: str) -> Dict:
         """Cancel all orders for a specific trading pair."""
@@ -137,11 +433,12 @@ class SpotClient:
 
     def get_order_details(self, order_id: str) -> Dict:
         """Get details of a specific order."""
-        return self._make_request("GET", f"/api/v2/ex/orders/{order_id}")
+        return self._make_request("GET", f"/api/v2/ex/orders/{order_id}", route="/api/v2/ex/orders/{order_id}")
 
     def get_order_fills(self, order_id: str) -> List[Dict]:
         """Get fills for a specific order."""
-        return self._make_request("GET", f"/api/v2/ex/orders/fills/{order_id}")
+        return self._make_request("GET", f"/api/v2/ex/orders/fills/{order_id}",
+                                  route="/api/v2/ex/orders/fills/{order_id}")
 
     def get_trading_pairs(self) -> Dict:
         """Get list of available trading pairs."""